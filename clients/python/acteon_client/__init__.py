@@ -1,6 +1,7 @@
 """Acteon Python Client - HTTP client for the Acteon action gateway."""
 
-from .client import ActeonClient, AsyncActeonClient
+from typing import TYPE_CHECKING, Any
+
 from .errors import (
     ActeonError,
     ConnectionError,
@@ -10,7 +11,6 @@ from .errors import (
     NonRetryableError,
 )
 from .queues import WorkerTask
-from .worker import WORKFLOW_ACTION_TYPE, Worker
 from .workflows import (
     ExecutionHistory,
     WorkflowCheckpoint,
@@ -76,6 +76,7 @@ from .models import (
     FlushGroupResponse,
     ApprovalActionResponse,
     ApprovalStatus,
+    ApprovalLookup,
     ApprovalListResponse,
     WebhookPayload,
     create_webhook_action,
@@ -119,6 +120,7 @@ from .models import (
     DlqStatsResponse,
     DlqEntry,
     DlqDrainResponse,
+    TenantSnapshot,
     SseEvent,
     WasmPluginConfig,
     WasmPlugin,
@@ -147,10 +149,48 @@ from .a2a import (
     make_push_config,
 )
 
+if TYPE_CHECKING:
+    from .client import ActeonClient, AsyncActeonClient
+    from .coalesce import AsyncDispatchCoalescer, DispatchCoalescer
+    from .transport import AsyncRetryTransport, RetryTransport
+    from .worker import WORKFLOW_ACTION_TYPE, Worker
+
+# The HTTP clients pull in httpx (and through it ssl/asyncio), and the
+# coalescers and worker pull in asyncio and thread pools; load them on
+# first access (PEP 562) so model-only consumers don't pay for that.
+_LAZY = {
+    "ActeonClient": "client",
+    "AsyncActeonClient": "client",
+    "RetryTransport": "transport",
+    "AsyncRetryTransport": "transport",
+    "DispatchCoalescer": "coalesce",
+    "AsyncDispatchCoalescer": "coalesce",
+    "Worker": "worker",
+    "WORKFLOW_ACTION_TYPE": "worker",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY))
+
+
 __version__ = "0.1.0"
 __all__ = [
     "ActeonClient",
     "AsyncActeonClient",
+    "RetryTransport",
+    "AsyncRetryTransport",
     "A2A_PROTOCOL_VERSION",
     "make_message",
     "make_part_data",
@@ -163,6 +203,9 @@ __all__ = [
     "HttpError",
     "RetryableError",
     "NonRetryableError",
+    # Dispatch coalescing
+    "DispatchCoalescer",
+    "AsyncDispatchCoalescer",
     # Task queues + worker
     "WorkerTask",
     "Worker",
@@ -196,6 +239,7 @@ __all__ = [
     "FlushGroupResponse",
     "ApprovalActionResponse",
     "ApprovalStatus",
+    "ApprovalLookup",
     "ApprovalListResponse",
     "WebhookPayload",
     "create_webhook_action",
@@ -239,6 +283,7 @@ __all__ = [
     "DlqStatsResponse",
     "DlqEntry",
     "DlqDrainResponse",
+    "TenantSnapshot",
     "SseEvent",
     "WasmPluginConfig",
     "WasmPlugin",
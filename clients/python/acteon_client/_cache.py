@@ -0,0 +1,138 @@
+"""Opt-in response cache for the clients' idempotent lookups.
+
+Enabled per client with ``cache_ttl=<seconds>``. Parsed results of
+``list_rules``, ``get_quota``, ``get_chain``, ``get_event``, ``get_group``
+and ``get_audit_record`` are kept for ``cache_ttl`` seconds (least recently
+used entries are evicted beyond ``cache_maxsize``), so polling loops
+that re-read the same entity skip the round trip and the parse. The
+client's own mutations of an entity (``update_quota``,
+``cancel_chain``, ``transition_event``, ...) drop its cached entries both
+before the request and once the response is in, so a lookup that ran
+while the mutation was in flight cannot leave the old state behind;
+changes made elsewhere show up once the entry expires. Changing the
+client's ``api_key`` drops everything, since results fetched under one
+principal must not be served to another.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any, Callable, Optional, TypeVar
+
+_T = TypeVar("_T")
+
+# ``(kind, ident, *qualifiers)``, e.g. ``("chain", chain_id, namespace, tenant)``.
+_Key = tuple[str, ...]
+
+
+class _TTLCache:
+    """Thread-safe LRU mapping whose entries expire ``ttl`` seconds after insert."""
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if maxsize < 1:
+            raise ValueError("cache maxsize must be at least 1")
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._clock = clock
+        self._data: OrderedDict[_Key, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        # Bumped by every discard/clear. A lookup records it before its
+        # request and passes it to set(), which then refuses to store a
+        # result that raced with an invalidation.
+        self._generation = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: _Key) -> Optional[Any]:
+        """Return the live value for ``key``, or ``None``."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires, value = entry
+            if expires <= self._clock():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def set(self, key: _Key, value: Any, generation: Optional[int] = None) -> None:
+        """Store ``value``, unless ``generation`` predates an invalidation."""
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            self._data[key] = (self._clock() + self._ttl, value)
+            self._data.move_to_end(key)
+            if len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+
+    def discard(self, kind: str, ident: str) -> None:
+        """Drop every entry for entity ``ident`` of ``kind``.
+
+        Keys are tuples starting ``(kind, ident, ...)``; any trailing parts
+        (namespace, tenant) are ignored so all variants go.
+        """
+        with self._lock:
+            self._generation += 1
+            stale = [k for k in self._data if k[0] == kind and k[1] == ident]
+            for key in stale:
+                del self._data[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._data.clear()
+
+
+class _CachedLookupsMixin:
+    """Cache plumbing shared by ``ActeonClient`` and ``AsyncActeonClient``."""
+
+    _get_cache: Optional[_TTLCache]
+
+    def _cache_get(self, key: _Key) -> Optional[Any]:
+        cache = self._get_cache
+        return cache.get(key) if cache is not None else None
+
+    def _cache_generation(self) -> int:
+        """Token to pass to :meth:`_cache_put` for a lookup starting now."""
+        cache = self._get_cache
+        return cache.generation if cache is not None else 0
+
+    def _cache_put(self, key: _Key, value: _T, generation: int) -> _T:
+        if self._get_cache is not None:
+            self._get_cache.set(key, value, generation)
+        return value
+
+    def _cache_discard(self, kind: str, ident: str) -> None:
+        if self._get_cache is not None:
+            self._get_cache.discard(kind, ident)
+
+    @contextmanager
+    def _invalidating(self, kind: str, ident: str) -> Iterator[None]:
+        """Wrap a mutation of entity ``ident``: drop its entries before the
+        request and again once the response (or error) is in, so a lookup
+        racing the mutation cannot re-cache the old state."""
+        self._cache_discard(kind, ident)
+        try:
+            yield
+        finally:
+            self._cache_discard(kind, ident)
+
+    def cache_clear(self) -> None:
+        """Drop every cached lookup result (no-op when caching is off)."""
+        if self._get_cache is not None:
+            self._get_cache.clear()
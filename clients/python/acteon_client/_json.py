@@ -0,0 +1,92 @@
+"""JSON encode/decode used on the client's hot paths.
+
+Uses ``orjson`` on CPython when it is installed (``pip install
+acteon-client[fast]``) and falls back to the standard library otherwise.
+Both backends produce compact, non-ASCII-escaped UTF-8 bytes — the same
+shape ``httpx`` sends for ``json=`` bodies.
+
+The orjson path is made to accept and reject what the stdlib encoder
+does: ``NaN``/``Infinity`` raise ``ValueError`` instead of becoming
+``null``; ``datetime``/``date``/``time`` and dataclass instances raise
+``TypeError`` instead of being serialized; integers wider than 64 bits
+are encoded instead of raising. The one remaining difference is that
+orjson still encodes ``uuid.UUID`` and plain ``enum.Enum`` members, which
+the stdlib rejects.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import sys
+from typing import Any, Union
+
+# orjson is a CPython extension; on PyPy the JIT-compiled stdlib ``json``
+# is the faster choice, so don't even try.
+if sys.implementation.name != "pypy":
+    try:
+        import orjson
+    except ImportError:  # pragma: no cover - exercised when orjson is absent
+        orjson = None  # type: ignore[assignment]
+else:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+__all__ = ["BACKEND", "dumps", "loads"]
+
+_encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"), allow_nan=False)
+
+
+def _stdlib_dumps(obj: Any) -> bytes:
+    return _encoder.encode(obj).encode("utf-8")
+
+
+def _has_non_finite(obj: Any) -> bool:
+    """Whether ``obj`` holds a float that orjson would write as ``null``."""
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(_has_non_finite(v) for v in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(_has_non_finite(v) for v in obj)
+    return False
+
+
+if orjson is not None:
+    BACKEND = "orjson"
+    # Types the stdlib rejects are passed through to orjson's (absent)
+    # ``default`` hook, so they fail and land in the stdlib fallback below.
+    _OPTIONS = (
+        orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+
+    def dumps(obj: Any) -> bytes:
+        """Serialize ``obj`` to compact UTF-8 JSON bytes."""
+        try:
+            data = orjson.dumps(obj, option=_OPTIONS)
+        except orjson.JSONEncodeError:
+            # Out-of-range ints, passthrough types, ...: the stdlib encoder
+            # either handles them or raises its own error.
+            return _stdlib_dumps(obj)
+        # orjson writes NaN/Infinity as null; only look when a null is there.
+        if b"null" in data and _has_non_finite(obj):
+            raise ValueError("Out of range float values are not JSON compliant")
+        return data
+
+    def loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+        """Deserialize a JSON document from bytes or str."""
+        return orjson.loads(data)
+
+else:
+    BACKEND = "json"
+
+    def dumps(obj: Any) -> bytes:
+        """Serialize ``obj`` to compact UTF-8 JSON bytes."""
+        return _stdlib_dumps(obj)
+
+    def loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+        """Deserialize a JSON document from bytes or str."""
+        if isinstance(data, memoryview):
+            data = bytes(data)
+        return json.loads(data)
@@ -0,0 +1,20 @@
+"""URL path helpers shared by the client and its sub-clients."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from urllib.parse import quote
+
+__all__ = ["seg"]
+
+
+@lru_cache(maxsize=4096)
+def seg(value: str) -> str:
+    """Percent-encode one path segment, ``/`` included.
+
+    Path slots (tenant, namespace, ids, names) are opaque strings, so a
+    value containing a slash is escaped rather than split into extra
+    path components — the same encoding the Rust client uses. Polling
+    loops re-encode the same ids over and over, hence the cache.
+    """
+    return quote(value, safe="")
@@ -23,8 +23,9 @@ API-key header — the A2A spec requires it to be unauthenticated.
 from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, Optional
-from urllib.parse import quote
 
+from . import _json
+from ._paths import seg as _seg
 from .errors import ApiError, HttpError
 
 if TYPE_CHECKING:
@@ -42,16 +43,6 @@ _A2A_VERSION_HEADER = "A2A-Version"
 _A2A_HEADERS = {_A2A_VERSION_HEADER: A2A_PROTOCOL_VERSION}
 
 
-def _seg(s: str) -> str:
-    """Percent-encode a path segment opaquely (no ``/`` passthrough).
-
-    Mirrors ``_seg`` in ``bus.py``: a tenant or task id that happens
-    to contain a slash must be escaped, not silently split into
-    additional path components.
-    """
-    return quote(s, safe="")
-
-
 def _raise_for_status(resp: "httpx.Response") -> None:
     """Translate a non-2xx response into either ``ApiError`` (with the
     server's structured error envelope) or ``HttpError`` (raw body).
@@ -63,7 +54,7 @@ def _raise_for_status(resp: "httpx.Response") -> None:
     if 200 <= resp.status_code < 300:
         return
     try:
-        data = resp.json()
+        data = _json.loads(resp.content)
         message = (
             data.get("error")
             or data.get("message")
@@ -205,7 +196,7 @@ class _A2AClientMixin:
             extra_headers=_A2A_HEADERS,
         )
         _raise_for_status(resp)
-        return resp.json()
+        return _json.loads(resp.content)
 
     def a2a_get_task(
         self,
@@ -223,7 +214,7 @@ class _A2AClientMixin:
             extra_headers=_A2A_HEADERS,
         )
         _raise_for_status(resp)
-        return resp.json()
+        return _json.loads(resp.content)
 
     def a2a_cancel_task(
         self,
@@ -243,7 +234,7 @@ class _A2AClientMixin:
             extra_headers=_A2A_HEADERS,
         )
         _raise_for_status(resp)
-        return resp.json()
+        return _json.loads(resp.content)
 
     # ---- Push-notification configs ----
 
@@ -267,7 +258,7 @@ class _A2AClientMixin:
             extra_headers=_A2A_HEADERS,
         )
         _raise_for_status(resp)
-        return resp.json()
+        return _json.loads(resp.content)
 
     def a2a_list_push_configs(
         self,
@@ -285,7 +276,7 @@ class _A2AClientMixin:
             extra_headers=_A2A_HEADERS,
         )
         _raise_for_status(resp)
-        return resp.json()
+        return _json.loads(resp.content)
 
     def a2a_get_push_config(
         self,
@@ -304,7 +295,7 @@ class _A2AClientMixin:
             extra_headers=_A2A_HEADERS,
         )
         _raise_for_status(resp)
-        return resp.json()
+        return _json.loads(resp.content)
 
     def a2a_delete_push_config(
         self,
@@ -346,7 +337,7 @@ class _A2AClientMixin:
             skip_auth=True,
         )
         _raise_for_status(resp)
-        return resp.json()
+        return _json.loads(resp.content)
 
     def a2a_get_authenticated_extended_card(
         self,
@@ -373,7 +364,7 @@ class _A2AClientMixin:
             extra_headers=_A2A_HEADERS,
         )
         _raise_for_status(resp)
-        return _unwrap_jsonrpc(resp.json())
+        return _unwrap_jsonrpc(_json.loads(resp.content))
 
 
 # ---------------------------------------------------------------------
@@ -410,7 +401,7 @@ class _AsyncA2AClientMixin:
             extra_headers=_A2A_HEADERS,
         )
         _raise_for_status(resp)
-        return resp.json()
+        return _json.loads(resp.content)
 
     async def a2a_get_task(
         self,
@@ -425,7 +416,7 @@ class _AsyncA2AClientMixin:
             extra_headers=_A2A_HEADERS,
         )
         _raise_for_status(resp)
-        return resp.json()
+        return _json.loads(resp.content)
 
     async def a2a_cancel_task(
         self,
@@ -440,7 +431,7 @@ class _AsyncA2AClientMixin:
             extra_headers=_A2A_HEADERS,
         )
         _raise_for_status(resp)
-        return resp.json()
+        return _json.loads(resp.content)
 
     async def a2a_set_push_config(
         self,
@@ -458,7 +449,7 @@ class _AsyncA2AClientMixin:
             extra_headers=_A2A_HEADERS,
         )
         _raise_for_status(resp)
-        return resp.json()
+        return _json.loads(resp.content)
 
     async def a2a_list_push_configs(
         self,
@@ -474,7 +465,7 @@ class _AsyncA2AClientMixin:
             extra_headers=_A2A_HEADERS,
         )
         _raise_for_status(resp)
-        return resp.json()
+        return _json.loads(resp.content)
 
     async def a2a_get_push_config(
         self,
@@ -491,7 +482,7 @@ class _AsyncA2AClientMixin:
             extra_headers=_A2A_HEADERS,
         )
         _raise_for_status(resp)
-        return resp.json()
+        return _json.loads(resp.content)
 
     async def a2a_delete_push_config(
         self,
@@ -521,7 +512,7 @@ class _AsyncA2AClientMixin:
             skip_auth=True,
         )
         _raise_for_status(resp)
-        return resp.json()
+        return _json.loads(resp.content)
 
     async def a2a_get_authenticated_extended_card(
         self,
@@ -543,7 +534,7 @@ class _AsyncA2AClientMixin:
             extra_headers=_A2A_HEADERS,
         )
         _raise_for_status(resp)
-        return _unwrap_jsonrpc(resp.json())
+        return _unwrap_jsonrpc(_json.loads(resp.content))
 
 
 # ---------------------------------------------------------------------
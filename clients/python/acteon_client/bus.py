@@ -17,7 +17,6 @@ import asyncio
 import json
 import time
 from typing import TYPE_CHECKING, Any, AsyncIterator, Iterator, Optional
-from urllib.parse import quote
 
 from .bus_models import (
     AppendBusConversationMessage,
@@ -57,28 +56,20 @@ from .bus_models import (
     StreamChunkEnvelope,
     StreamEndEnvelope,
 )
+from . import _json
+from ._paths import seg as _seg
 from .errors import ApiError, HttpError
 
 if TYPE_CHECKING:
     import httpx
 
 
-def _seg(s: str) -> str:
-    """Percent-encode a path segment exactly as the Rust client
-    does — the bus REST surface treats the namespace / tenant /
-    name path slots as opaque strings, so reserved characters
-    like ``/`` need escaping rather than being silently passed
-    through.
-    """
-    return quote(s, safe="")
-
-
 def _raise_for_status(resp: "httpx.Response") -> None:
     if resp.status_code < 200 or resp.status_code >= 300:
         # Try to surface an Acteon-shaped error body; fall back to a
         # plain HttpError if the body isn't structured.
         try:
-            data = resp.json()
+            data = _json.loads(resp.content)
             raise ApiError(
                 code=data.get("code", "BUS"),
                 message=data.get("error") or data.get("message") or "bus error",
@@ -104,8 +95,6 @@ class _BusClientMixin:
             params: Optional[dict] = None,
         ) -> "httpx.Response": ...
 
-        def _headers(self) -> dict[str, str]: ...
-
         _client: "httpx.Client"
         base_url: str
 
@@ -114,7 +103,7 @@ class _BusClientMixin:
     def create_bus_topic(self, req: CreateBusTopic) -> BusTopic:
         resp = self._request("POST", "/v1/bus/topics", json=req.to_dict())
         _raise_for_status(resp)
-        return BusTopic.from_dict(resp.json())
+        return BusTopic.from_dict(_json.loads(resp.content))
 
     def list_bus_topics(
         self,
@@ -129,7 +118,7 @@ class _BusClientMixin:
             params["tenant"] = tenant
         resp = self._request("GET", "/v1/bus/topics", params=params or None)
         _raise_for_status(resp)
-        return [BusTopic.from_dict(t) for t in resp.json().get("topics", [])]
+        return [BusTopic.from_dict(t) for t in _json.loads(resp.content).get("topics", [])]
 
     def get_bus_topic(self, namespace: str, tenant: str, name: str) -> BusTopic:
         resp = self._request(
@@ -137,7 +126,7 @@ class _BusClientMixin:
             f"/v1/bus/topics/{_seg(namespace)}/{_seg(tenant)}/{_seg(name)}",
         )
         _raise_for_status(resp)
-        return BusTopic.from_dict(resp.json())
+        return BusTopic.from_dict(_json.loads(resp.content))
 
     def delete_bus_topic(self, namespace: str, tenant: str, name: str) -> None:
         resp = self._request(
@@ -149,14 +138,14 @@ class _BusClientMixin:
     def publish_bus_message(self, req: PublishBusMessage) -> PublishReceipt:
         resp = self._request("POST", "/v1/bus/publish", json=req.to_dict())
         _raise_for_status(resp)
-        return PublishReceipt.from_dict(resp.json())
+        return PublishReceipt.from_dict(_json.loads(resp.content))
 
     # --------------- Phase 2: Subscriptions + lag ---------------
 
     def create_bus_subscription(self, req: CreateBusSubscription) -> BusSubscription:
         resp = self._request("POST", "/v1/bus/subscriptions", json=req.to_dict())
         _raise_for_status(resp)
-        return BusSubscription.from_dict(resp.json())
+        return BusSubscription.from_dict(_json.loads(resp.content))
 
     def list_bus_subscriptions(
         self,
@@ -174,7 +163,8 @@ class _BusClientMixin:
             params["topic"] = topic
         resp = self._request("GET", "/v1/bus/subscriptions", params=params or None)
         _raise_for_status(resp)
-        return [BusSubscription.from_dict(s) for s in resp.json().get("subscriptions", [])]
+        data = _json.loads(resp.content)
+        return [BusSubscription.from_dict(s) for s in data.get("subscriptions", [])]
 
     def get_bus_subscription(
         self, namespace: str, tenant: str, sub_id: str
@@ -184,7 +174,7 @@ class _BusClientMixin:
             f"/v1/bus/subscriptions/{_seg(namespace)}/{_seg(tenant)}/{_seg(sub_id)}",
         )
         _raise_for_status(resp)
-        return BusSubscription.from_dict(resp.json())
+        return BusSubscription.from_dict(_json.loads(resp.content))
 
     def delete_bus_subscription(self, namespace: str, tenant: str, sub_id: str) -> None:
         resp = self._request(
@@ -201,14 +191,14 @@ class _BusClientMixin:
             f"/v1/bus/subscriptions/{_seg(namespace)}/{_seg(tenant)}/{_seg(sub_id)}/lag",
         )
         _raise_for_status(resp)
-        return BusLag.from_dict(resp.json())
+        return BusLag.from_dict(_json.loads(resp.content))
 
     # --------------- Phase 3: Schemas ---------------
 
     def register_bus_schema(self, req: RegisterBusSchema) -> BusSchema:
         resp = self._request("POST", "/v1/bus/schemas", json=req.to_dict())
         _raise_for_status(resp)
-        return BusSchema.from_dict(resp.json())
+        return BusSchema.from_dict(_json.loads(resp.content))
 
     def list_bus_schemas(
         self,
@@ -229,7 +219,7 @@ class _BusClientMixin:
             params["latest_only"] = "true"
         resp = self._request("GET", "/v1/bus/schemas", params=params or None)
         _raise_for_status(resp)
-        return [BusSchema.from_dict(s) for s in resp.json().get("schemas", [])]
+        return [BusSchema.from_dict(s) for s in _json.loads(resp.content).get("schemas", [])]
 
     def get_bus_schema(
         self, namespace: str, tenant: str, subject: str, version: int,
@@ -239,7 +229,7 @@ class _BusClientMixin:
             f"/v1/bus/schemas/{_seg(namespace)}/{_seg(tenant)}/{_seg(subject)}/{version}",
         )
         _raise_for_status(resp)
-        return BusSchema.from_dict(resp.json())
+        return BusSchema.from_dict(_json.loads(resp.content))
 
     def delete_bus_schema(
         self, namespace: str, tenant: str, subject: str, version: int,
@@ -255,7 +245,7 @@ class _BusClientMixin:
     def register_bus_agent(self, req: RegisterBusAgent) -> BusAgent:
         resp = self._request("POST", "/v1/bus/agents", json=req.to_dict())
         _raise_for_status(resp)
-        return BusAgent.from_dict(resp.json())
+        return BusAgent.from_dict(_json.loads(resp.content))
 
     def list_bus_agents(
         self,
@@ -270,7 +260,7 @@ class _BusClientMixin:
             params["tenant"] = tenant
         resp = self._request("GET", "/v1/bus/agents", params=params or None)
         _raise_for_status(resp)
-        return [BusAgent.from_dict(a) for a in resp.json().get("agents", [])]
+        return [BusAgent.from_dict(a) for a in _json.loads(resp.content).get("agents", [])]
 
     def get_bus_agent(self, namespace: str, tenant: str, agent_id: str) -> BusAgent:
         resp = self._request(
@@ -278,7 +268,7 @@ class _BusClientMixin:
             f"/v1/bus/agents/{_seg(namespace)}/{_seg(tenant)}/{_seg(agent_id)}",
         )
         _raise_for_status(resp)
-        return BusAgent.from_dict(resp.json())
+        return BusAgent.from_dict(_json.loads(resp.content))
 
     def delete_bus_agent(self, namespace: str, tenant: str, agent_id: str) -> None:
         resp = self._request(
@@ -295,7 +285,7 @@ class _BusClientMixin:
             f"/v1/bus/agents/{_seg(namespace)}/{_seg(tenant)}/{_seg(agent_id)}/heartbeat",
         )
         _raise_for_status(resp)
-        return BusAgent.from_dict(resp.json())
+        return BusAgent.from_dict(_json.loads(resp.content))
 
     def set_bus_agent_admin_state(
         self,
@@ -316,14 +306,14 @@ class _BusClientMixin:
             json=req.to_dict(),
         )
         _raise_for_status(resp)
-        return BusAgent.from_dict(resp.json())
+        return BusAgent.from_dict(_json.loads(resp.content))
 
     # --------------- Phase 5: Conversations ---------------
 
     def create_bus_conversation(self, req: CreateBusConversation) -> BusConversation:
         resp = self._request("POST", "/v1/bus/conversations", json=req.to_dict())
         _raise_for_status(resp)
-        return BusConversation.from_dict(resp.json())
+        return BusConversation.from_dict(_json.loads(resp.content))
 
     def list_bus_conversations(
         self,
@@ -344,7 +334,8 @@ class _BusClientMixin:
             params["participant"] = participant
         resp = self._request("GET", "/v1/bus/conversations", params=params or None)
         _raise_for_status(resp)
-        return [BusConversation.from_dict(c) for c in resp.json().get("conversations", [])]
+        data = _json.loads(resp.content)
+        return [BusConversation.from_dict(c) for c in data.get("conversations", [])]
 
     def get_bus_conversation(
         self, namespace: str, tenant: str, conversation_id: str,
@@ -354,7 +345,7 @@ class _BusClientMixin:
             f"/v1/bus/conversations/{_seg(namespace)}/{_seg(tenant)}/{_seg(conversation_id)}",
         )
         _raise_for_status(resp)
-        return BusConversation.from_dict(resp.json())
+        return BusConversation.from_dict(_json.loads(resp.content))
 
     def delete_bus_conversation(
         self, namespace: str, tenant: str, conversation_id: str,
@@ -379,7 +370,7 @@ class _BusClientMixin:
             json={"target_state": target_state},
         )
         _raise_for_status(resp)
-        return BusConversation.from_dict(resp.json())
+        return BusConversation.from_dict(_json.loads(resp.content))
 
     def append_bus_conversation_message(
         self,
@@ -394,7 +385,7 @@ class _BusClientMixin:
             json=req.to_dict(),
         )
         _raise_for_status(resp)
-        return resp.json()
+        return _json.loads(resp.content)
 
     def replay_bus_conversation_messages(
         self,
@@ -416,7 +407,7 @@ class _BusClientMixin:
             params=params or None,
         )
         _raise_for_status(resp)
-        return BusReplayResponse.from_dict(resp.json())
+        return BusReplayResponse.from_dict(_json.loads(resp.content))
 
     # --------------- Phase 6a: Tool envelopes ---------------
 
@@ -441,7 +432,7 @@ class _BusClientMixin:
             json=req.to_dict(),
         )
         _raise_for_status(resp)
-        body = resp.json()
+        body = _json.loads(resp.content)
         if resp.status_code == 202:
             return PostBusToolCallOutcome(
                 parked=BusApprovalParkedReceipt.from_dict(body),
@@ -463,7 +454,7 @@ class _BusClientMixin:
             json=req.to_dict(),
         )
         _raise_for_status(resp)
-        return BusToolEnvelopeReceipt.from_dict(resp.json())
+        return BusToolEnvelopeReceipt.from_dict(_json.loads(resp.content))
 
     def lookup_bus_tool_result(
         self,
@@ -478,7 +469,7 @@ class _BusClientMixin:
             params=params.to_query(),
         )
         _raise_for_status(resp)
-        return BusToolResultLookup.from_dict(resp.json())
+        return BusToolResultLookup.from_dict(_json.loads(resp.content))
 
     # --------------- Phase 6b: Stream envelopes ---------------
 
@@ -495,7 +486,7 @@ class _BusClientMixin:
             json=req.to_dict(),
         )
         _raise_for_status(resp)
-        return BusStreamEnvelopeReceipt.from_dict(resp.json())
+        return BusStreamEnvelopeReceipt.from_dict(_json.loads(resp.content))
 
     def post_bus_stream_end(
         self,
@@ -510,7 +501,7 @@ class _BusClientMixin:
             json=req.to_dict(),
         )
         _raise_for_status(resp)
-        return BusStreamEnvelopeReceipt.from_dict(resp.json())
+        return BusStreamEnvelopeReceipt.from_dict(_json.loads(resp.content))
 
     def bus_stream_consume_url(
         self,
@@ -567,8 +558,8 @@ class _BusClientMixin:
             params: dict[str, Any] = {"topic": topic}
             if from_offset is not None:
                 params["from"] = from_offset
-            url = f"{self.base_url}/v1/bus/subscribe/{_seg(subscription_id)}"
-            for env in _open_bus_sse_stream(self._client, url, params, self._headers()):
+            url = f"/v1/bus/subscribe/{_seg(subscription_id)}"
+            for env in _open_bus_sse_stream(self._client, url, params):
                 yield _envelope_to_consume_item(env)
             return
 
@@ -579,14 +570,12 @@ class _BusClientMixin:
         if from_offset is not None:
             first_params["from"] = from_offset
         resume_params: dict[str, Any] = {"topic": topic, "from": "latest"}
-        url = f"{self.base_url}/v1/bus/subscribe/{_seg(subscription_id)}"
+        url = f"/v1/bus/subscribe/{_seg(subscription_id)}"
         attempt = 0
         params_for_open = first_params
         while True:
             try:
-                for env in _open_bus_sse_stream(
-                    self._client, url, params_for_open, self._headers()
-                ):
+                for env in _open_bus_sse_stream(self._client, url, params_for_open):
                     attempt = 0
                     yield _envelope_to_consume_item(env)
             except (ConnectionError, HttpError):
@@ -623,7 +612,7 @@ class _BusClientMixin:
             :class:`BusStreamItem` per chunk plus the terminal end marker.
         """
         url = self.bus_stream_consume_url(namespace, tenant, conversation_id, stream_id)
-        for env in _open_bus_sse_stream(self._client, url, None, self._headers()):
+        for env in _open_bus_sse_stream(self._client, url, None):
             item = _envelope_to_stream_item(env)
             yield item
             if item.is_end:
@@ -650,7 +639,8 @@ class _BusClientMixin:
             params=params or None,
         )
         _raise_for_status(resp)
-        return [BusApprovalView.from_dict(a) for a in resp.json().get("approvals", [])]
+        data = _json.loads(resp.content)
+        return [BusApprovalView.from_dict(a) for a in data.get("approvals", [])]
 
     def get_bus_approval(
         self, namespace: str, tenant: str, approval_id: str,
@@ -660,7 +650,7 @@ class _BusClientMixin:
             f"/v1/bus/approvals/{_seg(namespace)}/{_seg(tenant)}/{_seg(approval_id)}",
         )
         _raise_for_status(resp)
-        return BusApprovalView.from_dict(resp.json())
+        return BusApprovalView.from_dict(_json.loads(resp.content))
 
     def approve_bus_approval(
         self,
@@ -675,7 +665,7 @@ class _BusClientMixin:
             json=decision.to_dict(),
         )
         _raise_for_status(resp)
-        return BusApprovalDecisionResponse.from_dict(resp.json())
+        return BusApprovalDecisionResponse.from_dict(_json.loads(resp.content))
 
     def reject_bus_approval(
         self,
@@ -690,7 +680,7 @@ class _BusClientMixin:
             json=decision.to_dict(),
         )
         _raise_for_status(resp)
-        return BusApprovalDecisionResponse.from_dict(resp.json())
+        return BusApprovalDecisionResponse.from_dict(_json.loads(resp.content))
 
 
 # ============================================================================
@@ -720,8 +710,6 @@ class _AsyncBusClientMixin:
             params: Optional[dict] = None,
         ) -> "httpx.Response": ...
 
-        def _headers(self) -> dict[str, str]: ...
-
         _client: "httpx.AsyncClient"
         base_url: str
 
@@ -730,7 +718,7 @@ class _AsyncBusClientMixin:
     async def create_bus_topic(self, req: CreateBusTopic) -> BusTopic:
         resp = await self._request("POST", "/v1/bus/topics", json=req.to_dict())
         _raise_for_status(resp)
-        return BusTopic.from_dict(resp.json())
+        return BusTopic.from_dict(_json.loads(resp.content))
 
     async def list_bus_topics(
         self,
@@ -745,7 +733,7 @@ class _AsyncBusClientMixin:
             params["tenant"] = tenant
         resp = await self._request("GET", "/v1/bus/topics", params=params or None)
         _raise_for_status(resp)
-        return [BusTopic.from_dict(t) for t in resp.json().get("topics", [])]
+        return [BusTopic.from_dict(t) for t in _json.loads(resp.content).get("topics", [])]
 
     async def get_bus_topic(self, namespace: str, tenant: str, name: str) -> BusTopic:
         resp = await self._request(
@@ -753,7 +741,7 @@ class _AsyncBusClientMixin:
             f"/v1/bus/topics/{_seg(namespace)}/{_seg(tenant)}/{_seg(name)}",
         )
         _raise_for_status(resp)
-        return BusTopic.from_dict(resp.json())
+        return BusTopic.from_dict(_json.loads(resp.content))
 
     async def delete_bus_topic(self, namespace: str, tenant: str, name: str) -> None:
         resp = await self._request(
@@ -765,14 +753,14 @@ class _AsyncBusClientMixin:
     async def publish_bus_message(self, req: PublishBusMessage) -> PublishReceipt:
         resp = await self._request("POST", "/v1/bus/publish", json=req.to_dict())
         _raise_for_status(resp)
-        return PublishReceipt.from_dict(resp.json())
+        return PublishReceipt.from_dict(_json.loads(resp.content))
 
     # --------------- Phase 2: Subscriptions + lag ---------------
 
     async def create_bus_subscription(self, req: CreateBusSubscription) -> BusSubscription:
         resp = await self._request("POST", "/v1/bus/subscriptions", json=req.to_dict())
         _raise_for_status(resp)
-        return BusSubscription.from_dict(resp.json())
+        return BusSubscription.from_dict(_json.loads(resp.content))
 
     async def list_bus_subscriptions(
         self,
@@ -790,7 +778,8 @@ class _AsyncBusClientMixin:
             params["topic"] = topic
         resp = await self._request("GET", "/v1/bus/subscriptions", params=params or None)
         _raise_for_status(resp)
-        return [BusSubscription.from_dict(s) for s in resp.json().get("subscriptions", [])]
+        data = _json.loads(resp.content)
+        return [BusSubscription.from_dict(s) for s in data.get("subscriptions", [])]
 
     async def get_bus_subscription(
         self, namespace: str, tenant: str, sub_id: str
@@ -800,7 +789,7 @@ class _AsyncBusClientMixin:
             f"/v1/bus/subscriptions/{_seg(namespace)}/{_seg(tenant)}/{_seg(sub_id)}",
         )
         _raise_for_status(resp)
-        return BusSubscription.from_dict(resp.json())
+        return BusSubscription.from_dict(_json.loads(resp.content))
 
     async def delete_bus_subscription(
         self, namespace: str, tenant: str, sub_id: str
@@ -819,14 +808,14 @@ class _AsyncBusClientMixin:
             f"/v1/bus/subscriptions/{_seg(namespace)}/{_seg(tenant)}/{_seg(sub_id)}/lag",
         )
         _raise_for_status(resp)
-        return BusLag.from_dict(resp.json())
+        return BusLag.from_dict(_json.loads(resp.content))
 
     # --------------- Phase 3: Schemas ---------------
 
     async def register_bus_schema(self, req: RegisterBusSchema) -> BusSchema:
         resp = await self._request("POST", "/v1/bus/schemas", json=req.to_dict())
         _raise_for_status(resp)
-        return BusSchema.from_dict(resp.json())
+        return BusSchema.from_dict(_json.loads(resp.content))
 
     async def list_bus_schemas(
         self,
@@ -847,7 +836,7 @@ class _AsyncBusClientMixin:
             params["latest_only"] = "true"
         resp = await self._request("GET", "/v1/bus/schemas", params=params or None)
         _raise_for_status(resp)
-        return [BusSchema.from_dict(s) for s in resp.json().get("schemas", [])]
+        return [BusSchema.from_dict(s) for s in _json.loads(resp.content).get("schemas", [])]
 
     async def get_bus_schema(
         self, namespace: str, tenant: str, subject: str, version: int,
@@ -857,7 +846,7 @@ class _AsyncBusClientMixin:
             f"/v1/bus/schemas/{_seg(namespace)}/{_seg(tenant)}/{_seg(subject)}/{version}",
         )
         _raise_for_status(resp)
-        return BusSchema.from_dict(resp.json())
+        return BusSchema.from_dict(_json.loads(resp.content))
 
     async def delete_bus_schema(
         self, namespace: str, tenant: str, subject: str, version: int,
@@ -873,7 +862,7 @@ class _AsyncBusClientMixin:
     async def register_bus_agent(self, req: RegisterBusAgent) -> BusAgent:
         resp = await self._request("POST", "/v1/bus/agents", json=req.to_dict())
         _raise_for_status(resp)
-        return BusAgent.from_dict(resp.json())
+        return BusAgent.from_dict(_json.loads(resp.content))
 
     async def list_bus_agents(
         self,
@@ -888,7 +877,7 @@ class _AsyncBusClientMixin:
             params["tenant"] = tenant
         resp = await self._request("GET", "/v1/bus/agents", params=params or None)
         _raise_for_status(resp)
-        return [BusAgent.from_dict(a) for a in resp.json().get("agents", [])]
+        return [BusAgent.from_dict(a) for a in _json.loads(resp.content).get("agents", [])]
 
     async def get_bus_agent(self, namespace: str, tenant: str, agent_id: str) -> BusAgent:
         resp = await self._request(
@@ -896,7 +885,7 @@ class _AsyncBusClientMixin:
             f"/v1/bus/agents/{_seg(namespace)}/{_seg(tenant)}/{_seg(agent_id)}",
         )
         _raise_for_status(resp)
-        return BusAgent.from_dict(resp.json())
+        return BusAgent.from_dict(_json.loads(resp.content))
 
     async def delete_bus_agent(
         self, namespace: str, tenant: str, agent_id: str,
@@ -915,7 +904,7 @@ class _AsyncBusClientMixin:
             f"/v1/bus/agents/{_seg(namespace)}/{_seg(tenant)}/{_seg(agent_id)}/heartbeat",
         )
         _raise_for_status(resp)
-        return BusAgent.from_dict(resp.json())
+        return BusAgent.from_dict(_json.loads(resp.content))
 
     async def set_bus_agent_admin_state(
         self,
@@ -931,14 +920,14 @@ class _AsyncBusClientMixin:
             json=req.to_dict(),
         )
         _raise_for_status(resp)
-        return BusAgent.from_dict(resp.json())
+        return BusAgent.from_dict(_json.loads(resp.content))
 
     # --------------- Phase 5: Conversations ---------------
 
     async def create_bus_conversation(self, req: CreateBusConversation) -> BusConversation:
         resp = await self._request("POST", "/v1/bus/conversations", json=req.to_dict())
         _raise_for_status(resp)
-        return BusConversation.from_dict(resp.json())
+        return BusConversation.from_dict(_json.loads(resp.content))
 
     async def list_bus_conversations(
         self,
@@ -959,7 +948,8 @@ class _AsyncBusClientMixin:
             params["participant"] = participant
         resp = await self._request("GET", "/v1/bus/conversations", params=params or None)
         _raise_for_status(resp)
-        return [BusConversation.from_dict(c) for c in resp.json().get("conversations", [])]
+        data = _json.loads(resp.content)
+        return [BusConversation.from_dict(c) for c in data.get("conversations", [])]
 
     async def get_bus_conversation(
         self, namespace: str, tenant: str, conversation_id: str,
@@ -969,7 +959,7 @@ class _AsyncBusClientMixin:
             f"/v1/bus/conversations/{_seg(namespace)}/{_seg(tenant)}/{_seg(conversation_id)}",
         )
         _raise_for_status(resp)
-        return BusConversation.from_dict(resp.json())
+        return BusConversation.from_dict(_json.loads(resp.content))
 
     async def delete_bus_conversation(
         self, namespace: str, tenant: str, conversation_id: str,
@@ -994,7 +984,7 @@ class _AsyncBusClientMixin:
             json={"target_state": target_state},
         )
         _raise_for_status(resp)
-        return BusConversation.from_dict(resp.json())
+        return BusConversation.from_dict(_json.loads(resp.content))
 
     async def append_bus_conversation_message(
         self,
@@ -1009,7 +999,7 @@ class _AsyncBusClientMixin:
             json=req.to_dict(),
         )
         _raise_for_status(resp)
-        return resp.json()
+        return _json.loads(resp.content)
 
     async def replay_bus_conversation_messages(
         self,
@@ -1034,7 +1024,7 @@ class _AsyncBusClientMixin:
             params=params or None,
         )
         _raise_for_status(resp)
-        return BusReplayResponse.from_dict(resp.json())
+        return BusReplayResponse.from_dict(_json.loads(resp.content))
 
     # --------------- Phase 6a: Tool envelopes ---------------
 
@@ -1054,7 +1044,7 @@ class _AsyncBusClientMixin:
             json=req.to_dict(),
         )
         _raise_for_status(resp)
-        body = resp.json()
+        body = _json.loads(resp.content)
         if resp.status_code == 202:
             return PostBusToolCallOutcome(
                 parked=BusApprovalParkedReceipt.from_dict(body),
@@ -1076,7 +1066,7 @@ class _AsyncBusClientMixin:
             json=req.to_dict(),
         )
         _raise_for_status(resp)
-        return BusToolEnvelopeReceipt.from_dict(resp.json())
+        return BusToolEnvelopeReceipt.from_dict(_json.loads(resp.content))
 
     async def lookup_bus_tool_result(
         self,
@@ -1091,7 +1081,7 @@ class _AsyncBusClientMixin:
             params=params.to_query(),
         )
         _raise_for_status(resp)
-        return BusToolResultLookup.from_dict(resp.json())
+        return BusToolResultLookup.from_dict(_json.loads(resp.content))
 
     # --------------- Phase 6b: Stream envelopes ---------------
 
@@ -1108,7 +1098,7 @@ class _AsyncBusClientMixin:
             json=req.to_dict(),
         )
         _raise_for_status(resp)
-        return BusStreamEnvelopeReceipt.from_dict(resp.json())
+        return BusStreamEnvelopeReceipt.from_dict(_json.loads(resp.content))
 
     async def post_bus_stream_end(
         self,
@@ -1123,7 +1113,7 @@ class _AsyncBusClientMixin:
             json=req.to_dict(),
         )
         _raise_for_status(resp)
-        return BusStreamEnvelopeReceipt.from_dict(resp.json())
+        return BusStreamEnvelopeReceipt.from_dict(_json.loads(resp.content))
 
     def bus_stream_consume_url(
         self,
@@ -1159,10 +1149,8 @@ class _AsyncBusClientMixin:
             params: dict[str, Any] = {"topic": topic}
             if from_offset is not None:
                 params["from"] = from_offset
-            url = f"{self.base_url}/v1/bus/subscribe/{_seg(subscription_id)}"
-            async for env in _async_open_bus_sse_stream(
-                self._client, url, params, self._headers()
-            ):
+            url = f"/v1/bus/subscribe/{_seg(subscription_id)}"
+            async for env in _async_open_bus_sse_stream(self._client, url, params):
                 yield _envelope_to_consume_item(env)
             return
 
@@ -1170,14 +1158,12 @@ class _AsyncBusClientMixin:
         if from_offset is not None:
             first_params["from"] = from_offset
         resume_params: dict[str, Any] = {"topic": topic, "from": "latest"}
-        url = f"{self.base_url}/v1/bus/subscribe/{_seg(subscription_id)}"
+        url = f"/v1/bus/subscribe/{_seg(subscription_id)}"
         attempt = 0
         params_for_open = first_params
         while True:
             try:
-                async for env in _async_open_bus_sse_stream(
-                    self._client, url, params_for_open, self._headers()
-                ):
+                async for env in _async_open_bus_sse_stream(self._client, url, params_for_open):
                     attempt = 0
                     yield _envelope_to_consume_item(env)
             except (ConnectionError, HttpError):
@@ -1204,9 +1190,7 @@ class _AsyncBusClientMixin:
     ) -> AsyncIterator[BusStreamItem]:
         """Async version of :meth:`_BusClientMixin.consume_bus_stream`."""
         url = self.bus_stream_consume_url(namespace, tenant, conversation_id, stream_id)
-        async for env in _async_open_bus_sse_stream(
-            self._client, url, None, self._headers()
-        ):
+        async for env in _async_open_bus_sse_stream(self._client, url, None):
             item = _envelope_to_stream_item(env)
             yield item
             if item.is_end:
@@ -1233,7 +1217,8 @@ class _AsyncBusClientMixin:
             params=params or None,
         )
         _raise_for_status(resp)
-        return [BusApprovalView.from_dict(a) for a in resp.json().get("approvals", [])]
+        data = _json.loads(resp.content)
+        return [BusApprovalView.from_dict(a) for a in data.get("approvals", [])]
 
     async def get_bus_approval(
         self, namespace: str, tenant: str, approval_id: str,
@@ -1243,7 +1228,7 @@ class _AsyncBusClientMixin:
             f"/v1/bus/approvals/{_seg(namespace)}/{_seg(tenant)}/{_seg(approval_id)}",
         )
         _raise_for_status(resp)
-        return BusApprovalView.from_dict(resp.json())
+        return BusApprovalView.from_dict(_json.loads(resp.content))
 
     async def approve_bus_approval(
         self,
@@ -1258,7 +1243,7 @@ class _AsyncBusClientMixin:
             json=decision.to_dict(),
         )
         _raise_for_status(resp)
-        return BusApprovalDecisionResponse.from_dict(resp.json())
+        return BusApprovalDecisionResponse.from_dict(_json.loads(resp.content))
 
     async def reject_bus_approval(
         self,
@@ -1273,7 +1258,7 @@ class _AsyncBusClientMixin:
             json=decision.to_dict(),
         )
         _raise_for_status(resp)
-        return BusApprovalDecisionResponse.from_dict(resp.json())
+        return BusApprovalDecisionResponse.from_dict(_json.loads(resp.content))
 
 
 # ============================================================================
@@ -1344,12 +1329,13 @@ def _parse_sse_envelopes(lines: Iterator[str]) -> Iterator[Any]:
             event_id = None
             data_parts = []
             continue
-        if line.startswith("event:"):
-            event_type = line[len("event:") :].strip()
-        elif line.startswith("id:"):
-            event_id = line[len("id:") :].strip()
-        elif line.startswith("data:"):
-            data_parts.append(line[len("data:") :].strip())
+        name, _, value = line.partition(":")
+        if name == "data":
+            data_parts.append(value.strip())
+        elif name == "event":
+            event_type = value.strip()
+        elif name == "id":
+            event_id = value.strip()
 
 
 async def _async_parse_sse_envelopes(
@@ -1371,29 +1357,28 @@ async def _async_parse_sse_envelopes(
             event_id = None
             data_parts = []
             continue
-        if line.startswith("event:"):
-            event_type = line[len("event:") :].strip()
-        elif line.startswith("id:"):
-            event_id = line[len("id:") :].strip()
-        elif line.startswith("data:"):
-            data_parts.append(line[len("data:") :].strip())
+        name, _, value = line.partition(":")
+        if name == "data":
+            data_parts.append(value.strip())
+        elif name == "event":
+            event_type = value.strip()
+        elif name == "id":
+            event_id = value.strip()
 
 
 def _open_bus_sse_stream(
     client: "httpx.Client",
     url: str,
     params: Optional[dict[str, Any]],
-    headers: dict[str, str],
 ) -> Iterator[Any]:
     import httpx as _httpx
 
-    sse_headers = {**headers, "Accept": "text/event-stream"}
-    sse_headers.pop("Content-Type", None)
+    from .transport import _open_sse, _read_sse_error
+
     try:
-        with client.stream("GET", url, params=params, headers=sse_headers) as resp:
+        with _open_sse(client, url, params=params) as resp:
             if resp.status_code != 200:
-                resp.read()
-                raise HttpError(resp.status_code, resp.text or "bus consume failed")
+                raise HttpError(resp.status_code, _read_sse_error(resp) or "bus consume failed")
             yield from _parse_sse_envelopes(resp.iter_lines())
     except _httpx.ConnectError as e:  # pragma: no cover — network shape
         raise ConnectionError(str(e)) from e
@@ -1405,17 +1390,16 @@ async def _async_open_bus_sse_stream(
     client: "httpx.AsyncClient",
     url: str,
     params: Optional[dict[str, Any]],
-    headers: dict[str, str],
 ) -> AsyncIterator[Any]:
     import httpx as _httpx
 
-    sse_headers = {**headers, "Accept": "text/event-stream"}
-    sse_headers.pop("Content-Type", None)
+    from .transport import _async_open_sse, _async_read_sse_error
+
     try:
-        async with client.stream("GET", url, params=params, headers=sse_headers) as resp:
+        async with _async_open_sse(client, url, params=params) as resp:
             if resp.status_code != 200:
-                await resp.aread()
-                raise HttpError(resp.status_code, resp.text or "bus consume failed")
+                body = await _async_read_sse_error(resp)
+                raise HttpError(resp.status_code, body or "bus consume failed")
             async for env in _async_parse_sse_envelopes(resp.aiter_lines()):
                 yield env
     except _httpx.ConnectError as e:  # pragma: no cover — network shape
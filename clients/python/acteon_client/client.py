@@ -1,10 +1,38 @@
 """HTTP client for the Acteon action gateway."""
 
-from collections.abc import AsyncIterator
-from typing import Iterator, Optional, Union
-from urllib.parse import quote
+import asyncio
+import atexit
+import threading
+from collections.abc import AsyncGenerator, AsyncIterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import aclosing
+from dataclasses import replace
+from functools import partial
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Iterable,
+    Iterator,
+    NoReturn,
+    Optional,
+    TypeVar,
+    Union,
+    cast,
+)
 import httpx
 
+from . import _json
+from ._cache import _CachedLookupsMixin, _TTLCache
+from ._paths import seg as _seg
+from .transport import (
+    AsyncRetryTransport,
+    RetryTransport,
+    _async_open_sse,
+    _async_read_sse_error,
+    _open_sse,
+    _read_sse_error,
+)
 from .errors import ActeonError, ConnectionError, HttpError, ApiError
 from .models import (
     Action,
@@ -27,6 +55,7 @@ from .models import (
     FlushGroupResponse,
     ApprovalActionResponse,
     ApprovalStatus,
+    ApprovalLookup,
     ApprovalListResponse,
     ReplayResult,
     ReplaySummary,
@@ -90,8 +119,11 @@ from .models import (
     DagResponse,
     DlqStatsResponse,
     DlqDrainResponse,
+    TenantSnapshot,
     SseEvent,
-    _parse_sse_stream,
+    SSE_MAX_EVENT_SIZE,
+    _SseByteParser,
+    _parse_sse_bytes,
     AnalyticsResponse,
     CoverageKey,
     CoverageEntry,
@@ -99,6 +131,7 @@ from .models import (
     CoverageReport,
     SigningKeyEntry,
     SigningKeysResponse,
+    ErrorResponse,
 )
 
 
@@ -108,8 +141,157 @@ from .queues import _AsyncQueuesClientMixin, _QueuesClientMixin
 from .workflows import _AsyncWorkflowsClientMixin, _WorkflowsClientMixin
 
 
+_T = TypeVar("_T")
+_K = TypeVar("_K")
+
+# Query string for dry-run dispatches; a tuple so one instance can be shared.
+_DRY_RUN_PARAMS = (("dry_run", "true"),)
+
+# Cache key for ``list_rules`` when the lookup cache is on.
+_RULES_KEY = ("rules", "*")
+
+# Server-side cap on the number of actions in one ``POST /v1/dispatch/batch``.
+_MAX_BATCH_SIZE = 1000
+
+# Default ``max_concurrency`` for fan-outs of single-item requests.
+_MAX_CONCURRENCY = 32
+
+# Default ``max_concurrency`` for ``dispatch_batch_many``: each request
+# carries up to ``_MAX_BATCH_SIZE`` actions, so a few in flight already
+# keep the server busy.
+_MAX_BATCH_CONCURRENCY = 4
+
+# Statuses meaning "HEAD not allowed here"; ``health()`` retries with GET.
+_HEAD_UNSUPPORTED = frozenset({405, 501})
+
+# Error bodies larger than this are never JSON-decoded; Acteon's error
+# envelopes are tiny, so anything bigger is a proxy page or stack trace.
+_MAX_ERROR_BODY = 64 * 1024
+
+# Process-wide clients handed out by ``ActeonClient.shared()``, keyed by
+# ``(base_url, api_key, other constructor kwargs)``.
+_SHARED: dict[tuple, "ActeonClient"] = {}
+_SHARED_LOCK = threading.Lock()
+
+
+def _build_headers(api_key: Optional[str]) -> dict[str, str]:
+    """Build the default request headers for ``api_key``."""
+    headers = {"Content-Type": "application/json"}
+    if api_key:
+        headers["Authorization"] = f"Bearer {api_key}"
+    return headers
+
+
+def _compact(**kwargs: Any) -> dict[str, Any]:
+    """``kwargs`` without the ``None`` values, for optional params and bodies."""
+    return {k: v for k, v in kwargs.items() if v is not None}
+
+
+def _approval_params(
+    sig: str, expires_at: int, kid: Optional[str]
+) -> tuple[tuple[str, Any], ...]:
+    """Query params for the signed approval endpoints.
+
+    Returned as pairs, which httpx encodes directly without another
+    pass over a dict.
+    """
+    if kid is None:
+        return (("sig", sig), ("expires_at", expires_at))
+    return (("sig", sig), ("expires_at", expires_at), ("kid", kid))
+
+
+def _parse_ok(response: httpx.Response, parse: Callable[[Any], _T], message: str) -> _T:
+    """``parse`` the JSON body of a 200 response; any other status raises
+    :class:`HttpError` carrying ``message``."""
+    status = response.status_code
+    if status == 200:
+        return parse(_json.loads(response.content))
+    raise HttpError(status, message)
+
+
+def _raise_decision_error(response: httpx.Response, verb: str) -> NoReturn:
+    """Raise the error for a failed approve/reject (``verb``) response."""
+    if response.status_code == 404:
+        raise HttpError(404, "Approval not found or expired")
+    if response.status_code == 410:
+        raise HttpError(410, "Approval already decided")
+    raise HttpError(response.status_code, f"Failed to {verb}")
+
+
+def _raise_api_error(response: httpx.Response) -> NoReturn:
+    """Raise the :class:`ApiError` described by an error response body.
+
+    Bodies that are not a JSON object (HTML error pages from a proxy,
+    oversized payloads, truncated JSON) raise :class:`HttpError` with the
+    status instead of surfacing a decode error.
+    """
+    content_type = response.headers.get("content-type", "")
+    data = None
+    if len(response.content) <= _MAX_ERROR_BODY and (
+        not content_type or "json" in content_type
+    ):
+        try:
+            data = _json.loads(response.content)
+        except ValueError:
+            pass
+    if not isinstance(data, dict):
+        raise HttpError(response.status_code, response.reason_phrase or "Request failed")
+    raise ApiError(
+        code=data.get("code", "UNKNOWN"),
+        message=data.get("message", data.get("error", "Unknown error")),
+        retryable=data.get("retryable", False),
+    )
+
+
+def _batch_error(exc: ActeonError) -> BatchResult:
+    """Convert a per-action dispatch failure into a failed ``BatchResult``."""
+    if isinstance(exc, ApiError):
+        error = ErrorResponse(code=exc.code, message=exc.message, retryable=exc.retryable)
+    elif isinstance(exc, ConnectionError):
+        error = ErrorResponse(code="CONNECTION_ERROR", message=exc.message, retryable=True)
+    elif isinstance(exc, HttpError):
+        error = ErrorResponse(
+            code="HTTP_ERROR", message=exc.message, retryable=exc.is_retryable()
+        )
+    else:
+        error = ErrorResponse(code="UNKNOWN", message=exc.message)
+    return BatchResult(success=False, error=error)
+
+
+def _batch_results(outcomes: list[Union[ActionOutcome, ActeonError]]) -> list[BatchResult]:
+    """Wrap per-action fan-out outcomes as ``BatchResult`` entries."""
+    return [
+        _batch_error(o) if isinstance(o, ActeonError) else BatchResult(success=True, outcome=o)
+        for o in outcomes
+    ]
+
+
+def _join_batches(
+    slices: list[list[Action]], outcomes: list[Union[list[BatchResult], ActeonError]]
+) -> list[BatchResult]:
+    """Concatenate per-slice batch results, expanding a slice that failed as
+    a whole into one failed result per action."""
+    results: list[BatchResult] = []
+    for chunk, outcome in zip(slices, outcomes):
+        if isinstance(outcome, ActeonError):
+            results.extend(_batch_error(outcome) for _ in chunk)
+        else:
+            results.extend(outcome)
+    return results
+
+
+def _batch_slices(actions: list[Action], batch_size: int) -> list[list[Action]]:
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+    return [actions[i : i + batch_size] for i in range(0, len(actions), batch_size)]
+
+
 class ActeonClient(
-    _A2AClientMixin, _BusClientMixin, _QueuesClientMixin, _WorkflowsClientMixin
+    _A2AClientMixin,
+    _BusClientMixin,
+    _QueuesClientMixin,
+    _WorkflowsClientMixin,
+    _CachedLookupsMixin,
 ):
     """HTTP client for the Acteon action gateway.
 
@@ -137,6 +319,14 @@ class ActeonClient(
         client_cert_path: Optional[str] = None,
         client_key_path: Optional[str] = None,
         verify_ssl: bool = True,
+        http2: bool = False,
+        max_connections: Optional[int] = 100,
+        max_keepalive_connections: Optional[int] = 100,
+        keepalive_expiry: Optional[float] = 30.0,
+        max_retries: int = 0,
+        uds: Optional[str] = None,
+        cache_ttl: Optional[float] = None,
+        cache_maxsize: int = 1024,
     ):
         """Create a new Acteon client.
 
@@ -153,12 +343,121 @@ class ActeonClient(
             verify_ssl: Set to ``False`` to skip certificate verification
                 (for development/testing only). Ignored when ``ca_cert_path``
                 is provided.
+            http2: Negotiate HTTP/2 over TLS so concurrent requests are
+                multiplexed on one connection. Requires the ``http2`` extra
+                (``pip install acteon-client[http2]``).
+            max_connections: Upper bound on concurrent connections in the
+                pool (``None`` for unlimited).
+            max_keepalive_connections: How many idle connections to keep
+                open for reuse (``None`` for unlimited). Defaults to 100,
+                the same as the ``max_connections`` default, so bursts of
+                concurrent calls don't churn through fresh handshakes;
+                lowering ``max_connections`` does not lower it.
+            keepalive_expiry: Seconds an idle pooled connection is kept.
+            max_retries: Retry requests answered with ``429`` (or, for
+                idempotent methods, ``503``) up to this many times, waiting
+                for ``Retry-After`` (or an exponential backoff) on the same
+                pooled connection. ``POST`` dispatches are not re-sent on
+                ``503``, since a proxy may return it after the server acted.
+                Also retries failed connection attempts. ``0`` disables
+                retries.
+            uds: Path of a Unix domain socket to connect through instead
+                of TCP, for a gateway (or proxy) on the same host.
+                ``base_url`` still supplies the scheme, ``Host`` header and
+                path prefix, e.g. ``"http://localhost"``.
+            cache_ttl: Keep the parsed results of ``list_rules``,
+                ``get_quota``, ``get_chain``, ``get_event``, ``get_group``
+                and ``get_audit_record`` for this many seconds, so repeated
+                lookups skip the request. Off by default. Cached objects
+                are shared between callers; don't mutate them.
+            cache_maxsize: Most lookups kept when caching is on.
         """
         self.base_url = base_url.rstrip("/")
-        self.api_key = api_key
+        self._api_key = api_key
+        self._get_cache = _TTLCache(cache_maxsize, cache_ttl) if cache_ttl else None
+        # Becomes "GET" once the server (or a proxy) rejects HEAD /health.
+        self._health_method = "HEAD"
         verify: Union[bool, str] = ca_cert_path if ca_cert_path else verify_ssl
         cert = (client_cert_path, client_key_path) if client_cert_path and client_key_path else None
-        self._client = httpx.Client(timeout=timeout, verify=verify, cert=cert)
+        limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        transport: Optional[httpx.BaseTransport] = None
+        if max_retries or uds:
+            # httpx ignores the TLS/pool arguments below once a transport
+            # is given, so the explicit transport gets them instead.
+            transport = httpx.HTTPTransport(
+                verify=verify,
+                cert=cert,
+                http2=http2,
+                limits=limits,
+                retries=max_retries,
+                uds=uds,
+            )
+            if max_retries:
+                transport = RetryTransport(transport, max_retries=max_retries)
+        # Content-Type and auth live on the httpx client itself, so
+        # requests don't carry (or rebuild) a headers dict each call.
+        self._client = httpx.Client(
+            base_url=self.base_url,
+            headers=_build_headers(api_key),
+            timeout=timeout,
+            verify=verify,
+            cert=cert,
+            http2=http2,
+            limits=limits,
+            transport=transport,
+        )
+
+    @classmethod
+    def shared(
+        cls, base_url: str, *, api_key: Optional[str] = None, **kwargs: Any
+    ) -> "ActeonClient":
+        """Return a process-wide client for ``base_url``, creating it once.
+
+        Code that would otherwise build a client per request (e.g. inside
+        a web handler) can call this instead and reuse one connection
+        pool. Calls with the same ``base_url``, ``api_key`` and keyword
+        arguments return the same instance; the arguments are those of
+        :meth:`__init__`. Shared clients are closed at interpreter exit.
+
+        Do not ``close()`` the returned client or use it as a context
+        manager — other callers hold the same instance.
+        """
+        key = (base_url.rstrip("/"), api_key, tuple(sorted(kwargs.items())))
+        with _SHARED_LOCK:
+            client = _SHARED.get(key)
+            if client is None:
+                if not _SHARED:
+                    atexit.register(cls._close_all)
+                client = _SHARED[key] = cls(base_url, api_key=api_key, **kwargs)
+            return client
+
+    @staticmethod
+    def _close_all() -> None:
+        """Close and forget every client created by :meth:`shared`."""
+        with _SHARED_LOCK:
+            clients = list(_SHARED.values())
+            _SHARED.clear()
+        for client in clients:
+            client.close()
+
+    @property
+    def api_key(self) -> Optional[str]:
+        """API key sent as ``Authorization: Bearer <key>``."""
+        return self._api_key
+
+    @api_key.setter
+    def api_key(self, value: Optional[str]) -> None:
+        self._api_key = value
+        if value:
+            self._client.headers["Authorization"] = f"Bearer {value}"
+        else:
+            self._client.headers.pop("Authorization", None)
+        # Cached lookups belong to the previous principal.
+        self.cache_clear()
 
     def __enter__(self):
         return self
@@ -170,22 +469,16 @@ class ActeonClient(
         """Close the HTTP client."""
         self._client.close()
 
-    def _headers(self) -> dict[str, str]:
-        """Get request headers."""
-        headers = {"Content-Type": "application/json"}
-        if self.api_key:
-            headers["Authorization"] = f"Bearer {self.api_key}"
-        return headers
-
     def _request(
         self,
         method: str,
         path: str,
         *,
-        json: Optional[dict] = None,
-        params: Optional[dict] = None,
+        json: Optional[Any] = None,
+        params: Optional[Union[dict, tuple]] = None,
         extra_headers: Optional[dict[str, str]] = None,
         skip_auth: bool = False,
+        content: Optional[bytes] = None,
     ) -> httpx.Response:
         """Make an HTTP request.
 
@@ -193,20 +486,25 @@ class ActeonClient(
         overrides win). ``skip_auth=True`` suppresses the
         ``Authorization`` / API-key headers — used by A2A's unauthenticated
         ``.well-known/agent.json`` discovery endpoint.
+
+        ``json`` bodies are encoded with the client's JSON codec (orjson
+        when available) and sent as raw bytes. Callers that already hold
+        an encoded body pass it as ``content`` instead, which skips the
+        encode step; ``json`` is ignored when ``content`` is given.
         """
-        url = f"{self.base_url}{path}"
-        headers = {"Content-Type": "application/json"} if skip_auth else self._headers()
-        if extra_headers:
-            headers.update(extra_headers)
+        if content is None and json is not None:
+            content = _json.dumps(json)
         try:
-            response = self._client.request(
-                method,
-                url,
-                json=json,
-                params=params,
-                headers=headers,
+            # ``path`` is joined onto the client's ``base_url`` by httpx,
+            # which also merges in the client-level default headers.
+            # ``build_request`` + ``send`` is what ``Client.request`` does,
+            # minus its extra frame and keyword re-packing.
+            request = self._client.build_request(
+                method, path, content=content, params=params, headers=extra_headers
             )
-            return response
+            if skip_auth:
+                request.headers.pop("Authorization", None)
+            return self._client.send(request)
         except httpx.ConnectError as e:
             raise ConnectionError(str(e)) from e
         except httpx.TimeoutException as e:
@@ -219,15 +517,43 @@ class ActeonClient(
     def health(self) -> bool:
         """Check if the server is healthy.
 
+        Sends ``HEAD /health`` so no body crosses the wire, falling back
+        to ``GET`` when a server or proxy in between rejects ``HEAD``.
+
         Returns:
             True if the server is healthy, False otherwise.
         """
         try:
-            response = self._request("GET", "/health")
+            response = self._request(self._health_method, "/health")
+            if response.status_code in _HEAD_UNSUPPORTED and self._health_method == "HEAD":
+                # Remember the fallback so later probes take one round trip.
+                self._health_method = "GET"
+                response = self._request("GET", "/health")
             return response.status_code == 200
         except ConnectionError:
             return False
 
+    def warmup(self, connections: int = 1) -> None:
+        """Open pooled connections before the first real request.
+
+        Issues ``connections`` concurrent :meth:`health` probes (``HEAD
+        /health``, falling back to ``GET`` on servers that reject HEAD) so
+        that DNS resolution and the TCP/TLS handshakes are paid up front and
+        the connections are parked in the keep-alive pool. Useful for
+        short-lived processes and before latency-sensitive bursts such as
+        :meth:`dispatch_many`. Connection failures are ignored; the next
+        real request will surface them.
+
+        Args:
+            connections: Number of connections to open.
+        """
+        if connections <= 1:
+            self.health()
+            return
+        with ThreadPoolExecutor(max_workers=connections) as pool:
+            for _ in range(connections):
+                pool.submit(self.health)
+
     # =========================================================================
     # Signing key discovery (JWKS-style)
     # =========================================================================
@@ -261,9 +587,9 @@ class ActeonClient(
         if response.status_code != 200:
             raise HttpError(response.status_code, "Failed to fetch signing keys")
         try:
-            return SigningKeysResponse.from_dict(response.json())
+            return SigningKeysResponse.from_dict(_json.loads(response.content))
         except ValueError as e:
-            # httpx raises JSONDecodeError (a ValueError subclass)
+            # The decoder raises JSONDecodeError (a ValueError subclass)
             # when the 200 body isn't JSON. Rewrap so callers get a
             # typed "malformed response" signal instead of a raw
             # JSON decode error.
@@ -291,20 +617,15 @@ class ActeonClient(
             ConnectionError: If unable to connect to the server.
             ApiError: If the server returns an error.
         """
-        params = {"dry_run": "true"} if dry_run else None
+        params = _DRY_RUN_PARAMS if dry_run else None
         response = self._request(
             "POST", "/v1/dispatch", json=action.to_dict(), params=params
         )
 
         if response.status_code == 200:
-            return ActionOutcome.from_dict(response.json())
+            return ActionOutcome.from_dict(_json.loads(response.content))
         else:
-            data = response.json()
-            raise ApiError(
-                code=data.get("code", "UNKNOWN"),
-                message=data.get("message", "Unknown error"),
-                retryable=data.get("retryable", False),
-            )
+            _raise_api_error(response)
 
     def dispatch_dry_run(self, action: Action) -> ActionOutcome:
         """Dispatch a single action in dry-run mode.
@@ -339,23 +660,20 @@ class ActeonClient(
             ConnectionError: If unable to connect to the server.
             ApiError: If the server returns a batch-level error.
         """
-        params = {"dry_run": "true"} if dry_run else None
+        if not actions:
+            return []
+        params = _DRY_RUN_PARAMS if dry_run else None
         response = self._request(
             "POST",
             "/v1/dispatch/batch",
-            json=[a.to_dict() for a in actions],
+            content=_json.dumps([a.to_dict() for a in actions]),
             params=params,
         )
 
         if response.status_code == 200:
-            return [BatchResult.from_dict(r) for r in response.json()]
+            return [BatchResult.from_dict(r) for r in _json.loads(response.content)]
         else:
-            data = response.json()
-            raise ApiError(
-                code=data.get("code", "UNKNOWN"),
-                message=data.get("message", "Unknown error"),
-                retryable=data.get("retryable", False),
-            )
+            _raise_api_error(response)
 
     def dispatch_batch_dry_run(self, actions: list[Action]) -> list[BatchResult]:
         """Dispatch multiple actions in dry-run mode.
@@ -374,6 +692,167 @@ class ActeonClient(
         """
         return self.dispatch_batch(actions, dry_run=True)
 
+    def dispatch_many(
+        self,
+        actions: list[Action],
+        *,
+        dry_run: bool = False,
+        max_concurrency: int = _MAX_CONCURRENCY,
+    ) -> list[BatchResult]:
+        """Dispatch actions as concurrent individual requests.
+
+        Unlike :meth:`dispatch_batch`, each action is sent as its own
+        ``POST /v1/dispatch`` from a thread pool sharing this client's
+        connection pool, so wall time tracks the slowest request rather
+        than the sum. A failure of one action does not abort the others.
+
+        Args:
+            actions: List of actions to dispatch.
+            dry_run: When True, evaluates rules without executing any actions.
+            max_concurrency: Most requests in flight at once.
+
+        Returns:
+            List of results in the same order as ``actions``. Actions that
+            raised an :class:`ActeonError` come back with ``success=False``.
+
+        Raises:
+            ValueError: If ``max_concurrency`` is less than 1.
+        """
+        return _batch_results(
+            self._fan_out(lambda a: self.dispatch(a, dry_run=dry_run), actions, max_concurrency)
+        )
+
+    def dispatch_batch_many(
+        self,
+        actions: list[Action],
+        *,
+        dry_run: bool = False,
+        batch_size: int = _MAX_BATCH_SIZE,
+        max_concurrency: int = _MAX_BATCH_CONCURRENCY,
+    ) -> list[BatchResult]:
+        """Dispatch a large action list as concurrent batch requests.
+
+        ``actions`` is cut into slices of ``batch_size`` (the server rejects
+        batches of more than 1000 actions), and the slices are sent through
+        :meth:`dispatch_batch` with at most ``max_concurrency`` in flight.
+
+        Args:
+            actions: List of actions to dispatch.
+            dry_run: When True, evaluates rules without executing any actions.
+            batch_size: Most actions per batch request.
+            max_concurrency: Most batch requests in flight at once.
+
+        Returns:
+            List of results in the same order as ``actions``. When a whole
+            batch request fails, each of its actions comes back with
+            ``success=False`` carrying that error.
+        """
+        slices = _batch_slices(actions, batch_size)
+        outcomes = self._fan_out(
+            lambda chunk: self.dispatch_batch(chunk, dry_run=dry_run), slices, max_concurrency
+        )
+        return _join_batches(slices, outcomes)
+
+    def pipeline(
+        self,
+        calls: Iterable[Callable[[], _T]],
+        *,
+        max_concurrency: int = _MAX_CONCURRENCY,
+    ) -> list[_T]:
+        """Run independent client calls concurrently over the shared pool.
+
+        Dashboard-style fan-out (``list_rules`` + ``list_groups`` +
+        ``query_audit`` + ...) otherwise pays the sum of the round trips;
+        issued together it pays roughly the slowest one.
+
+        Example:
+            >>> rules, groups, page = client.pipeline([
+            ...     client.list_rules,
+            ...     client.list_groups,
+            ...     lambda: client.query_audit(AuditQuery(limit=20)),
+            ... ])
+
+        Args:
+            calls: Zero-argument callables, typically bound client methods
+                or lambdas wrapping a call with arguments.
+            max_concurrency: Most calls in flight at once.
+
+        Returns:
+            Each call's return value, in the order given.
+
+        Raises:
+            ValueError: If ``max_concurrency`` is less than 1.
+            Whatever the first failing call (in order) raised, after all
+            calls have finished.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        calls = list(calls)
+        if not calls:
+            return []
+        with ThreadPoolExecutor(max_workers=min(max_concurrency, len(calls))) as pool:
+            futures = [pool.submit(call) for call in calls]
+        return [future.result() for future in futures]
+
+    def _fan_out(
+        self, call: Callable[[_K], _T], ids: Iterable[_K], max_concurrency: int
+    ) -> list[Union[_T, ActeonError]]:
+        """Run ``call(id)`` for every id over a bounded thread pool.
+
+        Results come back in input order; an id whose call raised an
+        :class:`ActeonError` gets the exception in its slot instead.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        ids = list(ids)
+        if not ids:
+            return []
+        with ThreadPoolExecutor(max_workers=min(max_concurrency, len(ids))) as pool:
+            futures = [pool.submit(call, i) for i in ids]
+        results: list[Union[_T, ActeonError]] = []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except ActeonError as e:
+                results.append(e)
+        return results
+
+    def snapshot(self, namespace: str, tenant: str) -> TenantSnapshot:
+        """Fetch a tenant's approvals, recurring actions, quotas and chains
+        plus DLQ stats in one concurrent fan-out.
+
+        The five reads are issued together through :meth:`pipeline`, so
+        the call takes about as long as the slowest of them; with
+        ``http2=True`` they share one multiplexed connection.
+
+        Args:
+            namespace: The namespace to report on.
+            tenant: The tenant to report on.
+
+        Returns:
+            The combined :class:`TenantSnapshot`.
+
+        Raises:
+            ConnectionError: If unable to connect to the server.
+            HttpError: If any of the reads fails.
+        """
+        results: list[Any] = self.pipeline([
+            lambda: self.list_approvals(namespace, tenant),
+            lambda: self.list_recurring(RecurringFilter(namespace=namespace, tenant=tenant)),
+            lambda: self.list_quotas(namespace=namespace, tenant=tenant),
+            lambda: self.list_chains(namespace, tenant),
+            self.dlq_stats,
+        ])
+        # pipeline() can only type its results as a common base; restore
+        # each read's own type.
+        return TenantSnapshot(
+            approvals=cast(ApprovalListResponse, results[0]),
+            recurring=cast(ListRecurringResponse, results[1]),
+            quotas=cast(ListQuotasResponse, results[2]),
+            chains=cast(ListChainsResponse, results[3]),
+            dlq=cast(DlqStatsResponse, results[4]),
+        )
+
     # =========================================================================
     # Rules Management
     # =========================================================================
@@ -388,10 +867,15 @@ class ActeonClient(
             ConnectionError: If unable to connect to the server.
             HttpError: If the server returns an error.
         """
+        cached = self._cache_get(_RULES_KEY)
+        if cached is not None:
+            return cached
+        generation = self._cache_generation()
         response = self._request("GET", "/v1/rules")
 
         if response.status_code == 200:
-            return [RuleInfo.from_dict(r) for r in response.json()]
+            rules = [RuleInfo.from_dict(r) for r in _json.loads(response.content)]
+            return self._cache_put(_RULES_KEY, rules, generation)
         else:
             raise HttpError(response.status_code, f"Failed to list rules")
 
@@ -405,12 +889,10 @@ class ActeonClient(
             ConnectionError: If unable to connect to the server.
             HttpError: If the server returns an error.
         """
-        response = self._request("POST", "/v1/rules/reload")
+        with self._invalidating(*_RULES_KEY):
+            response = self._request("POST", "/v1/rules/reload")
 
-        if response.status_code == 200:
-            return ReloadResult.from_dict(response.json())
-        else:
-            raise HttpError(response.status_code, f"Failed to reload rules")
+        return _parse_ok(response, ReloadResult.from_dict, "Failed to reload rules")
 
     def set_rule_enabled(self, rule_name: str, enabled: bool) -> None:
         """Enable or disable a specific rule.
@@ -423,11 +905,12 @@ class ActeonClient(
             ConnectionError: If unable to connect to the server.
             HttpError: If the server returns an error.
         """
-        response = self._request(
-            "PUT",
-            f"/v1/rules/{rule_name}/enabled",
-            json={"enabled": enabled},
-        )
+        with self._invalidating(*_RULES_KEY):
+            response = self._request(
+                "PUT",
+                f"/v1/rules/{_seg(rule_name)}/enabled",
+                json={"enabled": enabled},
+            )
 
         if response.status_code != 200:
             raise HttpError(response.status_code, f"Failed to set rule enabled")
@@ -449,30 +932,9 @@ class ActeonClient(
             ConnectionError: If unable to connect to the server.
             HttpError: If the server returns an error.
         """
-        body: dict = {
-            "namespace": request.namespace,
-            "tenant": request.tenant,
-            "provider": request.provider,
-            "action_type": request.action_type,
-            "payload": request.payload,
-        }
-        if request.metadata:
-            body["metadata"] = request.metadata
-        if request.include_disabled:
-            body["include_disabled"] = True
-        if request.evaluate_all:
-            body["evaluate_all"] = True
-        if request.evaluate_at:
-            body["evaluate_at"] = request.evaluate_at
-        if request.mock_state:
-            body["mock_state"] = request.mock_state
+        response = self._request("POST", "/v1/rules/evaluate", json=request.to_dict())
 
-        response = self._request("POST", "/v1/rules/evaluate", json=body)
-
-        if response.status_code == 200:
-            return EvaluateRulesResponse.from_dict(response.json())
-        else:
-            raise HttpError(response.status_code, "Failed to evaluate rules")
+        return _parse_ok(response, EvaluateRulesResponse.from_dict, "Failed to evaluate rules")
 
     # =========================================================================
     # Audit Trail
@@ -494,10 +956,33 @@ class ActeonClient(
         params = query.to_params() if query else {}
         response = self._request("GET", "/v1/audit", params=params)
 
-        if response.status_code == 200:
-            return AuditPage.from_dict(response.json())
-        else:
-            raise HttpError(response.status_code, f"Failed to query audit")
+        return _parse_ok(response, AuditPage.from_dict, "Failed to query audit")
+
+    def iter_audit(self, query: Optional[AuditQuery] = None) -> Iterator[AuditRecord]:
+        """Iterate over every audit record matching ``query``.
+
+        Pages are fetched lazily with cursor pagination, so only one page
+        (``query.limit`` records) is held in memory at a time and the
+        first records are available as soon as the first page arrives.
+        Any ``offset`` on ``query`` applies to the first page only.
+
+        Args:
+            query: Optional query parameters; ``limit`` sets the page size.
+
+        Yields:
+            Audit records in server order.
+
+        Raises:
+            ConnectionError: If unable to connect to the server.
+            HttpError: If the server returns an error.
+        """
+        query = query or AuditQuery()
+        while True:
+            page = self.query_audit(query)
+            yield from page.records
+            if not page.next_cursor or not page.records:
+                return
+            query = replace(query, cursor=page.next_cursor, offset=None)
 
     def get_audit_record(self, action_id: str) -> Optional[AuditRecord]:
         """Get a specific audit record by action ID.
@@ -512,10 +997,17 @@ class ActeonClient(
             ConnectionError: If unable to connect to the server.
             HttpError: If the server returns an error (other than 404).
         """
-        response = self._request("GET", f"/v1/audit/{action_id}")
+        key = ("audit", action_id)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        generation = self._cache_generation()
+        response = self._request("GET", f"/v1/audit/{_seg(action_id)}")
 
         if response.status_code == 200:
-            return AuditRecord.from_dict(response.json())
+            return self._cache_put(
+                key, AuditRecord.from_dict(_json.loads(response.content)), generation
+            )
         elif response.status_code == 404:
             return None
         else:
@@ -538,10 +1030,10 @@ class ActeonClient(
             ConnectionError: If unable to connect to the server.
             HttpError: If the audit record is not found (404) or has no payload (422).
         """
-        response = self._request("POST", f"/v1/audit/{action_id}/replay")
+        response = self._request("POST", f"/v1/audit/{_seg(action_id)}/replay")
 
         if response.status_code == 200:
-            return ReplayResult.from_dict(response.json())
+            return ReplayResult.from_dict(_json.loads(response.content))
         elif response.status_code == 404:
             raise HttpError(404, f"Audit record not found: {action_id}")
         elif response.status_code == 422:
@@ -565,10 +1057,7 @@ class ActeonClient(
         params = query.to_params() if query else {}
         response = self._request("POST", "/v1/audit/replay", params=params)
 
-        if response.status_code == 200:
-            return ReplaySummary.from_dict(response.json())
-        else:
-            raise HttpError(response.status_code, "Failed to replay audit")
+        return _parse_ok(response, ReplaySummary.from_dict, "Failed to replay audit")
 
     # =========================================================================
     # Events (State Machine Lifecycle)
@@ -589,10 +1078,7 @@ class ActeonClient(
         """
         response = self._request("GET", "/v1/events", params=query.to_params())
 
-        if response.status_code == 200:
-            return EventListResponse.from_dict(response.json())
-        else:
-            raise HttpError(response.status_code, "Failed to list events")
+        return _parse_ok(response, EventListResponse.from_dict, "Failed to list events")
 
     def get_event(
         self, fingerprint: str, namespace: str, tenant: str
@@ -611,14 +1097,21 @@ class ActeonClient(
             ConnectionError: If unable to connect to the server.
             HttpError: If the server returns an error (other than 404).
         """
+        key = ("event", fingerprint, namespace, tenant)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        generation = self._cache_generation()
         response = self._request(
             "GET",
-            f"/v1/events/{fingerprint}",
-            params={"namespace": namespace, "tenant": tenant},
+            f"/v1/events/{_seg(fingerprint)}",
+            params=(("namespace", namespace), ("tenant", tenant)),
         )
 
         if response.status_code == 200:
-            return EventState.from_dict(response.json())
+            return self._cache_put(
+                key, EventState.from_dict(_json.loads(response.content)), generation
+            )
         elif response.status_code == 404:
             return None
         else:
@@ -643,23 +1136,19 @@ class ActeonClient(
             HttpError: If the event is not found (404).
             ApiError: If the server returns an error.
         """
-        response = self._request(
-            "PUT",
-            f"/v1/events/{fingerprint}/transition",
-            json={"to": to_state, "namespace": namespace, "tenant": tenant},
-        )
+        with self._invalidating("event", fingerprint):
+            response = self._request(
+                "PUT",
+                f"/v1/events/{_seg(fingerprint)}/transition",
+                json={"to": to_state, "namespace": namespace, "tenant": tenant},
+            )
 
         if response.status_code == 200:
-            return TransitionResponse.from_dict(response.json())
+            return TransitionResponse.from_dict(_json.loads(response.content))
         elif response.status_code == 404:
             raise HttpError(404, f"Event not found: {fingerprint}")
         else:
-            data = response.json()
-            raise ApiError(
-                code=data.get("code", "UNKNOWN"),
-                message=data.get("message", "Unknown error"),
-                retryable=data.get("retryable", False),
-            )
+            _raise_api_error(response)
 
     # =========================================================================
     # Groups (Event Batching)
@@ -677,10 +1166,7 @@ class ActeonClient(
         """
         response = self._request("GET", "/v1/groups")
 
-        if response.status_code == 200:
-            return GroupListResponse.from_dict(response.json())
-        else:
-            raise HttpError(response.status_code, "Failed to list groups")
+        return _parse_ok(response, GroupListResponse.from_dict, "Failed to list groups")
 
     def get_group(self, group_key: str) -> Optional[GroupDetail]:
         """Get details of a specific group.
@@ -695,10 +1181,17 @@ class ActeonClient(
             ConnectionError: If unable to connect to the server.
             HttpError: If the server returns an error (other than 404).
         """
-        response = self._request("GET", f"/v1/groups/{group_key}")
+        key = ("group", group_key)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        generation = self._cache_generation()
+        response = self._request("GET", f"/v1/groups/{_seg(group_key)}")
 
         if response.status_code == 200:
-            return GroupDetail.from_dict(response.json())
+            return self._cache_put(
+                key, GroupDetail.from_dict(_json.loads(response.content)), generation
+            )
         elif response.status_code == 404:
             return None
         else:
@@ -718,19 +1211,15 @@ class ActeonClient(
             HttpError: If the group is not found (404).
             ApiError: If the server returns an error.
         """
-        response = self._request("DELETE", f"/v1/groups/{group_key}")
+        with self._invalidating("group", group_key):
+            response = self._request("DELETE", f"/v1/groups/{_seg(group_key)}")
 
         if response.status_code == 200:
-            return FlushGroupResponse.from_dict(response.json())
+            return FlushGroupResponse.from_dict(_json.loads(response.content))
         elif response.status_code == 404:
             raise HttpError(404, f"Group not found: {group_key}")
         else:
-            data = response.json()
-            raise ApiError(
-                code=data.get("code", "UNKNOWN"),
-                message=data.get("message", "Unknown error"),
-                retryable=data.get("retryable", False),
-            )
+            _raise_api_error(response)
 
     # =========================================================================
     # Approvals (Human-in-the-Loop)
@@ -754,23 +1243,7 @@ class ActeonClient(
             ConnectionError: If unable to connect to the server.
             HttpError: If approval not found (404) or already decided (410).
         """
-        params: dict = {"sig": sig, "expires_at": expires_at}
-        if kid is not None:
-            params["kid"] = kid
-        response = self._request(
-            "POST",
-            f"/v1/approvals/{namespace}/{tenant}/{id}/approve",
-            params=params,
-        )
-
-        if response.status_code == 200:
-            return ApprovalActionResponse.from_dict(response.json())
-        elif response.status_code == 404:
-            raise HttpError(404, "Approval not found or expired")
-        elif response.status_code == 410:
-            raise HttpError(410, "Approval already decided")
-        else:
-            raise HttpError(response.status_code, "Failed to approve")
+        return self._decide_approval("approve", namespace, tenant, id, sig, expires_at, kid)
 
     def reject(self, namespace: str, tenant: str, id: str, sig: str, expires_at: int, kid: Optional[str] = None) -> ApprovalActionResponse:
         """Reject a pending action by namespace, tenant, ID, and HMAC signature.
@@ -790,23 +1263,27 @@ class ActeonClient(
             ConnectionError: If unable to connect to the server.
             HttpError: If approval not found (404) or already decided (410).
         """
-        params: dict = {"sig": sig, "expires_at": expires_at}
-        if kid is not None:
-            params["kid"] = kid
+        return self._decide_approval("reject", namespace, tenant, id, sig, expires_at, kid)
+
+    def _decide_approval(
+        self,
+        verb: str,
+        namespace: str,
+        tenant: str,
+        id: str,
+        sig: str,
+        expires_at: int,
+        kid: Optional[str],
+    ) -> ApprovalActionResponse:
+        """Shared body of :meth:`approve` and :meth:`reject`."""
         response = self._request(
             "POST",
-            f"/v1/approvals/{namespace}/{tenant}/{id}/reject",
-            params=params,
+            f"/v1/approvals/{_seg(namespace)}/{_seg(tenant)}/{_seg(id)}/{_seg(verb)}",
+            params=_approval_params(sig, expires_at, kid),
         )
-
         if response.status_code == 200:
-            return ApprovalActionResponse.from_dict(response.json())
-        elif response.status_code == 404:
-            raise HttpError(404, "Approval not found or expired")
-        elif response.status_code == 410:
-            raise HttpError(410, "Approval already decided")
-        else:
-            raise HttpError(response.status_code, "Failed to reject")
+            return ApprovalActionResponse.from_dict(_json.loads(response.content))
+        _raise_decision_error(response, verb)
 
     def get_approval(self, namespace: str, tenant: str, id: str, sig: str, expires_at: int, kid: Optional[str] = None) -> Optional[ApprovalStatus]:
         """Get the status of an approval by namespace, tenant, ID, and HMAC signature.
@@ -826,22 +1303,51 @@ class ActeonClient(
             ConnectionError: If unable to connect to the server.
             HttpError: If the server returns an error (other than 404).
         """
-        params: dict = {"sig": sig, "expires_at": expires_at}
-        if kid is not None:
-            params["kid"] = kid
         response = self._request(
             "GET",
-            f"/v1/approvals/{namespace}/{tenant}/{id}",
-            params=params,
+            f"/v1/approvals/{_seg(namespace)}/{_seg(tenant)}/{_seg(id)}",
+            params=_approval_params(sig, expires_at, kid),
         )
 
         if response.status_code == 200:
-            return ApprovalStatus.from_dict(response.json())
+            return ApprovalStatus.from_dict(_json.loads(response.content))
         elif response.status_code == 404:
             return None
         else:
             raise HttpError(response.status_code, "Failed to get approval")
 
+    def get_approvals(
+        self,
+        lookups: Iterable[ApprovalLookup],
+        *,
+        max_concurrency: int = _MAX_CONCURRENCY,
+    ) -> list[Optional[ApprovalStatus]]:
+        """Get the status of several approvals concurrently.
+
+        Polling many pending approvals one ``get_approval`` at a time pays
+        one round trip each; this issues them together via
+        :meth:`pipeline`.
+
+        Args:
+            lookups: The signed approvals to fetch.
+            max_concurrency: Most requests in flight at once.
+
+        Returns:
+            Each approval's status, or None if not found, in input order.
+
+        Raises:
+            ConnectionError: If unable to connect to the server.
+            HttpError: If the server returns an error (other than 404).
+        """
+        def status_of(lk: ApprovalLookup) -> Optional[ApprovalStatus]:
+            return self.get_approval(
+                lk.namespace, lk.tenant, lk.id, lk.sig, lk.expires_at, lk.kid
+            )
+
+        return self.pipeline(
+            [partial(status_of, lk) for lk in lookups], max_concurrency=max_concurrency
+        )
+
     def list_approvals(
         self, namespace: str, tenant: str
     ) -> ApprovalListResponse:
@@ -861,13 +1367,10 @@ class ActeonClient(
         response = self._request(
             "GET",
             "/v1/approvals",
-            params={"namespace": namespace, "tenant": tenant},
+            params=(("namespace", namespace), ("tenant", tenant)),
         )
 
-        if response.status_code == 200:
-            return ApprovalListResponse.from_dict(response.json())
-        else:
-            raise HttpError(response.status_code, "Failed to list approvals")
+        return _parse_ok(response, ApprovalListResponse.from_dict, "Failed to list approvals")
 
 
     # =========================================================================
@@ -892,14 +1395,9 @@ class ActeonClient(
         response = self._request("POST", "/v1/recurring", json=recurring.to_dict())
 
         if response.status_code == 201:
-            return CreateRecurringResponse.from_dict(response.json())
+            return CreateRecurringResponse.from_dict(_json.loads(response.content))
         else:
-            data = response.json()
-            raise ApiError(
-                code=data.get("code", "UNKNOWN"),
-                message=data.get("message", "Unknown error"),
-                retryable=data.get("retryable", False),
-            )
+            _raise_api_error(response)
 
     def list_recurring(
         self, filter: Optional[RecurringFilter] = None
@@ -919,10 +1417,9 @@ class ActeonClient(
         params = filter.to_params() if filter else {}
         response = self._request("GET", "/v1/recurring", params=params)
 
-        if response.status_code == 200:
-            return ListRecurringResponse.from_dict(response.json())
-        else:
-            raise HttpError(response.status_code, "Failed to list recurring actions")
+        return _parse_ok(
+            response, ListRecurringResponse.from_dict, "Failed to list recurring actions"
+        )
 
     def get_recurring(
         self, recurring_id: str, namespace: str, tenant: str
@@ -943,12 +1440,12 @@ class ActeonClient(
         """
         response = self._request(
             "GET",
-            f"/v1/recurring/{recurring_id}",
-            params={"namespace": namespace, "tenant": tenant},
+            f"/v1/recurring/{_seg(recurring_id)}",
+            params=(("namespace", namespace), ("tenant", tenant)),
         )
 
         if response.status_code == 200:
-            return RecurringDetail.from_dict(response.json())
+            return RecurringDetail.from_dict(_json.loads(response.content))
         elif response.status_code == 404:
             return None
         else:
@@ -972,20 +1469,15 @@ class ActeonClient(
             ApiError: If the server returns a validation error.
         """
         response = self._request(
-            "PUT", f"/v1/recurring/{recurring_id}", json=update.to_dict()
+            "PUT", f"/v1/recurring/{_seg(recurring_id)}", json=update.to_dict()
         )
 
         if response.status_code == 200:
-            return RecurringDetail.from_dict(response.json())
+            return RecurringDetail.from_dict(_json.loads(response.content))
         elif response.status_code == 404:
             raise HttpError(404, f"Recurring action not found: {recurring_id}")
         else:
-            data = response.json()
-            raise ApiError(
-                code=data.get("code", "UNKNOWN"),
-                message=data.get("message", "Unknown error"),
-                retryable=data.get("retryable", False),
-            )
+            _raise_api_error(response)
 
     def delete_recurring(
         self, recurring_id: str, namespace: str, tenant: str
@@ -1003,8 +1495,8 @@ class ActeonClient(
         """
         response = self._request(
             "DELETE",
-            f"/v1/recurring/{recurring_id}",
-            params={"namespace": namespace, "tenant": tenant},
+            f"/v1/recurring/{_seg(recurring_id)}",
+            params=(("namespace", namespace), ("tenant", tenant)),
         )
 
         if response.status_code == 204:
@@ -1033,12 +1525,12 @@ class ActeonClient(
         """
         response = self._request(
             "POST",
-            f"/v1/recurring/{recurring_id}/pause",
+            f"/v1/recurring/{_seg(recurring_id)}/pause",
             json={"namespace": namespace, "tenant": tenant},
         )
 
         if response.status_code == 200:
-            return RecurringDetail.from_dict(response.json())
+            return RecurringDetail.from_dict(_json.loads(response.content))
         elif response.status_code == 404:
             raise HttpError(404, f"Recurring action not found: {recurring_id}")
         elif response.status_code == 409:
@@ -1065,12 +1557,12 @@ class ActeonClient(
         """
         response = self._request(
             "POST",
-            f"/v1/recurring/{recurring_id}/resume",
+            f"/v1/recurring/{_seg(recurring_id)}/resume",
             json={"namespace": namespace, "tenant": tenant},
         )
 
         if response.status_code == 200:
-            return RecurringDetail.from_dict(response.json())
+            return RecurringDetail.from_dict(_json.loads(response.content))
         elif response.status_code == 404:
             raise HttpError(404, f"Recurring action not found: {recurring_id}")
         elif response.status_code == 409:
@@ -1078,6 +1570,51 @@ class ActeonClient(
         else:
             raise HttpError(response.status_code, "Failed to resume recurring action")
 
+    def pause_many_recurring(
+        self,
+        recurring_ids: Iterable[str],
+        namespace: str,
+        tenant: str,
+        *,
+        max_concurrency: int = _MAX_CONCURRENCY,
+    ) -> list[Union[RecurringDetail, ActeonError]]:
+        """Pause several recurring actions concurrently.
+
+        Each ID is paused with its own :meth:`pause_recurring` call, at
+        most ``max_concurrency`` at a time; one failure does not stop the
+        others.
+
+        Args:
+            recurring_ids: The recurring action IDs.
+            namespace: The namespace.
+            tenant: The tenant.
+            max_concurrency: Upper bound on requests in flight.
+
+        Returns:
+            One entry per ID, in order: the updated details, or the
+            :class:`ActeonError` that call raised (e.g. a 409 for an action
+            that was already paused).
+        """
+        return self._fan_out(
+            lambda i: self.pause_recurring(i, namespace, tenant), recurring_ids, max_concurrency
+        )
+
+    def resume_many_recurring(
+        self,
+        recurring_ids: Iterable[str],
+        namespace: str,
+        tenant: str,
+        *,
+        max_concurrency: int = _MAX_CONCURRENCY,
+    ) -> list[Union[RecurringDetail, ActeonError]]:
+        """Resume several paused recurring actions concurrently.
+
+        See :meth:`pause_many_recurring`.
+        """
+        return self._fan_out(
+            lambda i: self.resume_recurring(i, namespace, tenant), recurring_ids, max_concurrency
+        )
+
     # =========================================================================
     # Quotas
     # =========================================================================
@@ -1098,14 +1635,9 @@ class ActeonClient(
         response = self._request("POST", "/v1/quotas", json=req.to_dict())
 
         if response.status_code == 201:
-            return QuotaPolicy.from_dict(response.json())
+            return QuotaPolicy.from_dict(_json.loads(response.content))
         else:
-            data = response.json()
-            raise ApiError(
-                code=data.get("code", "UNKNOWN"),
-                message=data.get("message", "Unknown error"),
-                retryable=data.get("retryable", False),
-            )
+            _raise_api_error(response)
 
     def list_quotas(
         self,
@@ -1134,21 +1666,12 @@ class ActeonClient(
             ConnectionError: If unable to connect to the server.
             HttpError: If the server returns an error.
         """
-        params: dict = {}
-        if namespace is not None:
-            params["namespace"] = namespace
-        if tenant is not None:
-            params["tenant"] = tenant
-        if provider is not None:
-            params["provider"] = provider
-        if principal is not None:
-            params["principal"] = principal
+        params = _compact(
+            namespace=namespace, tenant=tenant, provider=provider, principal=principal
+        )
         response = self._request("GET", "/v1/quotas", params=params)
 
-        if response.status_code == 200:
-            return ListQuotasResponse.from_dict(response.json())
-        else:
-            raise HttpError(response.status_code, "Failed to list quotas")
+        return _parse_ok(response, ListQuotasResponse.from_dict, "Failed to list quotas")
 
     def get_quota(self, quota_id: str) -> Optional["QuotaPolicy"]:
         """Get a single quota policy by ID.
@@ -1163,10 +1686,17 @@ class ActeonClient(
             ConnectionError: If unable to connect to the server.
             HttpError: If the server returns an error (other than 404).
         """
-        response = self._request("GET", f"/v1/quotas/{quota_id}")
+        key = ("quota", quota_id)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        generation = self._cache_generation()
+        response = self._request("GET", f"/v1/quotas/{_seg(quota_id)}")
 
         if response.status_code == 200:
-            return QuotaPolicy.from_dict(response.json())
+            return self._cache_put(
+                key, QuotaPolicy.from_dict(_json.loads(response.content)), generation
+            )
         elif response.status_code == 404:
             return None
         else:
@@ -1189,21 +1719,17 @@ class ActeonClient(
             HttpError: If the quota is not found (404).
             ApiError: If the server returns a validation error.
         """
-        response = self._request(
-            "PUT", f"/v1/quotas/{quota_id}", json=update.to_dict()
-        )
+        with self._invalidating("quota", quota_id):
+            response = self._request(
+                "PUT", f"/v1/quotas/{_seg(quota_id)}", json=update.to_dict()
+            )
 
         if response.status_code == 200:
-            return QuotaPolicy.from_dict(response.json())
+            return QuotaPolicy.from_dict(_json.loads(response.content))
         elif response.status_code == 404:
             raise HttpError(404, f"Quota not found: {quota_id}")
         else:
-            data = response.json()
-            raise ApiError(
-                code=data.get("code", "UNKNOWN"),
-                message=data.get("message", "Unknown error"),
-                retryable=data.get("retryable", False),
-            )
+            _raise_api_error(response)
 
     def delete_quota(
         self, quota_id: str, namespace: str, tenant: str
@@ -1219,11 +1745,12 @@ class ActeonClient(
             ConnectionError: If unable to connect to the server.
             HttpError: If the quota is not found (404).
         """
-        response = self._request(
-            "DELETE",
-            f"/v1/quotas/{quota_id}",
-            params={"namespace": namespace, "tenant": tenant},
-        )
+        with self._invalidating("quota", quota_id):
+            response = self._request(
+                "DELETE",
+                f"/v1/quotas/{_seg(quota_id)}",
+                params=(("namespace", namespace), ("tenant", tenant)),
+            )
 
         if response.status_code == 204:
             return
@@ -1245,10 +1772,10 @@ class ActeonClient(
             ConnectionError: If unable to connect to the server.
             HttpError: If the quota is not found (404).
         """
-        response = self._request("GET", f"/v1/quotas/{quota_id}/usage")
+        response = self._request("GET", f"/v1/quotas/{_seg(quota_id)}/usage")
 
         if response.status_code == 200:
-            return QuotaUsage.from_dict(response.json())
+            return QuotaUsage.from_dict(_json.loads(response.content))
         elif response.status_code == 404:
             raise HttpError(404, f"Quota not found: {quota_id}")
         else:
@@ -1275,14 +1802,9 @@ class ActeonClient(
         response = self._request("POST", "/v1/silences", json=req.to_dict())
 
         if response.status_code == 201:
-            return Silence.from_dict(response.json())
+            return Silence.from_dict(_json.loads(response.content))
         else:
-            data = response.json()
-            raise ApiError(
-                code=data.get("code", "UNKNOWN"),
-                message=data.get("message", data.get("error", "Unknown error")),
-                retryable=data.get("retryable", False),
-            )
+            _raise_api_error(response)
 
     def list_silences(
         self,
@@ -1305,19 +1827,12 @@ class ActeonClient(
             ConnectionError: If unable to connect to the server.
             HttpError: If the server returns an error.
         """
-        params: dict = {}
-        if namespace is not None:
-            params["namespace"] = namespace
-        if tenant is not None:
-            params["tenant"] = tenant
+        params = _compact(namespace=namespace, tenant=tenant)
         if include_expired:
             params["include_expired"] = "true"
         response = self._request("GET", "/v1/silences", params=params)
 
-        if response.status_code == 200:
-            return ListSilencesResponse.from_dict(response.json())
-        else:
-            raise HttpError(response.status_code, "Failed to list silences")
+        return _parse_ok(response, ListSilencesResponse.from_dict, "Failed to list silences")
 
     def get_silence(self, silence_id: str) -> Optional["Silence"]:
         """Fetch a single silence by ID.
@@ -1332,10 +1847,10 @@ class ActeonClient(
             ConnectionError: If unable to connect to the server.
             HttpError: If the server returns an error (other than 404).
         """
-        response = self._request("GET", f"/v1/silences/{silence_id}")
+        response = self._request("GET", f"/v1/silences/{_seg(silence_id)}")
 
         if response.status_code == 200:
-            return Silence.from_dict(response.json())
+            return Silence.from_dict(_json.loads(response.content))
         elif response.status_code == 404:
             return None
         else:
@@ -1362,20 +1877,15 @@ class ActeonClient(
             ApiError: If the server returns a validation error.
         """
         response = self._request(
-            "PUT", f"/v1/silences/{silence_id}", json=update.to_dict()
+            "PUT", f"/v1/silences/{_seg(silence_id)}", json=update.to_dict()
         )
 
         if response.status_code == 200:
-            return Silence.from_dict(response.json())
+            return Silence.from_dict(_json.loads(response.content))
         elif response.status_code == 404:
             raise HttpError(404, f"Silence not found: {silence_id}")
         else:
-            data = response.json()
-            raise ApiError(
-                code=data.get("code", "UNKNOWN"),
-                message=data.get("message", data.get("error", "Unknown error")),
-                retryable=data.get("retryable", False),
-            )
+            _raise_api_error(response)
 
     def delete_silence(self, silence_id: str) -> None:
         """Expire a silence immediately.
@@ -1390,7 +1900,7 @@ class ActeonClient(
             ConnectionError: If unable to connect to the server.
             HttpError: If the silence is not found (404).
         """
-        response = self._request("DELETE", f"/v1/silences/{silence_id}")
+        response = self._request("DELETE", f"/v1/silences/{_seg(silence_id)}")
 
         if response.status_code == 204:
             return
@@ -1409,13 +1919,8 @@ class ActeonClient(
         """Create a time interval."""
         response = self._request("POST", "/v1/time-intervals", json=req.to_dict())
         if response.status_code == 201:
-            return TimeInterval.from_dict(response.json())
-        data = response.json()
-        raise ApiError(
-            code=data.get("code", "UNKNOWN"),
-            message=data.get("message", data.get("error", "Unknown error")),
-            retryable=data.get("retryable", False),
-        )
+            return TimeInterval.from_dict(_json.loads(response.content))
+        _raise_api_error(response)
 
     def list_time_intervals(
         self,
@@ -1423,25 +1928,21 @@ class ActeonClient(
         tenant: Optional[str] = None,
     ) -> "ListTimeIntervalsResponse":
         """List time intervals filtered by namespace/tenant."""
-        params: dict = {}
-        if namespace is not None:
-            params["namespace"] = namespace
-        if tenant is not None:
-            params["tenant"] = tenant
+        params = _compact(namespace=namespace, tenant=tenant)
         response = self._request("GET", "/v1/time-intervals", params=params)
-        if response.status_code == 200:
-            return ListTimeIntervalsResponse.from_dict(response.json())
-        raise HttpError(response.status_code, "Failed to list time intervals")
+        return _parse_ok(
+            response, ListTimeIntervalsResponse.from_dict, "Failed to list time intervals"
+        )
 
     def get_time_interval(
         self, namespace: str, tenant: str, name: str
     ) -> Optional["TimeInterval"]:
         """Fetch a single time interval. Returns ``None`` on 404."""
         response = self._request(
-            "GET", f"/v1/time-intervals/{namespace}/{tenant}/{name}"
+            "GET", f"/v1/time-intervals/{_seg(namespace)}/{_seg(tenant)}/{_seg(name)}"
         )
         if response.status_code == 200:
-            return TimeInterval.from_dict(response.json())
+            return TimeInterval.from_dict(_json.loads(response.content))
         if response.status_code == 404:
             return None
         raise HttpError(response.status_code, "Failed to get time interval")
@@ -1456,26 +1957,21 @@ class ActeonClient(
         """Update a time interval's ranges, location, or description."""
         response = self._request(
             "PUT",
-            f"/v1/time-intervals/{namespace}/{tenant}/{name}",
+            f"/v1/time-intervals/{_seg(namespace)}/{_seg(tenant)}/{_seg(name)}",
             json=update.to_dict(),
         )
         if response.status_code == 200:
-            return TimeInterval.from_dict(response.json())
+            return TimeInterval.from_dict(_json.loads(response.content))
         if response.status_code == 404:
             raise HttpError(404, f"Time interval not found: {name}")
-        data = response.json()
-        raise ApiError(
-            code=data.get("code", "UNKNOWN"),
-            message=data.get("message", data.get("error", "Unknown error")),
-            retryable=data.get("retryable", False),
-        )
+        _raise_api_error(response)
 
     def delete_time_interval(
         self, namespace: str, tenant: str, name: str
     ) -> None:
         """Delete a time interval."""
         response = self._request(
-            "DELETE", f"/v1/time-intervals/{namespace}/{tenant}/{name}"
+            "DELETE", f"/v1/time-intervals/{_seg(namespace)}/{_seg(tenant)}/{_seg(name)}"
         )
         if response.status_code == 204:
             return
@@ -1503,14 +1999,9 @@ class ActeonClient(
         response = self._request("POST", "/v1/retention", json=req.to_dict())
 
         if response.status_code == 201:
-            return RetentionPolicy.from_dict(response.json())
+            return RetentionPolicy.from_dict(_json.loads(response.content))
         else:
-            data = response.json()
-            raise ApiError(
-                code=data.get("code", "UNKNOWN"),
-                message=data.get("message", "Unknown error"),
-                retryable=data.get("retryable", False),
-            )
+            _raise_api_error(response)
 
     def list_retention(
         self,
@@ -1534,21 +2025,17 @@ class ActeonClient(
             ConnectionError: If unable to connect to the server.
             HttpError: If the server returns an error.
         """
-        params: dict = {}
-        if namespace is not None:
-            params["namespace"] = namespace
-        if tenant is not None:
-            params["tenant"] = tenant
-        if limit is not None:
-            params["limit"] = limit
-        if offset is not None:
-            params["offset"] = offset
+        params = _compact(
+            namespace=namespace,
+            tenant=tenant,
+            limit=limit,
+            offset=offset,
+        )
         response = self._request("GET", "/v1/retention", params=params)
 
-        if response.status_code == 200:
-            return ListRetentionResponse.from_dict(response.json())
-        else:
-            raise HttpError(response.status_code, "Failed to list retention policies")
+        return _parse_ok(
+            response, ListRetentionResponse.from_dict, "Failed to list retention policies"
+        )
 
     def get_retention(self, retention_id: str) -> Optional["RetentionPolicy"]:
         """Get a single retention policy by ID.
@@ -1563,10 +2050,10 @@ class ActeonClient(
             ConnectionError: If unable to connect to the server.
             HttpError: If the server returns an error (other than 404).
         """
-        response = self._request("GET", f"/v1/retention/{retention_id}")
+        response = self._request("GET", f"/v1/retention/{_seg(retention_id)}")
 
         if response.status_code == 200:
-            return RetentionPolicy.from_dict(response.json())
+            return RetentionPolicy.from_dict(_json.loads(response.content))
         elif response.status_code == 404:
             return None
         else:
@@ -1590,20 +2077,15 @@ class ActeonClient(
             ApiError: If the server returns a validation error.
         """
         response = self._request(
-            "PUT", f"/v1/retention/{retention_id}", json=update.to_dict()
+            "PUT", f"/v1/retention/{_seg(retention_id)}", json=update.to_dict()
         )
 
         if response.status_code == 200:
-            return RetentionPolicy.from_dict(response.json())
+            return RetentionPolicy.from_dict(_json.loads(response.content))
         elif response.status_code == 404:
             raise HttpError(404, f"Retention policy not found: {retention_id}")
         else:
-            data = response.json()
-            raise ApiError(
-                code=data.get("code", "UNKNOWN"),
-                message=data.get("message", "Unknown error"),
-                retryable=data.get("retryable", False),
-            )
+            _raise_api_error(response)
 
     def delete_retention(self, retention_id: str) -> None:
         """Delete a retention policy.
@@ -1617,7 +2099,7 @@ class ActeonClient(
         """
         response = self._request(
             "DELETE",
-            f"/v1/retention/{retention_id}",
+            f"/v1/retention/{_seg(retention_id)}",
         )
 
         if response.status_code == 204:
@@ -1647,14 +2129,9 @@ class ActeonClient(
         response = self._request("POST", "/v1/templates", json=req.to_dict())
 
         if response.status_code == 201:
-            return TemplateInfo.from_dict(response.json())
+            return TemplateInfo.from_dict(_json.loads(response.content))
         else:
-            data = response.json()
-            raise ApiError(
-                code=data.get("code", "UNKNOWN"),
-                message=data.get("message", "Unknown error"),
-                retryable=data.get("retryable", False),
-            )
+            _raise_api_error(response)
 
     def list_templates(
         self,
@@ -1674,17 +2151,10 @@ class ActeonClient(
             ConnectionError: If unable to connect to the server.
             HttpError: If the server returns an error.
         """
-        params: dict = {}
-        if namespace is not None:
-            params["namespace"] = namespace
-        if tenant is not None:
-            params["tenant"] = tenant
+        params = _compact(namespace=namespace, tenant=tenant)
         response = self._request("GET", "/v1/templates", params=params)
 
-        if response.status_code == 200:
-            return ListTemplatesResponse.from_dict(response.json())
-        else:
-            raise HttpError(response.status_code, "Failed to list templates")
+        return _parse_ok(response, ListTemplatesResponse.from_dict, "Failed to list templates")
 
     def get_template(self, template_id: str) -> Optional["TemplateInfo"]:
         """Get a single template by ID.
@@ -1699,10 +2169,10 @@ class ActeonClient(
             ConnectionError: If unable to connect to the server.
             HttpError: If the server returns an error (other than 404).
         """
-        response = self._request("GET", f"/v1/templates/{template_id}")
+        response = self._request("GET", f"/v1/templates/{_seg(template_id)}")
 
         if response.status_code == 200:
-            return TemplateInfo.from_dict(response.json())
+            return TemplateInfo.from_dict(_json.loads(response.content))
         elif response.status_code == 404:
             return None
         else:
@@ -1726,20 +2196,15 @@ class ActeonClient(
             ApiError: If the server returns a validation error.
         """
         response = self._request(
-            "PUT", f"/v1/templates/{template_id}", json=update.to_dict()
+            "PUT", f"/v1/templates/{_seg(template_id)}", json=update.to_dict()
         )
 
         if response.status_code == 200:
-            return TemplateInfo.from_dict(response.json())
+            return TemplateInfo.from_dict(_json.loads(response.content))
         elif response.status_code == 404:
             raise HttpError(404, f"Template not found: {template_id}")
         else:
-            data = response.json()
-            raise ApiError(
-                code=data.get("code", "UNKNOWN"),
-                message=data.get("message", "Unknown error"),
-                retryable=data.get("retryable", False),
-            )
+            _raise_api_error(response)
 
     def delete_template(self, template_id: str) -> None:
         """Delete a payload template.
@@ -1751,7 +2216,7 @@ class ActeonClient(
             ConnectionError: If unable to connect to the server.
             HttpError: If the template is not found (404).
         """
-        response = self._request("DELETE", f"/v1/templates/{template_id}")
+        response = self._request("DELETE", f"/v1/templates/{_seg(template_id)}")
 
         if response.status_code == 204:
             return
@@ -1776,14 +2241,9 @@ class ActeonClient(
         response = self._request("POST", "/v1/templates/profiles", json=req.to_dict())
 
         if response.status_code == 201:
-            return TemplateProfileInfo.from_dict(response.json())
+            return TemplateProfileInfo.from_dict(_json.loads(response.content))
         else:
-            data = response.json()
-            raise ApiError(
-                code=data.get("code", "UNKNOWN"),
-                message=data.get("message", "Unknown error"),
-                retryable=data.get("retryable", False),
-            )
+            _raise_api_error(response)
 
     def list_profiles(
         self,
@@ -1803,17 +2263,10 @@ class ActeonClient(
             ConnectionError: If unable to connect to the server.
             HttpError: If the server returns an error.
         """
-        params: dict = {}
-        if namespace is not None:
-            params["namespace"] = namespace
-        if tenant is not None:
-            params["tenant"] = tenant
+        params = _compact(namespace=namespace, tenant=tenant)
         response = self._request("GET", "/v1/templates/profiles", params=params)
 
-        if response.status_code == 200:
-            return ListProfilesResponse.from_dict(response.json())
-        else:
-            raise HttpError(response.status_code, "Failed to list profiles")
+        return _parse_ok(response, ListProfilesResponse.from_dict, "Failed to list profiles")
 
     def get_profile(self, profile_id: str) -> Optional["TemplateProfileInfo"]:
         """Get a single template profile by ID.
@@ -1828,10 +2281,10 @@ class ActeonClient(
             ConnectionError: If unable to connect to the server.
             HttpError: If the server returns an error (other than 404).
         """
-        response = self._request("GET", f"/v1/templates/profiles/{profile_id}")
+        response = self._request("GET", f"/v1/templates/profiles/{_seg(profile_id)}")
 
         if response.status_code == 200:
-            return TemplateProfileInfo.from_dict(response.json())
+            return TemplateProfileInfo.from_dict(_json.loads(response.content))
         elif response.status_code == 404:
             return None
         else:
@@ -1855,20 +2308,15 @@ class ActeonClient(
             ApiError: If the server returns a validation error.
         """
         response = self._request(
-            "PUT", f"/v1/templates/profiles/{profile_id}", json=update.to_dict()
+            "PUT", f"/v1/templates/profiles/{_seg(profile_id)}", json=update.to_dict()
         )
 
         if response.status_code == 200:
-            return TemplateProfileInfo.from_dict(response.json())
+            return TemplateProfileInfo.from_dict(_json.loads(response.content))
         elif response.status_code == 404:
             raise HttpError(404, f"Profile not found: {profile_id}")
         else:
-            data = response.json()
-            raise ApiError(
-                code=data.get("code", "UNKNOWN"),
-                message=data.get("message", "Unknown error"),
-                retryable=data.get("retryable", False),
-            )
+            _raise_api_error(response)
 
     def delete_profile(self, profile_id: str) -> None:
         """Delete a template profile.
@@ -1880,7 +2328,7 @@ class ActeonClient(
             ConnectionError: If unable to connect to the server.
             HttpError: If the profile is not found (404).
         """
-        response = self._request("DELETE", f"/v1/templates/profiles/{profile_id}")
+        response = self._request("DELETE", f"/v1/templates/profiles/{_seg(profile_id)}")
 
         if response.status_code == 204:
             return
@@ -1905,14 +2353,9 @@ class ActeonClient(
         response = self._request("POST", "/v1/templates/render", json=req.to_dict())
 
         if response.status_code == 200:
-            return RenderPreviewResponse.from_dict(response.json())
+            return RenderPreviewResponse.from_dict(_json.loads(response.content))
         else:
-            data = response.json()
-            raise ApiError(
-                code=data.get("code", "UNKNOWN"),
-                message=data.get("message", "Unknown error"),
-                retryable=data.get("retryable", False),
-            )
+            _raise_api_error(response)
 
     # =========================================================================
     # Provider Health
@@ -1930,10 +2373,9 @@ class ActeonClient(
         """
         response = self._request("GET", "/v1/providers/health")
 
-        if response.status_code == 200:
-            return ListProviderHealthResponse.from_dict(response.json())
-        else:
-            raise HttpError(response.status_code, "Failed to list provider health")
+        return _parse_ok(
+            response, ListProviderHealthResponse.from_dict, "Failed to list provider health"
+        )
 
     # =========================================================================
     # WASM Plugins
@@ -1951,10 +2393,7 @@ class ActeonClient(
         """
         response = self._request("GET", "/v1/plugins")
 
-        if response.status_code == 200:
-            return ListPluginsResponse.from_dict(response.json())
-        else:
-            raise HttpError(response.status_code, "Failed to list plugins")
+        return _parse_ok(response, ListPluginsResponse.from_dict, "Failed to list plugins")
 
     def register_plugin(self, req: "RegisterPluginRequest") -> "WasmPlugin":
         """Register a new WASM plugin.
@@ -1972,14 +2411,9 @@ class ActeonClient(
         response = self._request("POST", "/v1/plugins", json=req.to_dict())
 
         if response.status_code in (200, 201):
-            return WasmPlugin.from_dict(response.json())
+            return WasmPlugin.from_dict(_json.loads(response.content))
         else:
-            data = response.json()
-            raise ApiError(
-                code=data.get("code", "UNKNOWN"),
-                message=data.get("message", "Unknown error"),
-                retryable=data.get("retryable", False),
-            )
+            _raise_api_error(response)
 
     def get_plugin(self, name: str) -> Optional["WasmPlugin"]:
         """Get details of a registered WASM plugin.
@@ -1994,10 +2428,10 @@ class ActeonClient(
             ConnectionError: If unable to connect to the server.
             HttpError: If the server returns an error (other than 404).
         """
-        response = self._request("GET", f"/v1/plugins/{name}")
+        response = self._request("GET", f"/v1/plugins/{_seg(name)}")
 
         if response.status_code == 200:
-            return WasmPlugin.from_dict(response.json())
+            return WasmPlugin.from_dict(_json.loads(response.content))
         elif response.status_code == 404:
             return None
         else:
@@ -2013,7 +2447,7 @@ class ActeonClient(
             ConnectionError: If unable to connect to the server.
             HttpError: If the plugin is not found (404).
         """
-        response = self._request("DELETE", f"/v1/plugins/{name}")
+        response = self._request("DELETE", f"/v1/plugins/{_seg(name)}")
 
         if response.status_code == 204:
             return
@@ -2040,20 +2474,15 @@ class ActeonClient(
             ApiError: If the server returns a validation error.
         """
         response = self._request(
-            "POST", f"/v1/plugins/{name}/invoke", json=req.to_dict()
+            "POST", f"/v1/plugins/{_seg(name)}/invoke", json=req.to_dict()
         )
 
         if response.status_code == 200:
-            return PluginInvocationResponse.from_dict(response.json())
+            return PluginInvocationResponse.from_dict(_json.loads(response.content))
         elif response.status_code == 404:
             raise HttpError(404, f"Plugin not found: {name}")
         else:
-            data = response.json()
-            raise ApiError(
-                code=data.get("code", "UNKNOWN"),
-                message=data.get("message", "Unknown error"),
-                retryable=data.get("retryable", False),
-            )
+            _raise_api_error(response)
 
     # =========================================================================
     # Compliance (SOC2/HIPAA)
@@ -2070,10 +2499,7 @@ class ActeonClient(
             HttpError: On non-200 responses.
         """
         response = self._request("GET", "/v1/compliance/status")
-        if response.status_code == 200:
-            return ComplianceStatus.from_dict(response.json())
-        else:
-            raise HttpError(response.status_code, "Failed to get compliance status")
+        return _parse_ok(response, ComplianceStatus.from_dict, "Failed to get compliance status")
 
     def verify_audit_chain(
         self, req: "VerifyHashChainRequest"
@@ -2092,10 +2518,7 @@ class ActeonClient(
             HttpError: On non-200 responses.
         """
         response = self._request("POST", "/v1/audit/verify", json=req.to_dict())
-        if response.status_code == 200:
-            return HashChainVerification.from_dict(response.json())
-        else:
-            raise HttpError(response.status_code, "Failed to verify audit chain")
+        return _parse_ok(response, HashChainVerification.from_dict, "Failed to verify audit chain")
 
     # =========================================================================
     # Chains
@@ -2118,15 +2541,10 @@ class ActeonClient(
             ConnectionError: If unable to connect to the server.
             HttpError: If the server returns an error.
         """
-        params: dict = {"namespace": namespace, "tenant": tenant}
-        if status is not None:
-            params["status"] = status
+        params = _compact(namespace=namespace, tenant=tenant, status=status)
         response = self._request("GET", "/v1/chains", params=params)
 
-        if response.status_code == 200:
-            return ListChainsResponse.from_dict(response.json())
-        else:
-            raise HttpError(response.status_code, "Failed to list chains")
+        return _parse_ok(response, ListChainsResponse.from_dict, "Failed to list chains")
 
     def get_chain(
         self, chain_id: str, namespace: str, tenant: str
@@ -2145,14 +2563,21 @@ class ActeonClient(
             ConnectionError: If unable to connect to the server.
             HttpError: If the server returns an error (other than 404).
         """
+        key = ("chain", chain_id, namespace, tenant)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        generation = self._cache_generation()
         response = self._request(
             "GET",
-            f"/v1/chains/{chain_id}",
-            params={"namespace": namespace, "tenant": tenant},
+            f"/v1/chains/{_seg(chain_id)}",
+            params=(("namespace", namespace), ("tenant", tenant)),
         )
 
         if response.status_code == 200:
-            return ChainDetailResponse.from_dict(response.json())
+            return self._cache_put(
+                key, ChainDetailResponse.from_dict(_json.loads(response.content)), generation
+            )
         elif response.status_code == 404:
             return None
         else:
@@ -2183,18 +2608,17 @@ class ActeonClient(
             ConnectionError: If unable to connect to the server.
             HttpError: If the chain is not found (404) or already finished (409).
         """
-        body: dict = {"namespace": namespace, "tenant": tenant}
-        if reason is not None:
-            body["reason"] = reason
-        if cancelled_by is not None:
-            body["cancelled_by"] = cancelled_by
+        body = _compact(
+            namespace=namespace, tenant=tenant, reason=reason, cancelled_by=cancelled_by
+        )
 
-        response = self._request(
-            "POST", f"/v1/chains/{chain_id}/cancel", json=body
-        )
+        with self._invalidating("chain", chain_id):
+            response = self._request(
+                "POST", f"/v1/chains/{_seg(chain_id)}/cancel", json=body
+            )
 
         if response.status_code == 200:
-            return ChainDetailResponse.from_dict(response.json())
+            return ChainDetailResponse.from_dict(_json.loads(response.content))
         elif response.status_code == 404:
             raise HttpError(404, f"Chain not found: {chain_id}")
         elif response.status_code == 409:
@@ -2202,6 +2626,43 @@ class ActeonClient(
         else:
             raise HttpError(response.status_code, "Failed to cancel chain")
 
+    def cancel_many_chains(
+        self,
+        chain_ids: Iterable[str],
+        namespace: str,
+        tenant: str,
+        *,
+        reason: Optional[str] = None,
+        cancelled_by: Optional[str] = None,
+        max_concurrency: int = _MAX_CONCURRENCY,
+    ) -> list[Union[ChainDetailResponse, ActeonError]]:
+        """Cancel several running chains concurrently.
+
+        Each chain is cancelled with its own :meth:`cancel_chain` call, at
+        most ``max_concurrency`` at a time; one failure does not stop the
+        others.
+
+        Args:
+            chain_ids: The chain execution IDs.
+            namespace: The namespace.
+            tenant: The tenant.
+            reason: Optional reason recorded on every cancellation.
+            cancelled_by: Optional identifier of who cancelled the chains.
+            max_concurrency: Upper bound on requests in flight.
+
+        Returns:
+            One entry per ID, in order: the updated chain, or the
+            :class:`ActeonError` that call raised (e.g. a 409 for a chain
+            that already finished).
+        """
+        return self._fan_out(
+            lambda i: self.cancel_chain(
+                i, namespace, tenant, reason=reason, cancelled_by=cancelled_by
+            ),
+            chain_ids,
+            max_concurrency,
+        )
+
     def get_chain_dag(
         self, chain_id: str, namespace: str, tenant: str
     ) -> DagResponse:
@@ -2221,12 +2682,12 @@ class ActeonClient(
         """
         response = self._request(
             "GET",
-            f"/v1/chains/{chain_id}/dag",
-            params={"namespace": namespace, "tenant": tenant},
+            f"/v1/chains/{_seg(chain_id)}/dag",
+            params=(("namespace", namespace), ("tenant", tenant)),
         )
 
         if response.status_code == 200:
-            return DagResponse.from_dict(response.json())
+            return DagResponse.from_dict(_json.loads(response.content))
         elif response.status_code == 404:
             raise HttpError(404, f"Chain not found: {chain_id}")
         else:
@@ -2247,11 +2708,11 @@ class ActeonClient(
         """
         response = self._request(
             "GET",
-            f"/v1/chains/definitions/{name}/dag",
+            f"/v1/chains/definitions/{_seg(name)}/dag",
         )
 
         if response.status_code == 200:
-            return DagResponse.from_dict(response.json())
+            return DagResponse.from_dict(_json.loads(response.content))
         elif response.status_code == 404:
             raise HttpError(404, f"Chain definition not found: {name}")
         else:
@@ -2278,12 +2739,12 @@ class ActeonClient(
         """
         response = self._request(
             "GET",
-            f"/v1/chains/{chain_id}/history",
-            params={"namespace": namespace, "tenant": tenant},
+            f"/v1/chains/{_seg(chain_id)}/history",
+            params=(("namespace", namespace), ("tenant", tenant)),
         )
 
         if response.status_code == 200:
-            return ChainHistoryResponse.from_dict(response.json())
+            return ChainHistoryResponse.from_dict(_json.loads(response.content))
         elif response.status_code == 404:
             raise HttpError(404, f"Chain not found: {chain_id}")
         else:
@@ -2307,10 +2768,7 @@ class ActeonClient(
         """
         response = self._request("GET", "/v1/dlq/stats")
 
-        if response.status_code == 200:
-            return DlqStatsResponse.from_dict(response.json())
-        else:
-            raise HttpError(response.status_code, "Failed to get DLQ stats")
+        return _parse_ok(response, DlqStatsResponse.from_dict, "Failed to get DLQ stats")
 
     def dlq_drain(self) -> DlqDrainResponse:
         """Drain all entries from the dead-letter queue.
@@ -2328,7 +2786,7 @@ class ActeonClient(
         response = self._request("POST", "/v1/dlq/drain")
 
         if response.status_code == 200:
-            return DlqDrainResponse.from_dict(response.json())
+            return DlqDrainResponse.from_dict(_json.loads(response.content))
         elif response.status_code == 404:
             raise HttpError(404, "Dead-letter queue is not enabled")
         else:
@@ -2378,34 +2836,23 @@ class ActeonClient(
             ConnectionError: If unable to connect to the server.
             HttpError: If the server returns an error.
         """
-        params: dict[str, str] = {"metric": metric}
-        if namespace is not None:
-            params["namespace"] = namespace
-        if tenant is not None:
-            params["tenant"] = tenant
-        if provider is not None:
-            params["provider"] = provider
-        if action_type is not None:
-            params["action_type"] = action_type
-        if outcome is not None:
-            params["outcome"] = outcome
-        if interval is not None:
-            params["interval"] = interval
-        if from_time is not None:
-            params["from"] = from_time
-        if to_time is not None:
-            params["to"] = to_time
-        if group_by is not None:
-            params["group_by"] = group_by
-        if top_n is not None:
-            params["top_n"] = str(top_n)
+        params = _compact(
+            metric=metric,
+            namespace=namespace,
+            tenant=tenant,
+            provider=provider,
+            action_type=action_type,
+            outcome=outcome,
+            interval=interval,
+            **{"from": from_time},
+            to=to_time,
+            group_by=group_by,
+            top_n=None if top_n is None else str(top_n),
+        )
 
         response = self._request("GET", "/v1/analytics", params=params)
 
-        if response.status_code == 200:
-            return AnalyticsResponse.from_dict(response.json())
-        else:
-            raise HttpError(response.status_code, "Failed to query analytics")
+        return _parse_ok(response, AnalyticsResponse.from_dict, "Failed to query analytics")
 
     # =========================================================================
     # Rule Coverage
@@ -2431,21 +2878,16 @@ class ActeonClient(
         """
         params: dict[str, str] = {}
         if query is not None:
-            if query.namespace is not None:
-                params["namespace"] = query.namespace
-            if query.tenant is not None:
-                params["tenant"] = query.tenant
-            if query.from_time is not None:
-                params["from"] = query.from_time
-            if query.to_time is not None:
-                params["to"] = query.to_time
+            params = _compact(
+                namespace=query.namespace,
+                tenant=query.tenant,
+                **{"from": query.from_time},
+                to=query.to_time,
+            )
 
         response = self._request("GET", "/v1/rules/coverage", params=params)
 
-        if response.status_code == 200:
-            return CoverageReport.from_dict(response.json())
-        else:
-            raise HttpError(response.status_code, "Failed to get rule coverage")
+        return _parse_ok(response, CoverageReport.from_dict, "Failed to get rule coverage")
 
     # =========================================================================
     # Subscribe (SSE)
@@ -2459,6 +2901,8 @@ class ActeonClient(
         namespace: Optional[str] = None,
         tenant: Optional[str] = None,
         include_history: bool = True,
+        chunk_size: Optional[int] = None,
+        max_event_size: Optional[int] = SSE_MAX_EVENT_SIZE,
     ) -> Iterator[SseEvent]:
         """Subscribe to events for a specific entity via SSE.
 
@@ -2471,6 +2915,11 @@ class ActeonClient(
             namespace: Namespace for tenant isolation (required for chain/group).
             tenant: Tenant for tenant isolation (required for chain/group).
             include_history: Emit catch-up events for current state (default: True).
+            chunk_size: Read size for the response body; ``None`` takes
+                data as it arrives.
+            max_event_size: Upper bound on one event's buffered data; a
+                larger event raises :class:`ActeonError`. ``None`` disables
+                the check.
 
         Yields:
             Parsed SseEvent objects.
@@ -2479,26 +2928,22 @@ class ActeonClient(
             ConnectionError: If unable to connect to the server.
             HttpError: If the server returns an error.
         """
-        params: dict = {"include_history": str(include_history).lower()}
-        if namespace is not None:
-            params["namespace"] = namespace
-        if tenant is not None:
-            params["tenant"] = tenant
+        params = _compact(
+            include_history=str(include_history).lower(),
+            namespace=namespace,
+            tenant=tenant,
+        )
 
-        url = f"{self.base_url}/v1/subscribe/{entity_type}/{entity_id}"
-        headers = self._headers()
-        headers["Accept"] = "text/event-stream"
-        # Remove Content-Type for GET streaming requests.
-        headers.pop("Content-Type", None)
+        url = f"/v1/subscribe/{_seg(entity_type)}/{_seg(entity_id)}"
 
         try:
-            with self._client.stream(
-                "GET", url, params=params, headers=headers
-            ) as response:
+            with _open_sse(self._client, url, params=params) as response:
                 if response.status_code != 200:
-                    response.read()
-                    raise HttpError(response.status_code, "Failed to subscribe")
-                yield from _parse_sse_stream(response.iter_lines())
+                    body = _read_sse_error(response)
+                    raise HttpError(response.status_code, body or "Failed to subscribe")
+                yield from _parse_sse_bytes(
+                    response.iter_bytes(chunk_size), max_event_size
+                )
         except httpx.ConnectError as e:
             raise ConnectionError(str(e)) from e
         except httpx.TimeoutException as e:
@@ -2519,6 +2964,8 @@ class ActeonClient(
         group_id: Optional[str] = None,
         action_id: Optional[str] = None,
         last_event_id: Optional[str] = None,
+        chunk_size: Optional[int] = None,
+        max_event_size: Optional[int] = SSE_MAX_EVENT_SIZE,
     ) -> Iterator[SseEvent]:
         """Subscribe to the real-time event stream via SSE.
 
@@ -2534,6 +2981,11 @@ class ActeonClient(
             group_id: Filter events by group ID.
             action_id: Filter events by action ID.
             last_event_id: Reconnection token; replays missed events from this ID.
+            chunk_size: Read size for the response body; ``None`` takes
+                data as it arrives.
+            max_event_size: Upper bound on one event's buffered data; a
+                larger event raises :class:`ActeonError`. ``None`` disables
+                the check.
 
         Yields:
             Parsed SseEvent objects.
@@ -2542,38 +2994,29 @@ class ActeonClient(
             ConnectionError: If unable to connect to the server.
             HttpError: If the server returns an error.
         """
-        params: dict = {}
-        if namespace is not None:
-            params["namespace"] = namespace
-        if action_type is not None:
-            params["action_type"] = action_type
-        if outcome is not None:
-            params["outcome"] = outcome
-        if event_type is not None:
-            params["event_type"] = event_type
-        if chain_id is not None:
-            params["chain_id"] = chain_id
-        if group_id is not None:
-            params["group_id"] = group_id
-        if action_id is not None:
-            params["action_id"] = action_id
-
-        url = f"{self.base_url}/v1/stream"
-        headers = self._headers()
-        headers["Accept"] = "text/event-stream"
-        # Remove Content-Type for GET streaming requests.
-        headers.pop("Content-Type", None)
+        params = _compact(
+            namespace=namespace,
+            action_type=action_type,
+            outcome=outcome,
+            event_type=event_type,
+            chain_id=chain_id,
+            group_id=group_id,
+            action_id=action_id,
+        )
+
+        url = "/v1/stream"
+        headers = None
         if last_event_id is not None:
-            headers["Last-Event-ID"] = last_event_id
+            headers = {"Last-Event-ID": last_event_id}
 
         try:
-            with self._client.stream(
-                "GET", url, params=params, headers=headers
-            ) as response:
+            with _open_sse(self._client, url, params=params, headers=headers) as response:
                 if response.status_code != 200:
-                    response.read()
-                    raise HttpError(response.status_code, "Failed to open stream")
-                yield from _parse_sse_stream(response.iter_lines())
+                    body = _read_sse_error(response)
+                    raise HttpError(response.status_code, body or "Failed to open stream")
+                yield from _parse_sse_bytes(
+                    response.iter_bytes(chunk_size), max_event_size
+                )
         except httpx.ConnectError as e:
             raise ConnectionError(str(e)) from e
         except httpx.TimeoutException as e:
@@ -2590,28 +3033,24 @@ class ActeonClient(
         """List swarm runs tracked by the server-side registry."""
         params = filter.to_params() if filter else {}
         response = self._request("GET", "/v1/swarm/runs", params=params)
-        if response.status_code == 200:
-            return ListSwarmRunsResponse.from_dict(response.json())
-        raise HttpError(response.status_code, "Failed to list swarm runs")
+        return _parse_ok(response, ListSwarmRunsResponse.from_dict, "Failed to list swarm runs")
 
     def get_swarm_run(self, run_id: str) -> Optional[SwarmRunSnapshot]:
         """Fetch a single swarm run snapshot. Returns ``None`` if unknown."""
-        # quote() with safe="" encodes '/', '?', and '#' — otherwise a
-        # maliciously crafted run_id could inject path/query segments.
-        encoded = quote(run_id, safe="")
-        response = self._request("GET", f"/v1/swarm/runs/{encoded}")
+        # _seg() encodes '/', '?', and '#' — otherwise a maliciously
+        # crafted run_id could inject path/query segments.
+        response = self._request("GET", f"/v1/swarm/runs/{_seg(run_id)}")
         if response.status_code == 200:
-            return SwarmRunSnapshot.from_dict(response.json())
+            return SwarmRunSnapshot.from_dict(_json.loads(response.content))
         if response.status_code == 404:
             return None
         raise HttpError(response.status_code, "Failed to fetch swarm run")
 
     def cancel_swarm_run(self, run_id: str) -> Optional[SwarmRunSnapshot]:
         """Request cancellation of an inflight swarm run."""
-        encoded = quote(run_id, safe="")
-        response = self._request("POST", f"/v1/swarm/runs/{encoded}/cancel")
+        response = self._request("POST", f"/v1/swarm/runs/{_seg(run_id)}/cancel")
         if response.status_code == 200:
-            return SwarmRunSnapshot.from_dict(response.json())
+            return SwarmRunSnapshot.from_dict(_json.loads(response.content))
         if response.status_code == 404:
             return None
         raise HttpError(response.status_code, "Failed to cancel swarm run")
@@ -2622,6 +3061,7 @@ class AsyncActeonClient(
     _AsyncBusClientMixin,
     _AsyncQueuesClientMixin,
     _AsyncWorkflowsClientMixin,
+    _CachedLookupsMixin,
 ):
     """Async HTTP client for the Acteon action gateway.
 
@@ -2642,6 +3082,14 @@ class AsyncActeonClient(
         client_cert_path: Optional[str] = None,
         client_key_path: Optional[str] = None,
         verify_ssl: bool = True,
+        http2: bool = False,
+        max_connections: Optional[int] = 100,
+        max_keepalive_connections: Optional[int] = 100,
+        keepalive_expiry: Optional[float] = 30.0,
+        max_retries: int = 0,
+        uds: Optional[str] = None,
+        cache_ttl: Optional[float] = None,
+        cache_maxsize: int = 1024,
     ):
         """Create a new async Acteon client.
 
@@ -2658,12 +3106,92 @@ class AsyncActeonClient(
             verify_ssl: Set to ``False`` to skip certificate verification
                 (for development/testing only). Ignored when ``ca_cert_path``
                 is provided.
+            http2: Negotiate HTTP/2 over TLS so concurrent requests are
+                multiplexed on one connection. Requires the ``http2`` extra
+                (``pip install acteon-client[http2]``).
+            max_connections: Upper bound on concurrent connections in the
+                pool (``None`` for unlimited).
+            max_keepalive_connections: How many idle connections to keep
+                open for reuse (``None`` for unlimited). Defaults to 100,
+                the same as the ``max_connections`` default, so bursts of
+                concurrent calls don't churn through fresh handshakes;
+                lowering ``max_connections`` does not lower it.
+            keepalive_expiry: Seconds an idle pooled connection is kept.
+            max_retries: Retry requests answered with ``429`` (or, for
+                idempotent methods, ``503``) up to this many times, waiting
+                for ``Retry-After`` (or an exponential backoff) on the same
+                pooled connection. ``POST`` dispatches are not re-sent on
+                ``503``, since a proxy may return it after the server acted.
+                Also retries failed connection attempts. ``0`` disables
+                retries.
+            uds: Path of a Unix domain socket to connect through instead
+                of TCP, for a gateway (or proxy) on the same host.
+                ``base_url`` still supplies the scheme, ``Host`` header and
+                path prefix, e.g. ``"http://localhost"``.
+            cache_ttl: Keep the parsed results of ``list_rules``,
+                ``get_quota``, ``get_chain``, ``get_event``, ``get_group``
+                and ``get_audit_record`` for this many seconds, so repeated
+                lookups skip the request. Off by default. Cached objects
+                are shared between callers; don't mutate them.
+            cache_maxsize: Most lookups kept when caching is on.
         """
         self.base_url = base_url.rstrip("/")
-        self.api_key = api_key
+        self._api_key = api_key
+        self._get_cache = _TTLCache(cache_maxsize, cache_ttl) if cache_ttl else None
+        # Becomes "GET" once the server (or a proxy) rejects HEAD /health.
+        self._health_method = "HEAD"
+        # Lookups currently on the wire, shared by concurrent identical
+        # calls; see _coalesce(). Keys start ``(kind, ident, ...)`` like
+        # cache keys, so _cache_discard() can drop them too.
+        self._inflight: dict[tuple[Any, ...], asyncio.Future[Any]] = {}
         verify: Union[bool, str] = ca_cert_path if ca_cert_path else verify_ssl
         cert = (client_cert_path, client_key_path) if client_cert_path and client_key_path else None
-        self._client = httpx.AsyncClient(timeout=timeout, verify=verify, cert=cert)
+        limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        transport: Optional[httpx.AsyncBaseTransport] = None
+        if max_retries or uds:
+            # httpx ignores the TLS/pool arguments below once a transport
+            # is given, so the explicit transport gets them instead.
+            transport = httpx.AsyncHTTPTransport(
+                verify=verify,
+                cert=cert,
+                http2=http2,
+                limits=limits,
+                retries=max_retries,
+                uds=uds,
+            )
+            if max_retries:
+                transport = AsyncRetryTransport(transport, max_retries=max_retries)
+        # Content-Type and auth live on the httpx client itself, so
+        # requests don't carry (or rebuild) a headers dict each call.
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=_build_headers(api_key),
+            timeout=timeout,
+            verify=verify,
+            cert=cert,
+            http2=http2,
+            limits=limits,
+            transport=transport,
+        )
+
+    @property
+    def api_key(self) -> Optional[str]:
+        """API key sent as ``Authorization: Bearer <key>``."""
+        return self._api_key
+
+    @api_key.setter
+    def api_key(self, value: Optional[str]) -> None:
+        self._api_key = value
+        if value:
+            self._client.headers["Authorization"] = f"Bearer {value}"
+        else:
+            self._client.headers.pop("Authorization", None)
+        # Cached lookups belong to the previous principal.
+        self.cache_clear()
 
     async def __aenter__(self):
         return self
@@ -2674,40 +3202,35 @@ class AsyncActeonClient(
     async def close(self):
         await self._client.aclose()
 
-    def _headers(self) -> dict[str, str]:
-        headers = {"Content-Type": "application/json"}
-        if self.api_key:
-            headers["Authorization"] = f"Bearer {self.api_key}"
-        return headers
+    async def aclose(self):
+        """Alias of :meth:`close`, matching ``httpx.AsyncClient.aclose``."""
+        await self.close()
 
     async def _request(
         self,
         method: str,
         path: str,
         *,
-        json: Optional[dict] = None,
-        params: Optional[dict] = None,
+        json: Optional[Any] = None,
+        params: Optional[Union[dict, tuple]] = None,
         extra_headers: Optional[dict[str, str]] = None,
         skip_auth: bool = False,
+        content: Optional[bytes] = None,
     ) -> httpx.Response:
         """Async counterpart of the sync ``_request``.
 
         See the sync version's docstring for the ``extra_headers`` /
-        ``skip_auth`` semantics.
+        ``skip_auth`` / ``content`` semantics.
         """
-        url = f"{self.base_url}{path}"
-        headers = {"Content-Type": "application/json"} if skip_auth else self._headers()
-        if extra_headers:
-            headers.update(extra_headers)
+        if content is None and json is not None:
+            content = _json.dumps(json)
         try:
-            response = await self._client.request(
-                method,
-                url,
-                json=json,
-                params=params,
-                headers=headers,
+            request = self._client.build_request(
+                method, path, content=content, params=params, headers=extra_headers
             )
-            return response
+            if skip_auth:
+                request.headers.pop("Authorization", None)
+            return await self._client.send(request)
         except httpx.ConnectError as e:
             raise ConnectionError(str(e)) from e
         except httpx.TimeoutException as e:
@@ -2715,11 +3238,22 @@ class AsyncActeonClient(
 
     async def health(self) -> bool:
         try:
-            response = await self._request("GET", "/health")
+            response = await self._request(self._health_method, "/health")
+            if response.status_code in _HEAD_UNSUPPORTED and self._health_method == "HEAD":
+                self._health_method = "GET"
+                response = await self._request("GET", "/health")
             return response.status_code == 200
         except ConnectionError:
             return False
 
+    async def warmup(self, connections: int = 1) -> None:
+        """Open pooled connections before the first real request.
+
+        Gathers ``connections`` concurrent :meth:`health` probes; see
+        :meth:`ActeonClient.warmup`.
+        """
+        await asyncio.gather(*(self.health() for _ in range(max(connections, 1))))
+
     async def fetch_signing_keys(self) -> SigningKeysResponse:
         """Fetch the server's active signing keyring.
 
@@ -2731,7 +3265,7 @@ class AsyncActeonClient(
         if response.status_code != 200:
             raise HttpError(response.status_code, "Failed to fetch signing keys")
         try:
-            return SigningKeysResponse.from_dict(response.json())
+            return SigningKeysResponse.from_dict(_json.loads(response.content))
         except ValueError as e:
             raise ConnectionError(
                 f"malformed signing keys response: {e}"
@@ -2740,19 +3274,14 @@ class AsyncActeonClient(
     async def dispatch(
         self, action: Action, *, dry_run: bool = False
     ) -> ActionOutcome:
-        params = {"dry_run": "true"} if dry_run else None
+        params = _DRY_RUN_PARAMS if dry_run else None
         response = await self._request(
             "POST", "/v1/dispatch", json=action.to_dict(), params=params
         )
         if response.status_code == 200:
-            return ActionOutcome.from_dict(response.json())
+            return ActionOutcome.from_dict(_json.loads(response.content))
         else:
-            data = response.json()
-            raise ApiError(
-                code=data.get("code", "UNKNOWN"),
-                message=data.get("message", "Unknown error"),
-                retryable=data.get("retryable", False),
-            )
+            _raise_api_error(response)
 
     async def dispatch_dry_run(self, action: Action) -> ActionOutcome:
         return await self.dispatch(action, dry_run=True)
@@ -2760,48 +3289,182 @@ class AsyncActeonClient(
     async def dispatch_batch(
         self, actions: list[Action], *, dry_run: bool = False
     ) -> list[BatchResult]:
-        params = {"dry_run": "true"} if dry_run else None
+        if not actions:
+            return []
+        params = _DRY_RUN_PARAMS if dry_run else None
         response = await self._request(
             "POST",
             "/v1/dispatch/batch",
-            json=[a.to_dict() for a in actions],
+            content=_json.dumps([a.to_dict() for a in actions]),
             params=params,
         )
         if response.status_code == 200:
-            return [BatchResult.from_dict(r) for r in response.json()]
+            return [BatchResult.from_dict(r) for r in _json.loads(response.content)]
         else:
-            data = response.json()
-            raise ApiError(
-                code=data.get("code", "UNKNOWN"),
-                message=data.get("message", "Unknown error"),
-                retryable=data.get("retryable", False),
-            )
+            _raise_api_error(response)
 
     async def dispatch_batch_dry_run(
         self, actions: list[Action]
     ) -> list[BatchResult]:
         return await self.dispatch_batch(actions, dry_run=True)
 
+    async def dispatch_many(
+        self,
+        actions: list[Action],
+        *,
+        dry_run: bool = False,
+        max_concurrency: int = _MAX_CONCURRENCY,
+    ) -> list[BatchResult]:
+        """Dispatch actions as concurrent individual requests.
+
+        See :meth:`ActeonClient.dispatch_many` — this is the async
+        counterpart, fanning the requests out with ``asyncio.gather``. At
+        most ``max_concurrency`` requests are in flight at once, so a large
+        list neither queues behind the connection pool's ``pool`` timeout
+        nor floods the server.
+        """
+        return _batch_results(
+            await self._fan_out(
+                lambda a: self.dispatch(a, dry_run=dry_run), actions, max_concurrency
+            )
+        )
+
+    async def dispatch_batch_many(
+        self,
+        actions: list[Action],
+        *,
+        dry_run: bool = False,
+        batch_size: int = _MAX_BATCH_SIZE,
+        max_concurrency: int = _MAX_BATCH_CONCURRENCY,
+    ) -> list[BatchResult]:
+        """Dispatch a large action list as concurrent batch requests.
+
+        See :meth:`ActeonClient.dispatch_batch_many` — the slices are
+        gathered on the event loop.
+        """
+        slices = _batch_slices(actions, batch_size)
+        outcomes = await self._fan_out(
+            lambda chunk: self.dispatch_batch(chunk, dry_run=dry_run), slices, max_concurrency
+        )
+        return _join_batches(slices, outcomes)
+
+    async def _coalesce(
+        self, key: tuple[Any, ...], fetch: Callable[[], Awaitable[_T]]
+    ) -> _T:
+        """Await ``fetch()``, sharing one in-flight call per ``key``.
+
+        Concurrent callers of the same idempotent lookup get the result
+        (or exception) of a single request; the entry is dropped as soon
+        as it completes, so later calls go back to the server. A mutation
+        of the entity drops it too (see :meth:`_cache_discard`), so a
+        lookup starting after the write never joins a read issued before
+        it. The shared task is shielded, so a cancelled caller does not
+        cancel it for the others.
+        """
+        pending = self._inflight.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(fetch())
+            self._inflight[key] = pending
+
+            def forget(done: asyncio.Future[Any]) -> None:
+                if self._inflight.get(key) is done:
+                    del self._inflight[key]
+
+            pending.add_done_callback(forget)
+        return await asyncio.shield(pending)
+
+    def _cache_discard(self, kind: str, ident: str) -> None:
+        super()._cache_discard(kind, ident)
+        stale = [k for k in self._inflight if k[0] == kind and k[1] == ident]
+        for key in stale:
+            del self._inflight[key]
+
+    async def pipeline(
+        self,
+        calls: Iterable[Awaitable[_T]],
+        *,
+        max_concurrency: int = _MAX_CONCURRENCY,
+    ) -> list[_T]:
+        """Await independent client calls concurrently.
+
+        See :meth:`ActeonClient.pipeline` — this is the async counterpart,
+        taking awaitables (e.g. ``client.list_rules()``) and running them
+        with ``asyncio.gather``, at most ``max_concurrency`` at a time.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        gate = asyncio.Semaphore(max_concurrency)
+
+        async def one(call: Awaitable[_T]) -> _T:
+            async with gate:
+                return await call
+
+        return list(await asyncio.gather(*(one(c) for c in calls)))
+
+    async def _fan_out(
+        self,
+        call: Callable[[_K], Awaitable[_T]],
+        ids: Iterable[_K],
+        max_concurrency: int,
+    ) -> list[Union[_T, ActeonError]]:
+        """Async counterpart of :meth:`ActeonClient._fan_out`."""
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        gate = asyncio.Semaphore(max_concurrency)
+
+        async def one(ident: _K) -> _T:
+            async with gate:
+                return await call(ident)
+
+        outcomes = await asyncio.gather(*(one(i) for i in ids), return_exceptions=True)
+        results: list[Union[_T, ActeonError]] = []
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException) and not isinstance(outcome, ActeonError):
+                raise outcome
+            results.append(outcome)
+        return results
+
+    async def snapshot(self, namespace: str, tenant: str) -> TenantSnapshot:
+        """Fetch a tenant overview concurrently.
+
+        See :meth:`ActeonClient.snapshot` — the five reads are gathered on
+        the event loop.
+        """
+        approvals, recurring, quotas, chains, dlq = await asyncio.gather(
+            self.list_approvals(namespace, tenant),
+            self.list_recurring(RecurringFilter(namespace=namespace, tenant=tenant)),
+            self.list_quotas(namespace=namespace, tenant=tenant),
+            self.list_chains(namespace, tenant),
+            self.dlq_stats(),
+        )
+        return TenantSnapshot(
+            approvals=approvals, recurring=recurring, quotas=quotas, chains=chains, dlq=dlq
+        )
+
     async def list_rules(self) -> list[RuleInfo]:
+        cached = self._cache_get(_RULES_KEY)
+        if cached is not None:
+            return cached
+        generation = self._cache_generation()
         response = await self._request("GET", "/v1/rules")
         if response.status_code == 200:
-            return [RuleInfo.from_dict(r) for r in response.json()]
+            rules = [RuleInfo.from_dict(r) for r in _json.loads(response.content)]
+            return self._cache_put(_RULES_KEY, rules, generation)
         else:
             raise HttpError(response.status_code, f"Failed to list rules")
 
     async def reload_rules(self) -> ReloadResult:
-        response = await self._request("POST", "/v1/rules/reload")
-        if response.status_code == 200:
-            return ReloadResult.from_dict(response.json())
-        else:
-            raise HttpError(response.status_code, f"Failed to reload rules")
+        with self._invalidating(*_RULES_KEY):
+            response = await self._request("POST", "/v1/rules/reload")
+        return _parse_ok(response, ReloadResult.from_dict, "Failed to reload rules")
 
     async def set_rule_enabled(self, rule_name: str, enabled: bool) -> None:
-        response = await self._request(
-            "PUT",
-            f"/v1/rules/{rule_name}/enabled",
-            json={"enabled": enabled},
-        )
+        with self._invalidating(*_RULES_KEY):
+            response = await self._request(
+                "PUT",
+                f"/v1/rules/{_seg(rule_name)}/enabled",
+                json={"enabled": enabled},
+            )
         if response.status_code != 200:
             raise HttpError(response.status_code, f"Failed to set rule enabled")
 
@@ -2809,46 +3472,49 @@ class AsyncActeonClient(
         self, request: EvaluateRulesRequest
     ) -> EvaluateRulesResponse:
         """Evaluate rules against a test action without dispatching."""
-        body: dict = {
-            "namespace": request.namespace,
-            "tenant": request.tenant,
-            "provider": request.provider,
-            "action_type": request.action_type,
-            "payload": request.payload,
-        }
-        if request.metadata:
-            body["metadata"] = request.metadata
-        if request.include_disabled:
-            body["include_disabled"] = True
-        if request.evaluate_all:
-            body["evaluate_all"] = True
-        if request.evaluate_at:
-            body["evaluate_at"] = request.evaluate_at
-        if request.mock_state:
-            body["mock_state"] = request.mock_state
-
-        response = await self._request("POST", "/v1/rules/evaluate", json=body)
-        if response.status_code == 200:
-            return EvaluateRulesResponse.from_dict(response.json())
-        else:
-            raise HttpError(response.status_code, "Failed to evaluate rules")
+        response = await self._request("POST", "/v1/rules/evaluate", json=request.to_dict())
+        return _parse_ok(response, EvaluateRulesResponse.from_dict, "Failed to evaluate rules")
 
     async def query_audit(self, query: Optional[AuditQuery] = None) -> AuditPage:
         params = query.to_params() if query else {}
         response = await self._request("GET", "/v1/audit", params=params)
-        if response.status_code == 200:
-            return AuditPage.from_dict(response.json())
-        else:
-            raise HttpError(response.status_code, f"Failed to query audit")
+        return _parse_ok(response, AuditPage.from_dict, "Failed to query audit")
+
+    async def iter_audit(
+        self, query: Optional[AuditQuery] = None
+    ) -> AsyncIterator[AuditRecord]:
+        """Iterate over every audit record matching ``query``.
+
+        See :meth:`ActeonClient.iter_audit`.
+        """
+        query = query or AuditQuery()
+        while True:
+            page = await self.query_audit(query)
+            for record in page.records:
+                yield record
+            if not page.next_cursor or not page.records:
+                return
+            query = replace(query, cursor=page.next_cursor, offset=None)
 
     async def get_audit_record(self, action_id: str) -> Optional[AuditRecord]:
-        response = await self._request("GET", f"/v1/audit/{action_id}")
-        if response.status_code == 200:
-            return AuditRecord.from_dict(response.json())
-        elif response.status_code == 404:
-            return None
-        else:
-            raise HttpError(response.status_code, f"Failed to get audit record")
+        key = ("audit", action_id)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        generation = self._cache_generation()
+
+        async def fetch() -> Optional[AuditRecord]:
+            response = await self._request("GET", f"/v1/audit/{_seg(action_id)}")
+            if response.status_code == 200:
+                return self._cache_put(
+                    key, AuditRecord.from_dict(_json.loads(response.content)), generation
+                )
+            elif response.status_code == 404:
+                return None
+            else:
+                raise HttpError(response.status_code, f"Failed to get audit record")
+
+        return await self._coalesce(key, fetch)
 
     # =========================================================================
     # Audit Replay
@@ -2856,9 +3522,9 @@ class AsyncActeonClient(
 
     async def replay_action(self, action_id: str) -> ReplayResult:
         """Replay a single action from the audit trail."""
-        response = await self._request("POST", f"/v1/audit/{action_id}/replay")
+        response = await self._request("POST", f"/v1/audit/{_seg(action_id)}/replay")
         if response.status_code == 200:
-            return ReplayResult.from_dict(response.json())
+            return ReplayResult.from_dict(_json.loads(response.content))
         elif response.status_code == 404:
             raise HttpError(404, f"Audit record not found: {action_id}")
         elif response.status_code == 422:
@@ -2870,10 +3536,7 @@ class AsyncActeonClient(
         """Bulk replay actions from the audit trail."""
         params = query.to_params() if query else {}
         response = await self._request("POST", "/v1/audit/replay", params=params)
-        if response.status_code == 200:
-            return ReplaySummary.from_dict(response.json())
-        else:
-            raise HttpError(response.status_code, "Failed to replay audit")
+        return _parse_ok(response, ReplaySummary.from_dict, "Failed to replay audit")
 
     # =========================================================================
     # Events (State Machine Lifecycle)
@@ -2881,45 +3544,49 @@ class AsyncActeonClient(
 
     async def list_events(self, query: EventQuery) -> EventListResponse:
         response = await self._request("GET", "/v1/events", params=query.to_params())
-        if response.status_code == 200:
-            return EventListResponse.from_dict(response.json())
-        else:
-            raise HttpError(response.status_code, "Failed to list events")
+        return _parse_ok(response, EventListResponse.from_dict, "Failed to list events")
 
     async def get_event(
         self, fingerprint: str, namespace: str, tenant: str
     ) -> Optional[EventState]:
-        response = await self._request(
-            "GET",
-            f"/v1/events/{fingerprint}",
-            params={"namespace": namespace, "tenant": tenant},
-        )
-        if response.status_code == 200:
-            return EventState.from_dict(response.json())
-        elif response.status_code == 404:
-            return None
-        else:
-            raise HttpError(response.status_code, "Failed to get event")
+        key = ("event", fingerprint, namespace, tenant)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        generation = self._cache_generation()
+
+        async def fetch() -> Optional[EventState]:
+            response = await self._request(
+                "GET",
+                f"/v1/events/{_seg(fingerprint)}",
+                params=(("namespace", namespace), ("tenant", tenant)),
+            )
+            if response.status_code == 200:
+                return self._cache_put(
+                    key, EventState.from_dict(_json.loads(response.content)), generation
+                )
+            elif response.status_code == 404:
+                return None
+            else:
+                raise HttpError(response.status_code, "Failed to get event")
+
+        return await self._coalesce(key, fetch)
 
     async def transition_event(
         self, fingerprint: str, to_state: str, namespace: str, tenant: str
     ) -> TransitionResponse:
-        response = await self._request(
-            "PUT",
-            f"/v1/events/{fingerprint}/transition",
-            json={"to": to_state, "namespace": namespace, "tenant": tenant},
-        )
+        with self._invalidating("event", fingerprint):
+            response = await self._request(
+                "PUT",
+                f"/v1/events/{_seg(fingerprint)}/transition",
+                json={"to": to_state, "namespace": namespace, "tenant": tenant},
+            )
         if response.status_code == 200:
-            return TransitionResponse.from_dict(response.json())
+            return TransitionResponse.from_dict(_json.loads(response.content))
         elif response.status_code == 404:
             raise HttpError(404, f"Event not found: {fingerprint}")
         else:
-            data = response.json()
-            raise ApiError(
-                code=data.get("code", "UNKNOWN"),
-                message=data.get("message", "Unknown error"),
-                retryable=data.get("retryable", False),
-            )
+            _raise_api_error(response)
 
     # =========================================================================
     # Groups (Event Batching)
@@ -2927,89 +3594,102 @@ class AsyncActeonClient(
 
     async def list_groups(self) -> GroupListResponse:
         response = await self._request("GET", "/v1/groups")
-        if response.status_code == 200:
-            return GroupListResponse.from_dict(response.json())
-        else:
-            raise HttpError(response.status_code, "Failed to list groups")
+        return _parse_ok(response, GroupListResponse.from_dict, "Failed to list groups")
 
     async def get_group(self, group_key: str) -> Optional[GroupDetail]:
-        response = await self._request("GET", f"/v1/groups/{group_key}")
+        key = ("group", group_key)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        generation = self._cache_generation()
+        response = await self._request("GET", f"/v1/groups/{_seg(group_key)}")
         if response.status_code == 200:
-            return GroupDetail.from_dict(response.json())
+            return self._cache_put(
+                key, GroupDetail.from_dict(_json.loads(response.content)), generation
+            )
         elif response.status_code == 404:
             return None
         else:
             raise HttpError(response.status_code, "Failed to get group")
 
     async def flush_group(self, group_key: str) -> FlushGroupResponse:
-        response = await self._request("DELETE", f"/v1/groups/{group_key}")
+        with self._invalidating("group", group_key):
+            response = await self._request("DELETE", f"/v1/groups/{_seg(group_key)}")
         if response.status_code == 200:
-            return FlushGroupResponse.from_dict(response.json())
+            return FlushGroupResponse.from_dict(_json.loads(response.content))
         elif response.status_code == 404:
             raise HttpError(404, f"Group not found: {group_key}")
         else:
-            data = response.json()
-            raise ApiError(
-                code=data.get("code", "UNKNOWN"),
-                message=data.get("message", "Unknown error"),
-                retryable=data.get("retryable", False),
-            )
+            _raise_api_error(response)
 
     # =========================================================================
     # Approvals (Human-in-the-Loop)
     # =========================================================================
 
     async def approve(self, namespace: str, tenant: str, id: str, sig: str, expires_at: int, kid: Optional[str] = None) -> ApprovalActionResponse:
-        params: dict = {"sig": sig, "expires_at": expires_at}
-        if kid is not None:
-            params["kid"] = kid
-        response = await self._request(
-            "POST",
-            f"/v1/approvals/{namespace}/{tenant}/{id}/approve",
-            params=params,
+        return await self._decide_approval(
+            "approve", namespace, tenant, id, sig, expires_at, kid
         )
-        if response.status_code == 200:
-            return ApprovalActionResponse.from_dict(response.json())
-        elif response.status_code == 404:
-            raise HttpError(404, "Approval not found or expired")
-        elif response.status_code == 410:
-            raise HttpError(410, "Approval already decided")
-        else:
-            raise HttpError(response.status_code, "Failed to approve")
 
     async def reject(self, namespace: str, tenant: str, id: str, sig: str, expires_at: int, kid: Optional[str] = None) -> ApprovalActionResponse:
-        params: dict = {"sig": sig, "expires_at": expires_at}
-        if kid is not None:
-            params["kid"] = kid
-        response = await self._request(
-            "POST",
-            f"/v1/approvals/{namespace}/{tenant}/{id}/reject",
-            params=params,
+        return await self._decide_approval(
+            "reject", namespace, tenant, id, sig, expires_at, kid
         )
+
+    async def _decide_approval(
+        self,
+        verb: str,
+        namespace: str,
+        tenant: str,
+        id: str,
+        sig: str,
+        expires_at: int,
+        kid: Optional[str],
+    ) -> ApprovalActionResponse:
+        with self._invalidating("approval", id):
+            response = await self._request(
+                "POST",
+                f"/v1/approvals/{_seg(namespace)}/{_seg(tenant)}/{_seg(id)}/{_seg(verb)}",
+                params=_approval_params(sig, expires_at, kid),
+            )
         if response.status_code == 200:
-            return ApprovalActionResponse.from_dict(response.json())
-        elif response.status_code == 404:
-            raise HttpError(404, "Approval not found or expired")
-        elif response.status_code == 410:
-            raise HttpError(410, "Approval already decided")
-        else:
-            raise HttpError(response.status_code, "Failed to reject")
+            return ApprovalActionResponse.from_dict(_json.loads(response.content))
+        _raise_decision_error(response, verb)
 
     async def get_approval(self, namespace: str, tenant: str, id: str, sig: str, expires_at: int, kid: Optional[str] = None) -> Optional[ApprovalStatus]:
-        params: dict = {"sig": sig, "expires_at": expires_at}
-        if kid is not None:
-            params["kid"] = kid
-        response = await self._request(
-            "GET",
-            f"/v1/approvals/{namespace}/{tenant}/{id}",
-            params=params,
+        async def fetch() -> Optional[ApprovalStatus]:
+            response = await self._request(
+                "GET",
+                f"/v1/approvals/{_seg(namespace)}/{_seg(tenant)}/{_seg(id)}",
+                params=_approval_params(sig, expires_at, kid),
+            )
+            if response.status_code == 200:
+                return ApprovalStatus.from_dict(_json.loads(response.content))
+            elif response.status_code == 404:
+                return None
+            else:
+                raise HttpError(response.status_code, "Failed to get approval")
+
+        key = ("approval", id, namespace, tenant, sig, expires_at, kid)
+        return await self._coalesce(key, fetch)
+
+    async def get_approvals(
+        self,
+        lookups: Iterable[ApprovalLookup],
+        *,
+        max_concurrency: int = _MAX_CONCURRENCY,
+    ) -> list[Optional[ApprovalStatus]]:
+        """Get the status of several approvals concurrently.
+
+        See :meth:`ActeonClient.get_approvals`.
+        """
+        return await self.pipeline(
+            (
+                self.get_approval(lk.namespace, lk.tenant, lk.id, lk.sig, lk.expires_at, lk.kid)
+                for lk in lookups
+            ),
+            max_concurrency=max_concurrency,
         )
-        if response.status_code == 200:
-            return ApprovalStatus.from_dict(response.json())
-        elif response.status_code == 404:
-            return None
-        else:
-            raise HttpError(response.status_code, "Failed to get approval")
 
     async def list_approvals(
         self, namespace: str, tenant: str
@@ -3017,12 +3697,9 @@ class AsyncActeonClient(
         response = await self._request(
             "GET",
             "/v1/approvals",
-            params={"namespace": namespace, "tenant": tenant},
+            params=(("namespace", namespace), ("tenant", tenant)),
         )
-        if response.status_code == 200:
-            return ApprovalListResponse.from_dict(response.json())
-        else:
-            raise HttpError(response.status_code, "Failed to list approvals")
+        return _parse_ok(response, ApprovalListResponse.from_dict, "Failed to list approvals")
 
     # =========================================================================
     # Recurring Actions
@@ -3036,14 +3713,9 @@ class AsyncActeonClient(
             "POST", "/v1/recurring", json=recurring.to_dict()
         )
         if response.status_code == 201:
-            return CreateRecurringResponse.from_dict(response.json())
+            return CreateRecurringResponse.from_dict(_json.loads(response.content))
         else:
-            data = response.json()
-            raise ApiError(
-                code=data.get("code", "UNKNOWN"),
-                message=data.get("message", "Unknown error"),
-                retryable=data.get("retryable", False),
-            )
+            _raise_api_error(response)
 
     async def list_recurring(
         self, filter: Optional[RecurringFilter] = None
@@ -3051,10 +3723,9 @@ class AsyncActeonClient(
         """List recurring actions."""
         params = filter.to_params() if filter else {}
         response = await self._request("GET", "/v1/recurring", params=params)
-        if response.status_code == 200:
-            return ListRecurringResponse.from_dict(response.json())
-        else:
-            raise HttpError(response.status_code, "Failed to list recurring actions")
+        return _parse_ok(
+            response, ListRecurringResponse.from_dict, "Failed to list recurring actions"
+        )
 
     async def get_recurring(
         self, recurring_id: str, namespace: str, tenant: str
@@ -3062,11 +3733,11 @@ class AsyncActeonClient(
         """Get details of a specific recurring action."""
         response = await self._request(
             "GET",
-            f"/v1/recurring/{recurring_id}",
-            params={"namespace": namespace, "tenant": tenant},
+            f"/v1/recurring/{_seg(recurring_id)}",
+            params=(("namespace", namespace), ("tenant", tenant)),
         )
         if response.status_code == 200:
-            return RecurringDetail.from_dict(response.json())
+            return RecurringDetail.from_dict(_json.loads(response.content))
         elif response.status_code == 404:
             return None
         else:
@@ -3077,19 +3748,14 @@ class AsyncActeonClient(
     ) -> RecurringDetail:
         """Update a recurring action."""
         response = await self._request(
-            "PUT", f"/v1/recurring/{recurring_id}", json=update.to_dict()
+            "PUT", f"/v1/recurring/{_seg(recurring_id)}", json=update.to_dict()
         )
         if response.status_code == 200:
-            return RecurringDetail.from_dict(response.json())
+            return RecurringDetail.from_dict(_json.loads(response.content))
         elif response.status_code == 404:
             raise HttpError(404, f"Recurring action not found: {recurring_id}")
         else:
-            data = response.json()
-            raise ApiError(
-                code=data.get("code", "UNKNOWN"),
-                message=data.get("message", "Unknown error"),
-                retryable=data.get("retryable", False),
-            )
+            _raise_api_error(response)
 
     async def delete_recurring(
         self, recurring_id: str, namespace: str, tenant: str
@@ -3097,8 +3763,8 @@ class AsyncActeonClient(
         """Delete a recurring action."""
         response = await self._request(
             "DELETE",
-            f"/v1/recurring/{recurring_id}",
-            params={"namespace": namespace, "tenant": tenant},
+            f"/v1/recurring/{_seg(recurring_id)}",
+            params=(("namespace", namespace), ("tenant", tenant)),
         )
         if response.status_code == 204:
             return
@@ -3113,11 +3779,11 @@ class AsyncActeonClient(
         """Pause a recurring action."""
         response = await self._request(
             "POST",
-            f"/v1/recurring/{recurring_id}/pause",
+            f"/v1/recurring/{_seg(recurring_id)}/pause",
             json={"namespace": namespace, "tenant": tenant},
         )
         if response.status_code == 200:
-            return RecurringDetail.from_dict(response.json())
+            return RecurringDetail.from_dict(_json.loads(response.content))
         elif response.status_code == 404:
             raise HttpError(404, f"Recurring action not found: {recurring_id}")
         elif response.status_code == 409:
@@ -3131,11 +3797,11 @@ class AsyncActeonClient(
         """Resume a paused recurring action."""
         response = await self._request(
             "POST",
-            f"/v1/recurring/{recurring_id}/resume",
+            f"/v1/recurring/{_seg(recurring_id)}/resume",
             json={"namespace": namespace, "tenant": tenant},
         )
         if response.status_code == 200:
-            return RecurringDetail.from_dict(response.json())
+            return RecurringDetail.from_dict(_json.loads(response.content))
         elif response.status_code == 404:
             raise HttpError(404, f"Recurring action not found: {recurring_id}")
         elif response.status_code == 409:
@@ -3143,6 +3809,38 @@ class AsyncActeonClient(
         else:
             raise HttpError(response.status_code, "Failed to resume recurring action")
 
+    async def pause_many_recurring(
+        self,
+        recurring_ids: Iterable[str],
+        namespace: str,
+        tenant: str,
+        *,
+        max_concurrency: int = _MAX_CONCURRENCY,
+    ) -> list[Union[RecurringDetail, ActeonError]]:
+        """Pause several recurring actions concurrently.
+
+        See :meth:`ActeonClient.pause_many_recurring`.
+        """
+        return await self._fan_out(
+            lambda i: self.pause_recurring(i, namespace, tenant), recurring_ids, max_concurrency
+        )
+
+    async def resume_many_recurring(
+        self,
+        recurring_ids: Iterable[str],
+        namespace: str,
+        tenant: str,
+        *,
+        max_concurrency: int = _MAX_CONCURRENCY,
+    ) -> list[Union[RecurringDetail, ActeonError]]:
+        """Resume several paused recurring actions concurrently.
+
+        See :meth:`ActeonClient.pause_many_recurring`.
+        """
+        return await self._fan_out(
+            lambda i: self.resume_recurring(i, namespace, tenant), recurring_ids, max_concurrency
+        )
+
     # =========================================================================
     # Quotas
     # =========================================================================
@@ -3151,14 +3849,9 @@ class AsyncActeonClient(
         """Create a quota policy."""
         response = await self._request("POST", "/v1/quotas", json=req.to_dict())
         if response.status_code == 201:
-            return QuotaPolicy.from_dict(response.json())
+            return QuotaPolicy.from_dict(_json.loads(response.content))
         else:
-            data = response.json()
-            raise ApiError(
-                code=data.get("code", "UNKNOWN"),
-                message=data.get("message", "Unknown error"),
-                retryable=data.get("retryable", False),
-            )
+            _raise_api_error(response)
 
     async def list_quotas(
         self,
@@ -3171,26 +3864,24 @@ class AsyncActeonClient(
         tenant, provider scope (``"generic"`` matches generic policies;
         a provider name matches per-provider policies), and principal
         (caller) scope."""
-        params: dict = {}
-        if namespace is not None:
-            params["namespace"] = namespace
-        if tenant is not None:
-            params["tenant"] = tenant
-        if provider is not None:
-            params["provider"] = provider
-        if principal is not None:
-            params["principal"] = principal
+        params = _compact(
+            namespace=namespace, tenant=tenant, provider=provider, principal=principal
+        )
         response = await self._request("GET", "/v1/quotas", params=params)
-        if response.status_code == 200:
-            return ListQuotasResponse.from_dict(response.json())
-        else:
-            raise HttpError(response.status_code, "Failed to list quotas")
+        return _parse_ok(response, ListQuotasResponse.from_dict, "Failed to list quotas")
 
     async def get_quota(self, quota_id: str) -> Optional["QuotaPolicy"]:
         """Get a single quota policy by ID."""
-        response = await self._request("GET", f"/v1/quotas/{quota_id}")
+        key = ("quota", quota_id)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        generation = self._cache_generation()
+        response = await self._request("GET", f"/v1/quotas/{_seg(quota_id)}")
         if response.status_code == 200:
-            return QuotaPolicy.from_dict(response.json())
+            return self._cache_put(
+                key, QuotaPolicy.from_dict(_json.loads(response.content)), generation
+            )
         elif response.status_code == 404:
             return None
         else:
@@ -3200,30 +3891,27 @@ class AsyncActeonClient(
         self, quota_id: str, update: "UpdateQuotaRequest"
     ) -> "QuotaPolicy":
         """Update a quota policy."""
-        response = await self._request(
-            "PUT", f"/v1/quotas/{quota_id}", json=update.to_dict()
-        )
+        with self._invalidating("quota", quota_id):
+            response = await self._request(
+                "PUT", f"/v1/quotas/{_seg(quota_id)}", json=update.to_dict()
+            )
         if response.status_code == 200:
-            return QuotaPolicy.from_dict(response.json())
+            return QuotaPolicy.from_dict(_json.loads(response.content))
         elif response.status_code == 404:
             raise HttpError(404, f"Quota not found: {quota_id}")
         else:
-            data = response.json()
-            raise ApiError(
-                code=data.get("code", "UNKNOWN"),
-                message=data.get("message", "Unknown error"),
-                retryable=data.get("retryable", False),
-            )
+            _raise_api_error(response)
 
     async def delete_quota(
         self, quota_id: str, namespace: str, tenant: str
     ) -> None:
         """Delete a quota policy."""
-        response = await self._request(
-            "DELETE",
-            f"/v1/quotas/{quota_id}",
-            params={"namespace": namespace, "tenant": tenant},
-        )
+        with self._invalidating("quota", quota_id):
+            response = await self._request(
+                "DELETE",
+                f"/v1/quotas/{_seg(quota_id)}",
+                params=(("namespace", namespace), ("tenant", tenant)),
+            )
         if response.status_code == 204:
             return
         elif response.status_code == 404:
@@ -3233,9 +3921,9 @@ class AsyncActeonClient(
 
     async def get_quota_usage(self, quota_id: str) -> "QuotaUsage":
         """Get current usage statistics for a quota policy."""
-        response = await self._request("GET", f"/v1/quotas/{quota_id}/usage")
+        response = await self._request("GET", f"/v1/quotas/{_seg(quota_id)}/usage")
         if response.status_code == 200:
-            return QuotaUsage.from_dict(response.json())
+            return QuotaUsage.from_dict(_json.loads(response.content))
         elif response.status_code == 404:
             raise HttpError(404, f"Quota not found: {quota_id}")
         else:
@@ -3251,14 +3939,9 @@ class AsyncActeonClient(
             "POST", "/v1/silences", json=req.to_dict()
         )
         if response.status_code == 201:
-            return Silence.from_dict(response.json())
+            return Silence.from_dict(_json.loads(response.content))
         else:
-            data = response.json()
-            raise ApiError(
-                code=data.get("code", "UNKNOWN"),
-                message=data.get("message", data.get("error", "Unknown error")),
-                retryable=data.get("retryable", False),
-            )
+            _raise_api_error(response)
 
     async def list_silences(
         self,
@@ -3267,24 +3950,17 @@ class AsyncActeonClient(
         include_expired: bool = False,
     ) -> "ListSilencesResponse":
         """List silences, optionally filtered by scope or expiry."""
-        params: dict = {}
-        if namespace is not None:
-            params["namespace"] = namespace
-        if tenant is not None:
-            params["tenant"] = tenant
+        params = _compact(namespace=namespace, tenant=tenant)
         if include_expired:
             params["include_expired"] = "true"
         response = await self._request("GET", "/v1/silences", params=params)
-        if response.status_code == 200:
-            return ListSilencesResponse.from_dict(response.json())
-        else:
-            raise HttpError(response.status_code, "Failed to list silences")
+        return _parse_ok(response, ListSilencesResponse.from_dict, "Failed to list silences")
 
     async def get_silence(self, silence_id: str) -> Optional["Silence"]:
         """Fetch a single silence by ID. Returns ``None`` on 404."""
-        response = await self._request("GET", f"/v1/silences/{silence_id}")
+        response = await self._request("GET", f"/v1/silences/{_seg(silence_id)}")
         if response.status_code == 200:
-            return Silence.from_dict(response.json())
+            return Silence.from_dict(_json.loads(response.content))
         elif response.status_code == 404:
             return None
         else:
@@ -3295,23 +3971,18 @@ class AsyncActeonClient(
     ) -> "Silence":
         """Extend a silence or edit its comment. Matchers are immutable."""
         response = await self._request(
-            "PUT", f"/v1/silences/{silence_id}", json=update.to_dict()
+            "PUT", f"/v1/silences/{_seg(silence_id)}", json=update.to_dict()
         )
         if response.status_code == 200:
-            return Silence.from_dict(response.json())
+            return Silence.from_dict(_json.loads(response.content))
         elif response.status_code == 404:
             raise HttpError(404, f"Silence not found: {silence_id}")
         else:
-            data = response.json()
-            raise ApiError(
-                code=data.get("code", "UNKNOWN"),
-                message=data.get("message", data.get("error", "Unknown error")),
-                retryable=data.get("retryable", False),
-            )
+            _raise_api_error(response)
 
     async def delete_silence(self, silence_id: str) -> None:
         """Expire a silence immediately (soft-expire)."""
-        response = await self._request("DELETE", f"/v1/silences/{silence_id}")
+        response = await self._request("DELETE", f"/v1/silences/{_seg(silence_id)}")
         if response.status_code == 204:
             return
         elif response.status_code == 404:
@@ -3319,6 +3990,76 @@ class AsyncActeonClient(
         else:
             raise HttpError(response.status_code, "Failed to delete silence")
 
+    # =========================================================================
+    # Time Intervals
+    # =========================================================================
+
+    async def create_time_interval(
+        self, req: "CreateTimeIntervalRequest"
+    ) -> "TimeInterval":
+        """Create a time interval."""
+        response = await self._request("POST", "/v1/time-intervals", json=req.to_dict())
+        if response.status_code == 201:
+            return TimeInterval.from_dict(_json.loads(response.content))
+        _raise_api_error(response)
+
+    async def list_time_intervals(
+        self,
+        namespace: Optional[str] = None,
+        tenant: Optional[str] = None,
+    ) -> "ListTimeIntervalsResponse":
+        """List time intervals filtered by namespace/tenant."""
+        params = _compact(namespace=namespace, tenant=tenant)
+        response = await self._request("GET", "/v1/time-intervals", params=params)
+        return _parse_ok(
+            response, ListTimeIntervalsResponse.from_dict, "Failed to list time intervals"
+        )
+
+    async def get_time_interval(
+        self, namespace: str, tenant: str, name: str
+    ) -> Optional["TimeInterval"]:
+        """Fetch a single time interval. Returns ``None`` on 404."""
+        response = await self._request(
+            "GET", f"/v1/time-intervals/{_seg(namespace)}/{_seg(tenant)}/{_seg(name)}"
+        )
+        if response.status_code == 200:
+            return TimeInterval.from_dict(_json.loads(response.content))
+        if response.status_code == 404:
+            return None
+        raise HttpError(response.status_code, "Failed to get time interval")
+
+    async def update_time_interval(
+        self,
+        namespace: str,
+        tenant: str,
+        name: str,
+        update: "UpdateTimeIntervalRequest",
+    ) -> "TimeInterval":
+        """Update a time interval's ranges, location, or description."""
+        response = await self._request(
+            "PUT",
+            f"/v1/time-intervals/{_seg(namespace)}/{_seg(tenant)}/{_seg(name)}",
+            json=update.to_dict(),
+        )
+        if response.status_code == 200:
+            return TimeInterval.from_dict(_json.loads(response.content))
+        if response.status_code == 404:
+            raise HttpError(404, f"Time interval not found: {name}")
+        _raise_api_error(response)
+
+    async def delete_time_interval(
+        self, namespace: str, tenant: str, name: str
+    ) -> None:
+        """Delete a time interval."""
+        response = await self._request(
+            "DELETE", f"/v1/time-intervals/{_seg(namespace)}/{_seg(tenant)}/{_seg(name)}"
+        )
+        if response.status_code == 204:
+            return
+        if response.status_code == 404:
+            raise HttpError(404, f"Time interval not found: {name}")
+        raise HttpError(response.status_code, "Failed to delete time interval")
+
     # =========================================================================
     # Retention Policies
     # =========================================================================
@@ -3327,14 +4068,9 @@ class AsyncActeonClient(
         """Create a retention policy."""
         response = await self._request("POST", "/v1/retention", json=req.to_dict())
         if response.status_code == 201:
-            return RetentionPolicy.from_dict(response.json())
+            return RetentionPolicy.from_dict(_json.loads(response.content))
         else:
-            data = response.json()
-            raise ApiError(
-                code=data.get("code", "UNKNOWN"),
-                message=data.get("message", "Unknown error"),
-                retryable=data.get("retryable", False),
-            )
+            _raise_api_error(response)
 
     async def list_retention(
         self,
@@ -3344,26 +4080,22 @@ class AsyncActeonClient(
         offset: Optional[int] = None,
     ) -> "ListRetentionResponse":
         """List retention policies."""
-        params: dict = {}
-        if namespace is not None:
-            params["namespace"] = namespace
-        if tenant is not None:
-            params["tenant"] = tenant
-        if limit is not None:
-            params["limit"] = limit
-        if offset is not None:
-            params["offset"] = offset
+        params = _compact(
+            namespace=namespace,
+            tenant=tenant,
+            limit=limit,
+            offset=offset,
+        )
         response = await self._request("GET", "/v1/retention", params=params)
-        if response.status_code == 200:
-            return ListRetentionResponse.from_dict(response.json())
-        else:
-            raise HttpError(response.status_code, "Failed to list retention policies")
+        return _parse_ok(
+            response, ListRetentionResponse.from_dict, "Failed to list retention policies"
+        )
 
     async def get_retention(self, retention_id: str) -> Optional["RetentionPolicy"]:
         """Get a single retention policy by ID."""
-        response = await self._request("GET", f"/v1/retention/{retention_id}")
+        response = await self._request("GET", f"/v1/retention/{_seg(retention_id)}")
         if response.status_code == 200:
-            return RetentionPolicy.from_dict(response.json())
+            return RetentionPolicy.from_dict(_json.loads(response.content))
         elif response.status_code == 404:
             return None
         else:
@@ -3374,25 +4106,20 @@ class AsyncActeonClient(
     ) -> "RetentionPolicy":
         """Update a retention policy."""
         response = await self._request(
-            "PUT", f"/v1/retention/{retention_id}", json=update.to_dict()
+            "PUT", f"/v1/retention/{_seg(retention_id)}", json=update.to_dict()
         )
         if response.status_code == 200:
-            return RetentionPolicy.from_dict(response.json())
+            return RetentionPolicy.from_dict(_json.loads(response.content))
         elif response.status_code == 404:
             raise HttpError(404, f"Retention policy not found: {retention_id}")
         else:
-            data = response.json()
-            raise ApiError(
-                code=data.get("code", "UNKNOWN"),
-                message=data.get("message", "Unknown error"),
-                retryable=data.get("retryable", False),
-            )
+            _raise_api_error(response)
 
     async def delete_retention(self, retention_id: str) -> None:
         """Delete a retention policy."""
         response = await self._request(
             "DELETE",
-            f"/v1/retention/{retention_id}",
+            f"/v1/retention/{_seg(retention_id)}",
         )
         if response.status_code == 204:
             return
@@ -3409,14 +4136,9 @@ class AsyncActeonClient(
         """Create a payload template."""
         response = await self._request("POST", "/v1/templates", json=req.to_dict())
         if response.status_code == 201:
-            return TemplateInfo.from_dict(response.json())
+            return TemplateInfo.from_dict(_json.loads(response.content))
         else:
-            data = response.json()
-            raise ApiError(
-                code=data.get("code", "UNKNOWN"),
-                message=data.get("message", "Unknown error"),
-                retryable=data.get("retryable", False),
-            )
+            _raise_api_error(response)
 
     async def list_templates(
         self,
@@ -3424,22 +4146,15 @@ class AsyncActeonClient(
         tenant: Optional[str] = None,
     ) -> "ListTemplatesResponse":
         """List payload templates."""
-        params: dict = {}
-        if namespace is not None:
-            params["namespace"] = namespace
-        if tenant is not None:
-            params["tenant"] = tenant
+        params = _compact(namespace=namespace, tenant=tenant)
         response = await self._request("GET", "/v1/templates", params=params)
-        if response.status_code == 200:
-            return ListTemplatesResponse.from_dict(response.json())
-        else:
-            raise HttpError(response.status_code, "Failed to list templates")
+        return _parse_ok(response, ListTemplatesResponse.from_dict, "Failed to list templates")
 
     async def get_template(self, template_id: str) -> Optional["TemplateInfo"]:
         """Get a single template by ID."""
-        response = await self._request("GET", f"/v1/templates/{template_id}")
+        response = await self._request("GET", f"/v1/templates/{_seg(template_id)}")
         if response.status_code == 200:
-            return TemplateInfo.from_dict(response.json())
+            return TemplateInfo.from_dict(_json.loads(response.content))
         elif response.status_code == 404:
             return None
         else:
@@ -3450,23 +4165,18 @@ class AsyncActeonClient(
     ) -> "TemplateInfo":
         """Update a payload template."""
         response = await self._request(
-            "PUT", f"/v1/templates/{template_id}", json=update.to_dict()
+            "PUT", f"/v1/templates/{_seg(template_id)}", json=update.to_dict()
         )
         if response.status_code == 200:
-            return TemplateInfo.from_dict(response.json())
+            return TemplateInfo.from_dict(_json.loads(response.content))
         elif response.status_code == 404:
             raise HttpError(404, f"Template not found: {template_id}")
         else:
-            data = response.json()
-            raise ApiError(
-                code=data.get("code", "UNKNOWN"),
-                message=data.get("message", "Unknown error"),
-                retryable=data.get("retryable", False),
-            )
+            _raise_api_error(response)
 
     async def delete_template(self, template_id: str) -> None:
         """Delete a payload template."""
-        response = await self._request("DELETE", f"/v1/templates/{template_id}")
+        response = await self._request("DELETE", f"/v1/templates/{_seg(template_id)}")
         if response.status_code == 204:
             return
         elif response.status_code == 404:
@@ -3478,14 +4188,9 @@ class AsyncActeonClient(
         """Create a template profile."""
         response = await self._request("POST", "/v1/templates/profiles", json=req.to_dict())
         if response.status_code == 201:
-            return TemplateProfileInfo.from_dict(response.json())
+            return TemplateProfileInfo.from_dict(_json.loads(response.content))
         else:
-            data = response.json()
-            raise ApiError(
-                code=data.get("code", "UNKNOWN"),
-                message=data.get("message", "Unknown error"),
-                retryable=data.get("retryable", False),
-            )
+            _raise_api_error(response)
 
     async def list_profiles(
         self,
@@ -3493,22 +4198,15 @@ class AsyncActeonClient(
         tenant: Optional[str] = None,
     ) -> "ListProfilesResponse":
         """List template profiles."""
-        params: dict = {}
-        if namespace is not None:
-            params["namespace"] = namespace
-        if tenant is not None:
-            params["tenant"] = tenant
+        params = _compact(namespace=namespace, tenant=tenant)
         response = await self._request("GET", "/v1/templates/profiles", params=params)
-        if response.status_code == 200:
-            return ListProfilesResponse.from_dict(response.json())
-        else:
-            raise HttpError(response.status_code, "Failed to list profiles")
+        return _parse_ok(response, ListProfilesResponse.from_dict, "Failed to list profiles")
 
     async def get_profile(self, profile_id: str) -> Optional["TemplateProfileInfo"]:
         """Get a single template profile by ID."""
-        response = await self._request("GET", f"/v1/templates/profiles/{profile_id}")
+        response = await self._request("GET", f"/v1/templates/profiles/{_seg(profile_id)}")
         if response.status_code == 200:
-            return TemplateProfileInfo.from_dict(response.json())
+            return TemplateProfileInfo.from_dict(_json.loads(response.content))
         elif response.status_code == 404:
             return None
         else:
@@ -3519,23 +4217,18 @@ class AsyncActeonClient(
     ) -> "TemplateProfileInfo":
         """Update a template profile."""
         response = await self._request(
-            "PUT", f"/v1/templates/profiles/{profile_id}", json=update.to_dict()
+            "PUT", f"/v1/templates/profiles/{_seg(profile_id)}", json=update.to_dict()
         )
         if response.status_code == 200:
-            return TemplateProfileInfo.from_dict(response.json())
+            return TemplateProfileInfo.from_dict(_json.loads(response.content))
         elif response.status_code == 404:
             raise HttpError(404, f"Profile not found: {profile_id}")
         else:
-            data = response.json()
-            raise ApiError(
-                code=data.get("code", "UNKNOWN"),
-                message=data.get("message", "Unknown error"),
-                retryable=data.get("retryable", False),
-            )
+            _raise_api_error(response)
 
     async def delete_profile(self, profile_id: str) -> None:
         """Delete a template profile."""
-        response = await self._request("DELETE", f"/v1/templates/profiles/{profile_id}")
+        response = await self._request("DELETE", f"/v1/templates/profiles/{_seg(profile_id)}")
         if response.status_code == 204:
             return
         elif response.status_code == 404:
@@ -3547,14 +4240,9 @@ class AsyncActeonClient(
         """Render a template profile with payload data."""
         response = await self._request("POST", "/v1/templates/render", json=req.to_dict())
         if response.status_code == 200:
-            return RenderPreviewResponse.from_dict(response.json())
+            return RenderPreviewResponse.from_dict(_json.loads(response.content))
         else:
-            data = response.json()
-            raise ApiError(
-                code=data.get("code", "UNKNOWN"),
-                message=data.get("message", "Unknown error"),
-                retryable=data.get("retryable", False),
-            )
+            _raise_api_error(response)
 
     # =========================================================================
     # Provider Health
@@ -3563,10 +4251,9 @@ class AsyncActeonClient(
     async def list_provider_health(self) -> ListProviderHealthResponse:
         """List health and metrics for all providers."""
         response = await self._request("GET", "/v1/providers/health")
-        if response.status_code == 200:
-            return ListProviderHealthResponse.from_dict(response.json())
-        else:
-            raise HttpError(response.status_code, "Failed to list provider health")
+        return _parse_ok(
+            response, ListProviderHealthResponse.from_dict, "Failed to list provider health"
+        )
 
     # =========================================================================
     # WASM Plugins
@@ -3575,29 +4262,21 @@ class AsyncActeonClient(
     async def list_plugins(self) -> "ListPluginsResponse":
         """List all registered WASM plugins."""
         response = await self._request("GET", "/v1/plugins")
-        if response.status_code == 200:
-            return ListPluginsResponse.from_dict(response.json())
-        else:
-            raise HttpError(response.status_code, "Failed to list plugins")
+        return _parse_ok(response, ListPluginsResponse.from_dict, "Failed to list plugins")
 
     async def register_plugin(self, req: "RegisterPluginRequest") -> "WasmPlugin":
         """Register a new WASM plugin."""
         response = await self._request("POST", "/v1/plugins", json=req.to_dict())
         if response.status_code in (200, 201):
-            return WasmPlugin.from_dict(response.json())
+            return WasmPlugin.from_dict(_json.loads(response.content))
         else:
-            data = response.json()
-            raise ApiError(
-                code=data.get("code", "UNKNOWN"),
-                message=data.get("message", "Unknown error"),
-                retryable=data.get("retryable", False),
-            )
+            _raise_api_error(response)
 
     async def get_plugin(self, name: str) -> Optional["WasmPlugin"]:
         """Get details of a registered WASM plugin."""
-        response = await self._request("GET", f"/v1/plugins/{name}")
+        response = await self._request("GET", f"/v1/plugins/{_seg(name)}")
         if response.status_code == 200:
-            return WasmPlugin.from_dict(response.json())
+            return WasmPlugin.from_dict(_json.loads(response.content))
         elif response.status_code == 404:
             return None
         else:
@@ -3605,7 +4284,7 @@ class AsyncActeonClient(
 
     async def delete_plugin(self, name: str) -> None:
         """Unregister (delete) a WASM plugin."""
-        response = await self._request("DELETE", f"/v1/plugins/{name}")
+        response = await self._request("DELETE", f"/v1/plugins/{_seg(name)}")
         if response.status_code == 204:
             return
         elif response.status_code == 404:
@@ -3618,19 +4297,14 @@ class AsyncActeonClient(
     ) -> "PluginInvocationResponse":
         """Test-invoke a WASM plugin."""
         response = await self._request(
-            "POST", f"/v1/plugins/{name}/invoke", json=req.to_dict()
+            "POST", f"/v1/plugins/{_seg(name)}/invoke", json=req.to_dict()
         )
         if response.status_code == 200:
-            return PluginInvocationResponse.from_dict(response.json())
+            return PluginInvocationResponse.from_dict(_json.loads(response.content))
         elif response.status_code == 404:
             raise HttpError(404, f"Plugin not found: {name}")
         else:
-            data = response.json()
-            raise ApiError(
-                code=data.get("code", "UNKNOWN"),
-                message=data.get("message", "Unknown error"),
-                retryable=data.get("retryable", False),
-            )
+            _raise_api_error(response)
 
     # =========================================================================
     # Compliance (SOC2/HIPAA)
@@ -3639,10 +4313,7 @@ class AsyncActeonClient(
     async def get_compliance_status(self) -> ComplianceStatus:
         """Get the current compliance configuration status."""
         response = await self._request("GET", "/v1/compliance/status")
-        if response.status_code == 200:
-            return ComplianceStatus.from_dict(response.json())
-        else:
-            raise HttpError(response.status_code, "Failed to get compliance status")
+        return _parse_ok(response, ComplianceStatus.from_dict, "Failed to get compliance status")
 
     async def verify_audit_chain(
         self, req: "VerifyHashChainRequest"
@@ -3651,10 +4322,7 @@ class AsyncActeonClient(
         response = await self._request(
             "POST", "/v1/audit/verify", json=req.to_dict()
         )
-        if response.status_code == 200:
-            return HashChainVerification.from_dict(response.json())
-        else:
-            raise HttpError(response.status_code, "Failed to verify audit chain")
+        return _parse_ok(response, HashChainVerification.from_dict, "Failed to verify audit chain")
 
     # =========================================================================
     # Chains
@@ -3664,26 +4332,28 @@ class AsyncActeonClient(
         self, namespace: str, tenant: str, *, status: Optional[str] = None
     ) -> ListChainsResponse:
         """List chain executions filtered by namespace, tenant, and optional status."""
-        params: dict = {"namespace": namespace, "tenant": tenant}
-        if status is not None:
-            params["status"] = status
+        params = _compact(namespace=namespace, tenant=tenant, status=status)
         response = await self._request("GET", "/v1/chains", params=params)
-        if response.status_code == 200:
-            return ListChainsResponse.from_dict(response.json())
-        else:
-            raise HttpError(response.status_code, "Failed to list chains")
+        return _parse_ok(response, ListChainsResponse.from_dict, "Failed to list chains")
 
     async def get_chain(
         self, chain_id: str, namespace: str, tenant: str
     ) -> Optional[ChainDetailResponse]:
         """Get full details of a chain execution."""
+        key = ("chain", chain_id, namespace, tenant)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        generation = self._cache_generation()
         response = await self._request(
             "GET",
-            f"/v1/chains/{chain_id}",
-            params={"namespace": namespace, "tenant": tenant},
+            f"/v1/chains/{_seg(chain_id)}",
+            params=(("namespace", namespace), ("tenant", tenant)),
         )
         if response.status_code == 200:
-            return ChainDetailResponse.from_dict(response.json())
+            return self._cache_put(
+                key, ChainDetailResponse.from_dict(_json.loads(response.content)), generation
+            )
         elif response.status_code == 404:
             return None
         else:
@@ -3699,16 +4369,15 @@ class AsyncActeonClient(
         cancelled_by: Optional[str] = None,
     ) -> ChainDetailResponse:
         """Cancel a running chain execution."""
-        body: dict = {"namespace": namespace, "tenant": tenant}
-        if reason is not None:
-            body["reason"] = reason
-        if cancelled_by is not None:
-            body["cancelled_by"] = cancelled_by
-        response = await self._request(
-            "POST", f"/v1/chains/{chain_id}/cancel", json=body
+        body = _compact(
+            namespace=namespace, tenant=tenant, reason=reason, cancelled_by=cancelled_by
         )
+        with self._invalidating("chain", chain_id):
+            response = await self._request(
+                "POST", f"/v1/chains/{_seg(chain_id)}/cancel", json=body
+            )
         if response.status_code == 200:
-            return ChainDetailResponse.from_dict(response.json())
+            return ChainDetailResponse.from_dict(_json.loads(response.content))
         elif response.status_code == 404:
             raise HttpError(404, f"Chain not found: {chain_id}")
         elif response.status_code == 409:
@@ -3716,17 +4385,39 @@ class AsyncActeonClient(
         else:
             raise HttpError(response.status_code, "Failed to cancel chain")
 
+    async def cancel_many_chains(
+        self,
+        chain_ids: Iterable[str],
+        namespace: str,
+        tenant: str,
+        *,
+        reason: Optional[str] = None,
+        cancelled_by: Optional[str] = None,
+        max_concurrency: int = _MAX_CONCURRENCY,
+    ) -> list[Union[ChainDetailResponse, ActeonError]]:
+        """Cancel several running chains concurrently.
+
+        See :meth:`ActeonClient.cancel_many_chains`.
+        """
+        return await self._fan_out(
+            lambda i: self.cancel_chain(
+                i, namespace, tenant, reason=reason, cancelled_by=cancelled_by
+            ),
+            chain_ids,
+            max_concurrency,
+        )
+
     async def get_chain_dag(
         self, chain_id: str, namespace: str, tenant: str
     ) -> DagResponse:
         """Get the DAG representation for a running chain instance."""
         response = await self._request(
             "GET",
-            f"/v1/chains/{chain_id}/dag",
-            params={"namespace": namespace, "tenant": tenant},
+            f"/v1/chains/{_seg(chain_id)}/dag",
+            params=(("namespace", namespace), ("tenant", tenant)),
         )
         if response.status_code == 200:
-            return DagResponse.from_dict(response.json())
+            return DagResponse.from_dict(_json.loads(response.content))
         elif response.status_code == 404:
             raise HttpError(404, f"Chain not found: {chain_id}")
         else:
@@ -3736,10 +4427,10 @@ class AsyncActeonClient(
         """Get the DAG representation for a chain definition (config only)."""
         response = await self._request(
             "GET",
-            f"/v1/chains/definitions/{name}/dag",
+            f"/v1/chains/definitions/{_seg(name)}/dag",
         )
         if response.status_code == 200:
-            return DagResponse.from_dict(response.json())
+            return DagResponse.from_dict(_json.loads(response.content))
         elif response.status_code == 404:
             raise HttpError(404, f"Chain definition not found: {name}")
         else:
@@ -3753,11 +4444,11 @@ class AsyncActeonClient(
         """Get the retry history for a chain execution."""
         response = await self._request(
             "GET",
-            f"/v1/chains/{chain_id}/history",
-            params={"namespace": namespace, "tenant": tenant},
+            f"/v1/chains/{_seg(chain_id)}/history",
+            params=(("namespace", namespace), ("tenant", tenant)),
         )
         if response.status_code == 200:
-            return ChainHistoryResponse.from_dict(response.json())
+            return ChainHistoryResponse.from_dict(_json.loads(response.content))
         elif response.status_code == 404:
             raise HttpError(404, f"Chain not found: {chain_id}")
         else:
@@ -3772,16 +4463,13 @@ class AsyncActeonClient(
     async def dlq_stats(self) -> DlqStatsResponse:
         """Get dead-letter queue statistics."""
         response = await self._request("GET", "/v1/dlq/stats")
-        if response.status_code == 200:
-            return DlqStatsResponse.from_dict(response.json())
-        else:
-            raise HttpError(response.status_code, "Failed to get DLQ stats")
+        return _parse_ok(response, DlqStatsResponse.from_dict, "Failed to get DLQ stats")
 
     async def dlq_drain(self) -> DlqDrainResponse:
         """Drain all entries from the dead-letter queue."""
         response = await self._request("POST", "/v1/dlq/drain")
         if response.status_code == 200:
-            return DlqDrainResponse.from_dict(response.json())
+            return DlqDrainResponse.from_dict(_json.loads(response.content))
         elif response.status_code == 404:
             raise HttpError(404, "Dead-letter queue is not enabled")
         else:
@@ -3831,34 +4519,23 @@ class AsyncActeonClient(
             ConnectionError: If unable to connect to the server.
             HttpError: If the server returns an error.
         """
-        params: dict[str, str] = {"metric": metric}
-        if namespace is not None:
-            params["namespace"] = namespace
-        if tenant is not None:
-            params["tenant"] = tenant
-        if provider is not None:
-            params["provider"] = provider
-        if action_type is not None:
-            params["action_type"] = action_type
-        if outcome is not None:
-            params["outcome"] = outcome
-        if interval is not None:
-            params["interval"] = interval
-        if from_time is not None:
-            params["from"] = from_time
-        if to_time is not None:
-            params["to"] = to_time
-        if group_by is not None:
-            params["group_by"] = group_by
-        if top_n is not None:
-            params["top_n"] = str(top_n)
+        params = _compact(
+            metric=metric,
+            namespace=namespace,
+            tenant=tenant,
+            provider=provider,
+            action_type=action_type,
+            outcome=outcome,
+            interval=interval,
+            **{"from": from_time},
+            to=to_time,
+            group_by=group_by,
+            top_n=None if top_n is None else str(top_n),
+        )
 
         response = await self._request("GET", "/v1/analytics", params=params)
 
-        if response.status_code == 200:
-            return AnalyticsResponse.from_dict(response.json())
-        else:
-            raise HttpError(response.status_code, "Failed to query analytics")
+        return _parse_ok(response, AnalyticsResponse.from_dict, "Failed to query analytics")
 
     # =========================================================================
     # Rule Coverage
@@ -3884,21 +4561,16 @@ class AsyncActeonClient(
         """
         params: dict[str, str] = {}
         if query is not None:
-            if query.namespace is not None:
-                params["namespace"] = query.namespace
-            if query.tenant is not None:
-                params["tenant"] = query.tenant
-            if query.from_time is not None:
-                params["from"] = query.from_time
-            if query.to_time is not None:
-                params["to"] = query.to_time
+            params = _compact(
+                namespace=query.namespace,
+                tenant=query.tenant,
+                **{"from": query.from_time},
+                to=query.to_time,
+            )
 
         response = await self._request("GET", "/v1/rules/coverage", params=params)
 
-        if response.status_code == 200:
-            return CoverageReport.from_dict(response.json())
-        else:
-            raise HttpError(response.status_code, "Failed to get rule coverage")
+        return _parse_ok(response, CoverageReport.from_dict, "Failed to get rule coverage")
 
     # =========================================================================
     # Subscribe (SSE)
@@ -3912,6 +4584,8 @@ class AsyncActeonClient(
         namespace: Optional[str] = None,
         tenant: Optional[str] = None,
         include_history: bool = True,
+        chunk_size: Optional[int] = None,
+        max_event_size: Optional[int] = SSE_MAX_EVENT_SIZE,
     ) -> AsyncIterator[SseEvent]:
         """Subscribe to events for a specific entity via SSE.
 
@@ -3924,6 +4598,11 @@ class AsyncActeonClient(
             namespace: Namespace for tenant isolation (required for chain/group).
             tenant: Tenant for tenant isolation (required for chain/group).
             include_history: Emit catch-up events for current state (default: True).
+            chunk_size: Read size for the response body; ``None`` takes
+                data as it arrives.
+            max_event_size: Upper bound on one event's buffered data; a
+                larger event raises :class:`ActeonError`. ``None`` disables
+                the check.
 
         Yields:
             Parsed SseEvent objects.
@@ -3932,26 +4611,53 @@ class AsyncActeonClient(
             ConnectionError: If unable to connect to the server.
             HttpError: If the server returns an error.
         """
-        params: dict = {"include_history": str(include_history).lower()}
-        if namespace is not None:
-            params["namespace"] = namespace
-        if tenant is not None:
-            params["tenant"] = tenant
+        batches = self.subscribe_batches(
+            entity_type,
+            entity_id,
+            namespace=namespace,
+            tenant=tenant,
+            include_history=include_history,
+            chunk_size=chunk_size,
+            max_event_size=max_event_size,
+        )
+        async with aclosing(batches):
+            async for batch in batches:
+                for event in batch:
+                    yield event
 
-        url = f"{self.base_url}/v1/subscribe/{entity_type}/{entity_id}"
-        headers = self._headers()
-        headers["Accept"] = "text/event-stream"
-        headers.pop("Content-Type", None)
+    async def subscribe_batches(
+        self,
+        entity_type: str,
+        entity_id: str,
+        *,
+        namespace: Optional[str] = None,
+        tenant: Optional[str] = None,
+        include_history: bool = True,
+        chunk_size: Optional[int] = None,
+        max_event_size: Optional[int] = SSE_MAX_EVENT_SIZE,
+    ) -> AsyncGenerator[list[SseEvent], None]:
+        """Like :meth:`subscribe`, but yield the events of each read as one list.
+
+        A high-rate consumer resumes this generator once per network read
+        rather than once per event. Yielded lists are never empty.
+        """
+        params = _compact(
+            include_history=str(include_history).lower(),
+            namespace=namespace,
+            tenant=tenant,
+        )
+
+        url = f"/v1/subscribe/{_seg(entity_type)}/{_seg(entity_id)}"
 
         try:
-            async with self._client.stream(
-                "GET", url, params=params, headers=headers
-            ) as response:
+            async with _async_open_sse(self._client, url, params=params) as response:
                 if response.status_code != 200:
-                    await response.aread()
-                    raise HttpError(response.status_code, "Failed to subscribe")
-                async for event in _async_parse_sse_stream(response.aiter_lines()):
-                    yield event
+                    body = await _async_read_sse_error(response)
+                    raise HttpError(response.status_code, body or "Failed to subscribe")
+                async for batch in _async_parse_sse_batches(
+                    response.aiter_bytes(chunk_size), max_event_size
+                ):
+                    yield batch
         except httpx.ConnectError as e:
             raise ConnectionError(str(e)) from e
         except httpx.TimeoutException as e:
@@ -3972,6 +4678,8 @@ class AsyncActeonClient(
         group_id: Optional[str] = None,
         action_id: Optional[str] = None,
         last_event_id: Optional[str] = None,
+        chunk_size: Optional[int] = None,
+        max_event_size: Optional[int] = SSE_MAX_EVENT_SIZE,
     ) -> AsyncIterator[SseEvent]:
         """Subscribe to the real-time event stream via SSE.
 
@@ -3987,6 +4695,11 @@ class AsyncActeonClient(
             group_id: Filter events by group ID.
             action_id: Filter events by action ID.
             last_event_id: Reconnection token; replays missed events from this ID.
+            chunk_size: Read size for the response body; ``None`` takes
+                data as it arrives.
+            max_event_size: Upper bound on one event's buffered data; a
+                larger event raises :class:`ActeonError`. ``None`` disables
+                the check.
 
         Yields:
             Parsed SseEvent objects.
@@ -3995,79 +4708,114 @@ class AsyncActeonClient(
             ConnectionError: If unable to connect to the server.
             HttpError: If the server returns an error.
         """
-        params: dict = {}
-        if namespace is not None:
-            params["namespace"] = namespace
-        if action_type is not None:
-            params["action_type"] = action_type
-        if outcome is not None:
-            params["outcome"] = outcome
-        if event_type is not None:
-            params["event_type"] = event_type
-        if chain_id is not None:
-            params["chain_id"] = chain_id
-        if group_id is not None:
-            params["group_id"] = group_id
-        if action_id is not None:
-            params["action_id"] = action_id
-
-        url = f"{self.base_url}/v1/stream"
-        headers = self._headers()
-        headers["Accept"] = "text/event-stream"
-        headers.pop("Content-Type", None)
+        batches = self.stream_batches(
+            namespace=namespace,
+            action_type=action_type,
+            outcome=outcome,
+            event_type=event_type,
+            chain_id=chain_id,
+            group_id=group_id,
+            action_id=action_id,
+            last_event_id=last_event_id,
+            chunk_size=chunk_size,
+            max_event_size=max_event_size,
+        )
+        async with aclosing(batches):
+            async for batch in batches:
+                for event in batch:
+                    yield event
+
+    async def stream_batches(
+        self,
+        *,
+        namespace: Optional[str] = None,
+        action_type: Optional[str] = None,
+        outcome: Optional[str] = None,
+        event_type: Optional[str] = None,
+        chain_id: Optional[str] = None,
+        group_id: Optional[str] = None,
+        action_id: Optional[str] = None,
+        last_event_id: Optional[str] = None,
+        chunk_size: Optional[int] = None,
+        max_event_size: Optional[int] = SSE_MAX_EVENT_SIZE,
+    ) -> AsyncGenerator[list[SseEvent], None]:
+        """Like :meth:`stream`, but yield the events of each read as one list.
+
+        A high-rate consumer resumes this generator once per network read
+        rather than once per event. Yielded lists are never empty.
+        """
+        params = _compact(
+            namespace=namespace,
+            action_type=action_type,
+            outcome=outcome,
+            event_type=event_type,
+            chain_id=chain_id,
+            group_id=group_id,
+            action_id=action_id,
+        )
+
+        url = "/v1/stream"
+        headers = None
         if last_event_id is not None:
-            headers["Last-Event-ID"] = last_event_id
+            headers = {"Last-Event-ID": last_event_id}
 
         try:
-            async with self._client.stream(
-                "GET", url, params=params, headers=headers
+            async with _async_open_sse(
+                self._client, url, params=params, headers=headers
             ) as response:
                 if response.status_code != 200:
-                    await response.aread()
-                    raise HttpError(response.status_code, "Failed to open stream")
-                async for event in _async_parse_sse_stream(response.aiter_lines()):
-                    yield event
+                    body = await _async_read_sse_error(response)
+                    raise HttpError(response.status_code, body or "Failed to open stream")
+                async for batch in _async_parse_sse_batches(
+                    response.aiter_bytes(chunk_size), max_event_size
+                ):
+                    yield batch
         except httpx.ConnectError as e:
             raise ConnectionError(str(e)) from e
         except httpx.TimeoutException as e:
             raise ConnectionError(f"Request timed out: {e}") from e
 
 
-async def _async_parse_sse_stream(aiter_lines) -> AsyncIterator[SseEvent]:
-    """Parse a text/event-stream from an async line iterator into SseEvent objects.
+    # ------------------------------------------------------------------
+    # Swarm runs
+    # ------------------------------------------------------------------
 
-    This is the async equivalent of ``_parse_sse_stream``.
+    async def list_swarm_runs(
+        self, filter: Optional[SwarmRunFilter] = None
+    ) -> ListSwarmRunsResponse:
+        """List swarm runs tracked by the server-side registry."""
+        params = filter.to_params() if filter else {}
+        response = await self._request("GET", "/v1/swarm/runs", params=params)
+        return _parse_ok(response, ListSwarmRunsResponse.from_dict, "Failed to list swarm runs")
 
-    Args:
-        aiter_lines: An async iterator of lines from the SSE stream.
+    async def get_swarm_run(self, run_id: str) -> Optional[SwarmRunSnapshot]:
+        """Fetch a single swarm run snapshot. Returns ``None`` if unknown."""
+        # _seg() encodes '/', '?', and '#' — otherwise a maliciously
+        # crafted run_id could inject path/query segments.
+        response = await self._request("GET", f"/v1/swarm/runs/{_seg(run_id)}")
+        if response.status_code == 200:
+            return SwarmRunSnapshot.from_dict(_json.loads(response.content))
+        if response.status_code == 404:
+            return None
+        raise HttpError(response.status_code, "Failed to fetch swarm run")
 
-    Yields:
-        Parsed SseEvent objects.
-    """
-    import json as _json
-
-    event_type: Optional[str] = None
-    event_id: Optional[str] = None
-    data_parts: list[str] = []
-
-    async for line in aiter_lines:
-        if line.startswith(":"):
-            continue
-        if line == "":
-            if data_parts:
-                raw_data = "\n".join(data_parts)
-                try:
-                    parsed = _json.loads(raw_data)
-                except (_json.JSONDecodeError, ValueError):
-                    parsed = raw_data
-                yield SseEvent(event=event_type, id=event_id, data=parsed)
-            event_type = None
-            event_id = None
-            data_parts = []
-            continue
-        if line.startswith("event:"):
-            event_type = line[len("event:"):].strip()
-        elif line.startswith("id:"):
-            event_id = line[len("id:"):].strip()
-        elif line.startswith("data:"):
-            data_parts.append(line[len("data:"):].strip())
+    async def cancel_swarm_run(self, run_id: str) -> Optional[SwarmRunSnapshot]:
+        """Request cancellation of an inflight swarm run."""
+        response = await self._request("POST", f"/v1/swarm/runs/{_seg(run_id)}/cancel")
+        if response.status_code == 200:
+            return SwarmRunSnapshot.from_dict(_json.loads(response.content))
+        if response.status_code == 404:
+            return None
+        raise HttpError(response.status_code, "Failed to cancel swarm run")
+
+
+async def _async_parse_sse_batches(
+    chunks: AsyncIterator[bytes], max_event_size: Optional[int] = SSE_MAX_EVENT_SIZE
+) -> AsyncGenerator[list[SseEvent], None]:
+    """Async counterpart of :func:`~acteon_client.models._parse_sse_bytes`
+    that yields the events completed by each chunk together."""
+    parser = _SseByteParser(max_event_size)
+    async for chunk in chunks:
+        events = parser.feed(chunk)
+        if events:
+            yield events
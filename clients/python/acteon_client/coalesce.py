@@ -0,0 +1,288 @@
+"""Client-side coalescing of single dispatches into batch requests.
+
+High-frequency producers that call ``dispatch`` once per action pay a
+full round trip per action. A coalescer sits in front of a client and
+merges the dispatches submitted within a short window (``max_wait_ms``)
+or up to ``max_batch`` actions into one ``POST /v1/dispatch/batch``,
+then hands each caller back its own outcome.
+
+- :class:`DispatchCoalescer` wraps the sync
+  :class:`~acteon_client.client.ActeonClient`. Callers on any thread
+  :meth:`~DispatchCoalescer.submit` an action and get a
+  :class:`concurrent.futures.Future`; a background thread drains the
+  queue and sends the batches.
+- :class:`AsyncDispatchCoalescer` wraps
+  :class:`~acteon_client.client.AsyncActeonClient`. Concurrent
+  ``await coalescer.dispatch(action)`` calls on one event loop share a
+  batch; no extra thread is involved.
+
+Per-action failures reported inside a batch are raised to that
+action's caller as :class:`~acteon_client.errors.ApiError`; a failure
+of the batch request itself is raised to every caller in the batch.
+Coalescing trades up to ``max_wait_ms`` of added latency per action
+for far fewer requests, so it only pays off when many dispatches are
+in flight at once.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Any, Optional
+
+from .errors import ApiError
+from .models import Action, ActionOutcome, BatchResult
+
+if TYPE_CHECKING:
+    from .client import ActeonClient, AsyncActeonClient
+
+# Queue sentinel that tells the sync flusher thread to exit.
+_STOP = object()
+
+# One queued dispatch: the action and the caller's future.
+_Entry = tuple[Action, "Future[ActionOutcome]"]
+_AsyncEntry = tuple[Action, "asyncio.Future[ActionOutcome]"]
+
+
+def _settle(future: Any, result: BatchResult) -> None:
+    """Resolve ``future`` from one entry of a batch response."""
+    if result.success and result.outcome is not None:
+        future.set_result(result.outcome)
+    else:
+        error = result.error
+        future.set_exception(
+            ApiError(
+                code=error.code if error else "UNKNOWN",
+                message=error.message if error else "Unknown error",
+                retryable=error.retryable if error else False,
+            )
+        )
+
+
+def _length_mismatch(sent: int, received: int) -> ApiError:
+    return ApiError(
+        code="BATCH_SIZE_MISMATCH",
+        message=f"sent {sent} actions but received {received} results",
+    )
+
+
+class DispatchCoalescer:
+    """Merges concurrent sync dispatches into batch requests.
+
+    Example:
+        >>> with DispatchCoalescer(client, max_batch=64, max_wait_ms=5) as co:
+        ...     futures = [co.submit(a) for a in actions]
+        ...     outcomes = [f.result() for f in futures]
+    """
+
+    def __init__(
+        self,
+        client: "ActeonClient",
+        *,
+        max_batch: int = 64,
+        max_wait_ms: float = 5.0,
+    ):
+        """Create a coalescer and start its flusher thread.
+
+        Args:
+            client: The client whose ``dispatch_batch`` sends the batches.
+            max_batch: Flush as soon as this many actions are queued.
+            max_wait_ms: Flush at most this long after the first action
+                of a batch was queued, even if the batch is not full.
+        """
+        if max_batch < 1:
+            raise ValueError("max_batch must be at least 1")
+        self._client = client
+        self._max_batch = max_batch
+        self._max_wait = max_wait_ms / 1000.0
+        # Holds _Entry items plus the _STOP sentinel.
+        self._queue: queue.Queue[Any] = queue.Queue()
+        self._closed = False
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(
+            target=self._loop, name="acteon-dispatch-coalescer", daemon=True
+        )
+        self._thread.start()
+
+    def __enter__(self) -> "DispatchCoalescer":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def submit(self, action: Action) -> "Future[ActionOutcome]":
+        """Queue ``action`` for the next batch.
+
+        Returns:
+            A future resolving to the action's outcome, or raising
+            :class:`ApiError` / :class:`ConnectionError` on failure.
+
+        Raises:
+            RuntimeError: If the coalescer has been closed.
+        """
+        future: Future[ActionOutcome] = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("DispatchCoalescer is closed")
+            self._queue.put((action, future))
+        return future
+
+    def dispatch(self, action: Action, timeout: Optional[float] = None) -> ActionOutcome:
+        """Submit ``action`` and block until its outcome is available."""
+        return self.submit(action).result(timeout)
+
+    def close(self) -> None:
+        """Flush everything already submitted and stop the flusher thread."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(_STOP)
+        self._thread.join()
+
+    def _loop(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+            batch = [item]
+            deadline = time.monotonic() + self._max_wait
+            stop = False
+            while len(batch) < self._max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stop = True
+                    break
+                batch.append(item)
+            self._flush(batch)
+            if stop:
+                return
+
+    def _flush(self, batch: list[_Entry]) -> None:
+        # Drop entries whose callers already cancelled their future.
+        batch = [(a, f) for a, f in batch if f.set_running_or_notify_cancel()]
+        if not batch:
+            return
+        try:
+            results = self._client.dispatch_batch([a for a, _ in batch])
+        except BaseException as e:
+            # Anything escaping here would kill the flusher thread and
+            # leave every caller blocked on result(); hand it to them.
+            for _, future in batch:
+                future.set_exception(e)
+            return
+        if len(results) != len(batch):
+            error = _length_mismatch(len(batch), len(results))
+            for _, future in batch:
+                future.set_exception(error)
+            return
+        for (_, future), result in zip(batch, results):
+            _settle(future, result)
+
+
+class AsyncDispatchCoalescer:
+    """Merges concurrent async dispatches into batch requests.
+
+    Must be used from a single event loop.
+
+    Example:
+        >>> async with AsyncDispatchCoalescer(client) as co:
+        ...     outcomes = await asyncio.gather(*(co.dispatch(a) for a in actions))
+    """
+
+    def __init__(
+        self,
+        client: "AsyncActeonClient",
+        *,
+        max_batch: int = 64,
+        max_wait_ms: float = 5.0,
+    ):
+        """Create a coalescer.
+
+        Args:
+            client: The client whose ``dispatch_batch`` sends the batches.
+            max_batch: Flush as soon as this many actions are pending.
+            max_wait_ms: Flush at most this long after the first action
+                of a batch was queued, even if the batch is not full.
+        """
+        if max_batch < 1:
+            raise ValueError("max_batch must be at least 1")
+        self._client = client
+        self._max_batch = max_batch
+        self._max_wait = max_wait_ms / 1000.0
+        self._pending: list[_AsyncEntry] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._inflight: set[asyncio.Task[None]] = set()
+        self._closed = False
+
+    async def __aenter__(self) -> "AsyncDispatchCoalescer":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.aclose()
+
+    async def dispatch(self, action: Action) -> ActionOutcome:
+        """Queue ``action`` for the next batch and await its outcome."""
+        if self._closed:
+            raise RuntimeError("AsyncDispatchCoalescer is closed")
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[ActionOutcome] = loop.create_future()
+        self._pending.append((action, future))
+        if len(self._pending) >= self._max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._max_wait, self._flush)
+        return await future
+
+    async def aclose(self) -> None:
+        """Flush pending dispatches and wait for in-flight batches."""
+        self._closed = True
+        self._flush()
+        if self._inflight:
+            await asyncio.gather(*self._inflight, return_exceptions=True)
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, []
+        task = asyncio.ensure_future(self._send(batch))
+        self._inflight.add(task)
+        task.add_done_callback(self._inflight.discard)
+
+    async def _send(self, batch: list[_AsyncEntry]) -> None:
+        batch = [(a, f) for a, f in batch if not f.done()]
+        if not batch:
+            return
+        try:
+            results = await self._client.dispatch_batch([a for a, _ in batch])
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        except BaseException:
+            # Cancelled mid-send: nobody will resolve these futures now.
+            for _, future in batch:
+                future.cancel()
+            raise
+        if len(results) != len(batch):
+            error = _length_mismatch(len(batch), len(results))
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(error)
+            return
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                _settle(future, result)
@@ -1,11 +1,16 @@
 """Data models for the Acteon client."""
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, Iterator, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Iterator, List, NoReturn, Optional, Union
 from datetime import datetime
-import json
+import os
+import sys
 import uuid
 
+from . import _json
+from .errors import ActeonError
+
 
 @dataclass
 class Attachment:
@@ -35,7 +40,41 @@ class Attachment:
         }
 
 
-@dataclass
+def _uuid4_strings(n: int) -> list[str]:
+    """Return ``n`` random UUID4 strings drawn from a single ``os.urandom`` read.
+
+    Equivalent to ``[str(uuid.uuid4()) for _ in range(n)]`` but without a
+    syscall and a ``UUID`` object per id.
+    """
+    raw = bytearray(os.urandom(16 * n))
+    ids = []
+    for off in range(0, 16 * n, 16):
+        raw[off + 6] = (raw[off + 6] & 0x0F) | 0x40  # version 4
+        raw[off + 8] = (raw[off + 8] & 0x3F) | 0x80  # RFC 4122 variant
+        h = raw[off:off + 16].hex()
+        ids.append(f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}")
+    return ids
+
+
+@lru_cache(maxsize=256)
+def _naive_timestamp(dt: datetime) -> str:
+    return dt.isoformat() + "Z"
+
+
+def _utc_timestamp(dt: datetime) -> str:
+    """Format ``dt`` the way the server expects ``created_at``.
+
+    Naive timestamps are cached because batches built with
+    :meth:`Action.batch` share a single ``created_at``, so the whole batch
+    needs only one ``isoformat`` call. Aware datetimes bypass the cache:
+    equal instants in different zones hash alike but format differently.
+    """
+    if dt.tzinfo is None:
+        return _naive_timestamp(dt)
+    return dt.isoformat() + "Z"
+
+
+@dataclass(slots=True)
 class Action:
     """An action to be dispatched through Acteon.
 
@@ -75,7 +114,7 @@ class Action:
             "provider": self.provider,
             "action_type": self.action_type,
             "payload": self.payload,
-            "created_at": self.created_at.isoformat() + "Z",
+            "created_at": _utc_timestamp(self.created_at),
         }
         if self.dedup_key:
             result["dedup_key"] = self.dedup_key
@@ -93,8 +132,53 @@ class Action:
             result["kid"] = self.kid
         return result
 
+    @classmethod
+    def batch(
+        cls,
+        payloads: Iterable[dict[str, Any]],
+        *,
+        namespace: str,
+        tenant: str,
+        provider: str,
+        action_type: str,
+        **common: Any,
+    ) -> list["Action"]:
+        """Build one action per payload, sharing every other field.
+
+        Ids for the whole batch come from a single ``os.urandom`` read,
+        which is noticeably cheaper than ``uuid.uuid4()`` per action when
+        generating large batches, and every action shares one
+        ``created_at`` timestamp unless one is passed in ``common``.
+
+        Args:
+            payloads: One payload per action to create.
+            namespace: Namespace for every action.
+            tenant: Tenant for every action.
+            provider: Provider for every action.
+            action_type: Action type for every action.
+            **common: Any other ``Action`` field (except ``id``) to set on
+                every action.
+
+        Returns:
+            The new actions, in payload order.
+        """
+        payloads = list(payloads)
+        common.setdefault("created_at", datetime.utcnow())
+        return [
+            cls(
+                namespace=namespace,
+                tenant=tenant,
+                provider=provider,
+                action_type=action_type,
+                payload=payload,
+                id=action_id,
+                **common,
+            )
+            for payload, action_id in zip(payloads, _uuid4_strings(len(payloads)))
+        ]
 
-@dataclass
+
+@dataclass(slots=True)
 class ProviderResponse:
     """Response from a provider after executing an action."""
     status: str
@@ -102,7 +186,7 @@ class ProviderResponse:
     headers: dict[str, str] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class ActionOutcome:
     """Outcome of dispatching an action.
 
@@ -229,7 +313,7 @@ class ActionOutcome:
         return self.outcome_type == "quota_exceeded"
 
 
-@dataclass
+@dataclass(slots=True)
 class ErrorResponse:
     """Error response from the API."""
     code: str
@@ -237,7 +321,7 @@ class ErrorResponse:
     retryable: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class BatchResult:
     """Result from a batch dispatch operation."""
     success: bool
@@ -261,7 +345,7 @@ class BatchResult:
             return cls(success=True, outcome=ActionOutcome.from_dict(data))
 
 
-@dataclass
+@dataclass(slots=True)
 class RuleInfo:
     """Information about a loaded rule."""
     name: str
@@ -290,6 +374,16 @@ class ReloadResult:
         return cls(loaded=data["loaded"], errors=data.get("errors", []))
 
 
+# Optional ``EvaluateRulesRequest`` fields, sent only when truthy.
+_EVALUATE_RULES_OPTIONS = (
+    "metadata",
+    "include_disabled",
+    "evaluate_all",
+    "evaluate_at",
+    "mock_state",
+)
+
+
 @dataclass
 class EvaluateRulesRequest:
     """Request to evaluate rules against a test action without dispatching.
@@ -317,6 +411,21 @@ class EvaluateRulesRequest:
     evaluate_at: Optional[str] = None
     mock_state: Optional[Dict[str, str]] = None
 
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to the request body; unset/false options are omitted."""
+        result: dict[str, Any] = {
+            "namespace": self.namespace,
+            "tenant": self.tenant,
+            "provider": self.provider,
+            "action_type": self.action_type,
+            "payload": self.payload,
+        }
+        for name in _EVALUATE_RULES_OPTIONS:
+            value = getattr(self, name)
+            if value:
+                result[name] = value
+        return result
+
 
 @dataclass
 class SemanticMatchDetail:
@@ -511,7 +620,7 @@ class AuditQuery:
         return params
 
 
-@dataclass
+@dataclass(slots=True)
 class AuditRecord:
     """An audit record."""
     id: str
@@ -531,15 +640,18 @@ class AuditRecord:
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "AuditRecord":
+        # The categorical columns repeat across every record in a page;
+        # interning them keeps one copy per distinct value.
+        intern = sys.intern
         return cls(
             id=data["id"],
             action_id=data["action_id"],
-            namespace=data["namespace"],
-            tenant=data["tenant"],
-            provider=data["provider"],
-            action_type=data["action_type"],
-            verdict=data["verdict"],
-            outcome=data["outcome"],
+            namespace=intern(data["namespace"]),
+            tenant=intern(data["tenant"]),
+            provider=intern(data["provider"]),
+            action_type=intern(data["action_type"]),
+            verdict=intern(data["verdict"]),
+            outcome=intern(data["outcome"]),
             matched_rule=data.get("matched_rule"),
             duration_ms=data["duration_ms"],
             dispatched_at=data["dispatched_at"],
@@ -549,7 +661,7 @@ class AuditRecord:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class AuditPage:
     """Paginated audit results.
 
@@ -601,7 +713,7 @@ class EventQuery:
         return params
 
 
-@dataclass
+@dataclass(slots=True)
 class EventState:
     """Current state of an event."""
     fingerprint: str
@@ -745,7 +857,7 @@ class ApprovalActionResponse:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ApprovalStatus:
     """Public-facing approval status (no payload exposed)."""
     token: str
@@ -769,6 +881,21 @@ class ApprovalStatus:
         )
 
 
+@dataclass
+class ApprovalLookup:
+    """One signed approval to fetch with ``get_approvals``.
+
+    The fields are the arguments of ``get_approval``, taken from the
+    approval's signed URL.
+    """
+    namespace: str
+    tenant: str
+    id: str
+    sig: str
+    expires_at: int
+    kid: Optional[str] = None
+
+
 @dataclass
 class ApprovalListResponse:
     """Response from listing pending approvals."""
@@ -1040,7 +1167,7 @@ class RecurringFilter:
         return params
 
 
-@dataclass
+@dataclass(slots=True)
 class RecurringSummary:
     """Summary of a recurring action in list responses."""
     id: str
@@ -1074,7 +1201,7 @@ class RecurringSummary:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ListRecurringResponse:
     """Response from listing recurring actions."""
     recurring_actions: list[RecurringSummary]
@@ -1090,7 +1217,7 @@ class ListRecurringResponse:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class RecurringDetail:
     """Detailed information about a recurring action."""
     id: str
@@ -1262,7 +1389,7 @@ class UpdateQuotaRequest:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class QuotaPolicy:
     """A quota policy.
 
@@ -1305,7 +1432,7 @@ class QuotaPolicy:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ListQuotasResponse:
     """Response from listing quota policies."""
     quotas: list[QuotaPolicy]
@@ -1319,7 +1446,7 @@ class ListQuotasResponse:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class QuotaUsage:
     """Current usage statistics for a quota."""
     tenant: str
@@ -1771,7 +1898,7 @@ class ListRetentionResponse:
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class ChainSummary:
     """Summary of a chain execution.
 
@@ -1808,7 +1935,7 @@ class ChainSummary:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ListChainsResponse:
     """Response from listing chain executions."""
     chains: list[ChainSummary]
@@ -1820,7 +1947,7 @@ class ListChainsResponse:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ChainStepStatus:
     """Detailed status of a single chain step.
 
@@ -1870,7 +1997,7 @@ class ChainStepStatus:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ChainDetailResponse:
     """Full detail response for a chain execution.
 
@@ -2141,7 +2268,7 @@ class ChainHistoryResponse:
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class DlqStatsResponse:
     """Response from the DLQ stats endpoint.
 
@@ -2197,7 +2324,7 @@ class DlqEntry:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class DlqDrainResponse:
     """Response from the DLQ drain endpoint.
 
@@ -2216,12 +2343,30 @@ class DlqDrainResponse:
         )
 
 
+@dataclass
+class TenantSnapshot:
+    """Operational overview of one tenant, from :meth:`ActeonClient.snapshot`.
+
+    Attributes:
+        approvals: Pending approvals.
+        recurring: Recurring actions.
+        quotas: Quota policies.
+        chains: Chain executions.
+        dlq: Dead-letter queue statistics (server-wide).
+    """
+    approvals: ApprovalListResponse
+    recurring: ListRecurringResponse
+    quotas: ListQuotasResponse
+    chains: ListChainsResponse
+    dlq: DlqStatsResponse
+
+
 # =============================================================================
 # SSE Event Types
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class SseEvent:
     """A parsed Server-Sent Event.
 
@@ -2235,13 +2380,134 @@ class SseEvent:
     data: Optional[Any] = None
 
 
+SSE_MAX_EVENT_SIZE = 16 * 1024 * 1024
+"""Default cap on one SSE event's buffered size (16 MiB)."""
+
+
+class _SseByteParser:
+    """Incremental text/event-stream parser fed raw byte chunks.
+
+    Handles the ``event:``, ``id:`` and ``data:`` fields; blank lines
+    delimit events and comment lines (starting with ``:``) are ignored.
+    The complete lines of each chunk are decoded and split in one pass
+    each (``bytes.decode`` then ``str.split``, both in C), instead of
+    running httpx's incremental text and line decoders over the stream; a
+    trailing partial line is carried over as bytes, so a multi-byte
+    character split across chunks is decoded intact. Lines may end in
+    ``\n``, ``\r\n`` or a bare ``\r``, as the SSE spec allows.
+
+    When ``max_event_size`` is set, an event whose buffered data plus
+    unterminated line grows past it raises :class:`ActeonError` instead
+    of buffering a runaway stream without bound.
+    """
+
+    __slots__ = ("_max_size", "_pending", "_event", "_id", "_data", "_size", "_skip_lf")
+
+    def __init__(self, max_event_size: Optional[int] = SSE_MAX_EVENT_SIZE):
+        self._max_size = max_event_size
+        self._pending = bytearray()
+        self._event: Optional[str] = None
+        self._id: Optional[str] = None
+        self._data: list[str] = []
+        self._size = 0
+        # The last chunk ended in "\r": a "\n" opening the next one
+        # belongs to that line ending, not a new (blank) line.
+        self._skip_lf = False
+
+    def feed(self, chunk: bytes) -> list[SseEvent]:
+        """Consume ``chunk`` and return the events it completed."""
+        if self._skip_lf and chunk:
+            self._skip_lf = False
+            if chunk[0] == 0x0A:
+                chunk = chunk[1:]
+        cut = max(chunk.rfind(b"\n"), chunk.rfind(b"\r"))
+        if cut < 0:
+            self._pending += chunk
+            self._check_size()
+            return []
+        text = (self._pending + chunk[:cut]).decode("utf-8", "replace")
+        if chunk[cut] == 0x0D:
+            self._skip_lf = cut == len(chunk) - 1
+        elif text.endswith("\r"):
+            # The "\n" at ``cut`` closes a "\r\n" pair.
+            text = text[:-1]
+        self._pending = bytearray(chunk[cut + 1:])
+        if "\r" in text:
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+
+        events: list[SseEvent] = []
+        event_type = self._event
+        event_id = self._id
+        data = self._data
+        size = self._size
+        limit = self._max_size
+        for line in text.split("\n"):
+            if not line:
+                # Blank line: dispatch event if we have data.
+                if data:
+                    raw_data = data[0] if len(data) == 1 else "\n".join(data)
+                    try:
+                        parsed = _json.loads(raw_data)
+                    except ValueError:
+                        parsed = raw_data
+                    events.append(SseEvent(event=event_type, id=event_id, data=parsed))
+                    data = []
+                event_type = None
+                event_id = None
+                size = 0
+            else:
+                # One partition scan splits off the field name, instead of
+                # a startswith test per known field.
+                name, _, value = line.partition(":")
+                if name == "data":
+                    part = value.strip()
+                    data.append(part)
+                    size += len(part) + 1
+                    if limit is not None and size > limit:
+                        self._too_large()
+                elif name == "event":
+                    event_type = value.strip()
+                elif name == "id":
+                    event_id = value.strip()
+                # Comments (empty name) and other fields are ignored per the SSE spec.
+        self._event = event_type
+        self._id = event_id
+        self._data = data
+        self._size = size
+        self._check_size()
+        return events
+
+    def _check_size(self) -> None:
+        limit = self._max_size
+        if limit is not None and self._size + len(self._pending) > limit:
+            self._too_large()
+
+    def _too_large(self) -> NoReturn:
+        raise ActeonError(f"SSE event exceeds max_event_size ({self._max_size} bytes)")
+
+
+def _parse_sse_bytes(
+    chunks: Iterable[bytes], max_event_size: Optional[int] = SSE_MAX_EVENT_SIZE
+) -> Iterator[SseEvent]:
+    """Parse a text/event-stream given as raw byte chunks.
+
+    Args:
+        chunks: Byte chunks as read from the response, split anywhere.
+        max_event_size: Cap on one event's buffered size, or ``None``.
+
+    Yields:
+        Parsed SseEvent objects.
+    """
+    parser = _SseByteParser(max_event_size)
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+
+
 def _parse_sse_stream(lines: Iterator[str]) -> Iterator[SseEvent]:
-    """Parse a text/event-stream into SseEvent objects.
+    """Parse a text/event-stream given as decoded lines.
 
-    This is a simple line-by-line SSE parser that yields events as they
-    arrive. It handles the ``event:``, ``id:``, and ``data:`` fields.
-    Blank lines delimit events. Comment lines (starting with ``:``) are
-    ignored.
+    Line-oriented front end to :class:`_SseByteParser`, with no cap on
+    event size.
 
     Args:
         lines: An iterator of lines from the SSE stream (without trailing newlines).
@@ -2249,35 +2515,9 @@ def _parse_sse_stream(lines: Iterator[str]) -> Iterator[SseEvent]:
     Yields:
         Parsed SseEvent objects.
     """
-    event_type: Optional[str] = None
-    event_id: Optional[str] = None
-    data_parts: list[str] = []
-
+    parser = _SseByteParser(max_event_size=None)
     for line in lines:
-        if line.startswith(":"):
-            # Comment line, skip.
-            continue
-        if line == "":
-            # Blank line: dispatch event if we have data.
-            if data_parts:
-                raw_data = "\n".join(data_parts)
-                try:
-                    parsed = json.loads(raw_data)
-                except (json.JSONDecodeError, ValueError):
-                    parsed = raw_data
-                yield SseEvent(event=event_type, id=event_id, data=parsed)
-            # Reset for next event.
-            event_type = None
-            event_id = None
-            data_parts = []
-            continue
-        if line.startswith("event:"):
-            event_type = line[len("event:"):].strip()
-        elif line.startswith("id:"):
-            event_id = line[len("id:"):].strip()
-        elif line.startswith("data:"):
-            data_parts.append(line[len("data:"):].strip())
-        # Other fields are ignored per the SSE spec.
+        yield from parser.feed(line.encode("utf-8") + b"\n")
 
 
 # =============================================================================
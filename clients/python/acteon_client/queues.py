@@ -22,24 +22,15 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Optional
-from urllib.parse import quote
 
+from . import _json
+from ._paths import seg as _seg
 from .errors import ApiError, HttpError
 
 if TYPE_CHECKING:
     import httpx
 
 
-def _seg(s: str) -> str:
-    """Percent-encode a path segment opaquely (no ``/`` passthrough).
-
-    Mirrors ``_seg`` in ``bus.py``: a queue name or task id that
-    happens to contain a slash must be escaped, not silently split
-    into additional path components.
-    """
-    return quote(s, safe="")
-
-
 def _raise_for_status(resp: "httpx.Response") -> None:
     """Translate a non-2xx response into either ``ApiError`` (with the
     server's structured error envelope) or ``HttpError`` (raw body).
@@ -47,7 +38,7 @@ def _raise_for_status(resp: "httpx.Response") -> None:
     if 200 <= resp.status_code < 300:
         return
     try:
-        data = resp.json()
+        data = _json.loads(resp.content)
         message = (
             data.get("error")
             or data.get("message")
@@ -173,7 +164,7 @@ class _QueuesClientMixin:
             body["max_attempts"] = max_attempts
         resp = self._request("POST", f"/v1/queues/{_seg(queue)}/tasks", json=body)
         _raise_for_status(resp)
-        return WorkerTask.from_dict(resp.json())
+        return WorkerTask.from_dict(_json.loads(resp.content))
 
     def poll_tasks(
         self,
@@ -212,7 +203,7 @@ class _QueuesClientMixin:
             body["worker_id"] = worker_id
         resp = self._request("POST", f"/v1/queues/{_seg(queue)}/poll", json=body)
         _raise_for_status(resp)
-        return [WorkerTask.from_dict(t) for t in resp.json().get("tasks", [])]
+        return [WorkerTask.from_dict(t) for t in _json.loads(resp.content).get("tasks", [])]
 
     def heartbeat_task(
         self,
@@ -250,7 +241,7 @@ class _QueuesClientMixin:
             "POST", f"/v1/queues/tasks/{_seg(task_id)}/heartbeat", json=body
         )
         _raise_for_status(resp)
-        return WorkerTask.from_dict(resp.json())
+        return WorkerTask.from_dict(_json.loads(resp.content))
 
     def complete_task(
         self,
@@ -287,7 +278,7 @@ class _QueuesClientMixin:
             },
         )
         _raise_for_status(resp)
-        return WorkerTask.from_dict(resp.json())
+        return WorkerTask.from_dict(_json.loads(resp.content))
 
     def fail_task(
         self,
@@ -328,7 +319,7 @@ class _QueuesClientMixin:
             },
         )
         _raise_for_status(resp)
-        return WorkerTask.from_dict(resp.json())
+        return WorkerTask.from_dict(_json.loads(resp.content))
 
     def get_task(
         self, task_id: str, namespace: str, tenant: str
@@ -350,7 +341,7 @@ class _QueuesClientMixin:
         if resp.status_code == 404:
             return None
         _raise_for_status(resp)
-        return WorkerTask.from_dict(resp.json())
+        return WorkerTask.from_dict(_json.loads(resp.content))
 
     def list_tasks(
         self,
@@ -383,7 +374,7 @@ class _QueuesClientMixin:
             "GET", f"/v1/queues/{_seg(queue)}/tasks", params=params
         )
         _raise_for_status(resp)
-        return [WorkerTask.from_dict(t) for t in resp.json().get("tasks", [])]
+        return [WorkerTask.from_dict(t) for t in _json.loads(resp.content).get("tasks", [])]
 
 
 # ============================================================================
@@ -430,7 +421,7 @@ class _AsyncQueuesClientMixin:
             body["max_attempts"] = max_attempts
         resp = await self._request("POST", f"/v1/queues/{_seg(queue)}/tasks", json=body)
         _raise_for_status(resp)
-        return WorkerTask.from_dict(resp.json())
+        return WorkerTask.from_dict(_json.loads(resp.content))
 
     async def poll_tasks(
         self,
@@ -452,7 +443,7 @@ class _AsyncQueuesClientMixin:
             body["worker_id"] = worker_id
         resp = await self._request("POST", f"/v1/queues/{_seg(queue)}/poll", json=body)
         _raise_for_status(resp)
-        return [WorkerTask.from_dict(t) for t in resp.json().get("tasks", [])]
+        return [WorkerTask.from_dict(t) for t in _json.loads(resp.content).get("tasks", [])]
 
     async def heartbeat_task(
         self,
@@ -475,7 +466,7 @@ class _AsyncQueuesClientMixin:
             "POST", f"/v1/queues/tasks/{_seg(task_id)}/heartbeat", json=body
         )
         _raise_for_status(resp)
-        return WorkerTask.from_dict(resp.json())
+        return WorkerTask.from_dict(_json.loads(resp.content))
 
     async def complete_task(
         self,
@@ -497,7 +488,7 @@ class _AsyncQueuesClientMixin:
             },
         )
         _raise_for_status(resp)
-        return WorkerTask.from_dict(resp.json())
+        return WorkerTask.from_dict(_json.loads(resp.content))
 
     async def fail_task(
         self,
@@ -521,7 +512,7 @@ class _AsyncQueuesClientMixin:
             },
         )
         _raise_for_status(resp)
-        return WorkerTask.from_dict(resp.json())
+        return WorkerTask.from_dict(_json.loads(resp.content))
 
     async def get_task(
         self, task_id: str, namespace: str, tenant: str
@@ -535,7 +526,7 @@ class _AsyncQueuesClientMixin:
         if resp.status_code == 404:
             return None
         _raise_for_status(resp)
-        return WorkerTask.from_dict(resp.json())
+        return WorkerTask.from_dict(_json.loads(resp.content))
 
     async def list_tasks(
         self,
@@ -553,4 +544,4 @@ class _AsyncQueuesClientMixin:
             "GET", f"/v1/queues/{_seg(queue)}/tasks", params=params
         )
         _raise_for_status(resp)
-        return [WorkerTask.from_dict(t) for t in resp.json().get("tasks", [])]
+        return [WorkerTask.from_dict(t) for t in _json.loads(resp.content).get("tasks", [])]
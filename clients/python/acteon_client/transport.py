@@ -0,0 +1,283 @@
+"""httpx transports that retry rate-limited and unavailable responses.
+
+:class:`RetryTransport` (sync) and :class:`AsyncRetryTransport` wrap
+another transport and re-send a request that came back ``429 Too Many
+Requests`` or ``503 Service Unavailable``, sleeping for the server's
+``Retry-After`` (seconds or an HTTP date) or, without one, an
+exponential backoff. The retry goes through the same wrapped transport,
+so it reuses the pooled keep-alive connection instead of opening a new
+one the way a caller-level retry with a fresh client would.
+
+The clients install these when constructed with ``max_retries > 0``;
+they can also wrap a custom transport directly::
+
+    transport = RetryTransport(httpx.HTTPTransport(retries=3), max_retries=3)
+    client = httpx.Client(transport=transport)
+
+A ``503`` may come from a proxy after the server already acted on the
+request, so by default only idempotent methods (``GET``, ``HEAD``,
+``PUT``, ``DELETE``, ``OPTIONS``) are retried on it; ``429`` means the
+request was turned away and is retried for every method. Pass
+``retry_methods`` to widen or narrow the idempotent set.
+
+Requests are re-sent with the same body, so they must have a replayable
+(non-generator) body, which every request built by the Acteon clients
+has.
+
+This module also holds the helpers the SSE readers use to open their
+long-lived streams.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from contextlib import asynccontextmanager, contextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, AsyncIterator, Iterable, Iterator, Optional, Union
+
+import httpx
+
+__all__ = ["AsyncRetryTransport", "RetryTransport"]
+
+RETRY_STATUSES = frozenset({429, 503})
+
+# Methods safe to re-send after any retryable status; others only on 429.
+RETRY_METHODS = frozenset({"GET", "HEAD", "PUT", "DELETE", "OPTIONS"})
+
+
+def _sse_timeout(timeout: httpx.Timeout) -> httpx.Timeout:
+    """``timeout`` with the read timeout disabled, for long-lived SSE streams.
+
+    A stream can legitimately sit idle for longer than any request
+    timeout between events; only connecting (and the pool wait) should
+    stay bounded.
+    """
+    return httpx.Timeout(
+        connect=timeout.connect, read=None, write=timeout.write, pool=timeout.pool
+    )
+
+
+_SSE_HEADERS = {"Accept": "text/event-stream"}
+
+
+def _sse_request(
+    client: Union[httpx.Client, httpx.AsyncClient],
+    url: str,
+    *,
+    params: Any = None,
+    headers: Optional[dict[str, str]] = None,
+) -> httpx.Request:
+    """Build the ``GET`` that opens an SSE stream on ``client``.
+
+    The request carries the client's default headers (auth) plus
+    ``Accept: text/event-stream`` and ``headers``, minus the default JSON
+    ``Content-Type`` (the request has no body), and has no read timeout.
+    """
+    request = client.build_request(
+        "GET",
+        url,
+        params=params,
+        headers={**_SSE_HEADERS, **headers} if headers else _SSE_HEADERS,
+        timeout=_sse_timeout(client.timeout),
+    )
+    request.headers.pop("Content-Type", None)
+    return request
+
+
+@contextmanager
+def _open_sse(
+    client: httpx.Client,
+    url: str,
+    *,
+    params: Any = None,
+    headers: Optional[dict[str, str]] = None,
+) -> Iterator[httpx.Response]:
+    """Open an SSE stream; the response is closed when the block exits."""
+    request = _sse_request(client, url, params=params, headers=headers)
+    response = client.send(request, stream=True)
+    try:
+        yield response
+    finally:
+        response.close()
+
+
+@asynccontextmanager
+async def _async_open_sse(
+    client: httpx.AsyncClient,
+    url: str,
+    *,
+    params: Any = None,
+    headers: Optional[dict[str, str]] = None,
+) -> AsyncIterator[httpx.Response]:
+    """Async counterpart of :func:`_open_sse`."""
+    request = _sse_request(client, url, params=params, headers=headers)
+    response = await client.send(request, stream=True)
+    try:
+        yield response
+    finally:
+        await response.aclose()
+
+
+# Largest error body read off a failed SSE open; bigger (or unsized)
+# bodies are dropped with the connection instead of downloaded.
+_SSE_ERROR_BODY_LIMIT = 16 * 1024
+
+
+def _sse_error_body_is_small(response: httpx.Response) -> bool:
+    length = response.headers.get("content-length")
+    return length is not None and length.isdigit() and int(length) <= _SSE_ERROR_BODY_LIMIT
+
+
+def _read_sse_error(response: httpx.Response) -> str:
+    """Body text of a failed SSE open, or ``""`` if it is large or unsized."""
+    if _sse_error_body_is_small(response):
+        response.read()
+        return response.text
+    return ""
+
+
+async def _async_read_sse_error(response: httpx.Response) -> str:
+    """Async counterpart of :func:`_read_sse_error`."""
+    if _sse_error_body_is_small(response):
+        await response.aread()
+        return response.text
+    return ""
+
+
+def _retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a ``Retry-After`` header into seconds, or ``None`` if unusable."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class _RetryPolicy:
+    """Shared retry bookkeeping for the sync and async transports."""
+
+    def __init__(
+        self,
+        max_retries: int,
+        backoff_factor: float,
+        max_backoff: float,
+        retry_statuses: Iterable[int],
+        retry_methods: Iterable[str],
+    ):
+        if max_retries < 0:
+            raise ValueError("max_retries must not be negative")
+        self._max_retries = max_retries
+        self._backoff_factor = backoff_factor
+        self._max_backoff = max_backoff
+        self._retry_statuses = frozenset(retry_statuses)
+        self._retry_methods = frozenset(m.upper() for m in retry_methods)
+
+    def _delay(
+        self, request: httpx.Request, response: httpx.Response, attempt: int
+    ) -> Optional[float]:
+        """Seconds to wait before retrying, or ``None`` to return ``response``."""
+        status = response.status_code
+        if status not in self._retry_statuses or attempt >= self._max_retries:
+            return None
+        if status != 429 and request.method not in self._retry_methods:
+            # The server may have processed it; re-sending could duplicate
+            # a dispatch or create.
+            return None
+        delay = _retry_after(response.headers.get("Retry-After"))
+        if delay is None:
+            delay = self._backoff_factor * (2 ** attempt)
+        return min(delay, self._max_backoff)
+
+
+class RetryTransport(_RetryPolicy, httpx.BaseTransport):
+    """Retries 429 (and, for idempotent methods, 503) through the wrapped
+    sync transport."""
+
+    def __init__(
+        self,
+        transport: httpx.BaseTransport,
+        *,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30.0,
+        retry_statuses: Iterable[int] = RETRY_STATUSES,
+        retry_methods: Iterable[str] = RETRY_METHODS,
+    ):
+        """Wrap ``transport``.
+
+        Args:
+            transport: Transport that actually sends the requests.
+            max_retries: Retries per request after the first attempt.
+            backoff_factor: Without ``Retry-After``, wait
+                ``backoff_factor * 2 ** attempt`` seconds.
+            max_backoff: Upper bound on any single wait, including one
+                requested by ``Retry-After``.
+            retry_statuses: Status codes that trigger a retry.
+            retry_methods: Methods retried on any of ``retry_statuses``;
+                other methods are retried on ``429`` only.
+        """
+        super().__init__(
+            max_retries, backoff_factor, max_backoff, retry_statuses, retry_methods
+        )
+        self._transport = transport
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        attempt = 0
+        while True:
+            response = self._transport.handle_request(request)
+            delay = self._delay(request, response, attempt)
+            if delay is None:
+                return response
+            # Drain before closing so the connection goes back to the pool.
+            response.read()
+            response.close()
+            time.sleep(delay)
+            attempt += 1
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class AsyncRetryTransport(_RetryPolicy, httpx.AsyncBaseTransport):
+    """Retries 429/503 responses through the wrapped async transport."""
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        *,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30.0,
+        retry_statuses: Iterable[int] = RETRY_STATUSES,
+        retry_methods: Iterable[str] = RETRY_METHODS,
+    ):
+        """Wrap ``transport``. Arguments match :class:`RetryTransport`."""
+        super().__init__(
+            max_retries, backoff_factor, max_backoff, retry_statuses, retry_methods
+        )
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        attempt = 0
+        while True:
+            response = await self._transport.handle_async_request(request)
+            delay = self._delay(request, response, attempt)
+            if delay is None:
+                return response
+            await response.aread()
+            await response.aclose()
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
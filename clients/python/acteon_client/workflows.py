@@ -35,24 +35,15 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Callable, Optional
-from urllib.parse import quote
 
+from . import _json
+from ._paths import seg as _seg
 from .errors import ApiError, HttpError
 
 if TYPE_CHECKING:
     import httpx
 
 
-def _seg(s: str) -> str:
-    """Percent-encode a path segment opaquely (no ``/`` passthrough).
-
-    Mirrors ``_seg`` in ``bus.py``: an execution id or signal name
-    that happens to contain a slash must be escaped, not silently
-    split into additional path components.
-    """
-    return quote(s, safe="")
-
-
 def _raise_for_status(resp: "httpx.Response") -> None:
     """Translate a non-2xx response into either ``ApiError`` (with the
     server's structured error envelope) or ``HttpError`` (raw body).
@@ -60,7 +51,7 @@ def _raise_for_status(resp: "httpx.Response") -> None:
     if 200 <= resp.status_code < 300:
         return
     try:
-        data = resp.json()
+        data = _json.loads(resp.content)
         message = (
             data.get("error")
             or data.get("message")
@@ -219,7 +210,7 @@ class _WorkflowsClientMixin:
             body["search_attributes"] = search_attributes
         resp = self._request("POST", "/v1/workflows/start", json=body)
         _raise_for_status(resp)
-        return WorkflowExecution.from_dict(resp.json())
+        return WorkflowExecution.from_dict(_json.loads(resp.content))
 
     def list_workflow_executions(
         self,
@@ -258,7 +249,7 @@ class _WorkflowsClientMixin:
         resp = self._request("GET", "/v1/workflows/executions", params=params)
         _raise_for_status(resp)
         return [
-            WorkflowExecution.from_dict(e) for e in resp.json().get("executions", [])
+            WorkflowExecution.from_dict(e) for e in _json.loads(resp.content).get("executions", [])
         ]
 
     def get_workflow_execution(
@@ -281,7 +272,7 @@ class _WorkflowsClientMixin:
         if resp.status_code == 404:
             return None
         _raise_for_status(resp)
-        return WorkflowExecution.from_dict(resp.json())
+        return WorkflowExecution.from_dict(_json.loads(resp.content))
 
     def signal_workflow(
         self,
@@ -389,7 +380,7 @@ class _WorkflowsClientMixin:
             },
         )
         _raise_for_status(resp)
-        return WorkflowCheckpoint.from_dict(resp.json())
+        return WorkflowCheckpoint.from_dict(_json.loads(resp.content))
 
     def start_child_workflow(
         self,
@@ -442,7 +433,7 @@ class _WorkflowsClientMixin:
             json=body,
         )
         _raise_for_status(resp)
-        return resp.json()["child_execution_id"]
+        return _json.loads(resp.content)["child_execution_id"]
 
     def get_execution_history(
         self, execution_id: str, namespace: str, tenant: str
@@ -467,7 +458,7 @@ class _WorkflowsClientMixin:
             params={"namespace": namespace, "tenant": tenant},
         )
         _raise_for_status(resp)
-        return ExecutionHistory.from_dict(resp.json())
+        return ExecutionHistory.from_dict(_json.loads(resp.content))
 
 
 # ============================================================================
@@ -515,7 +506,7 @@ class _AsyncWorkflowsClientMixin:
             body["search_attributes"] = search_attributes
         resp = await self._request("POST", "/v1/workflows/start", json=body)
         _raise_for_status(resp)
-        return WorkflowExecution.from_dict(resp.json())
+        return WorkflowExecution.from_dict(_json.loads(resp.content))
 
     async def list_workflow_executions(
         self,
@@ -537,7 +528,7 @@ class _AsyncWorkflowsClientMixin:
         resp = await self._request("GET", "/v1/workflows/executions", params=params)
         _raise_for_status(resp)
         return [
-            WorkflowExecution.from_dict(e) for e in resp.json().get("executions", [])
+            WorkflowExecution.from_dict(e) for e in _json.loads(resp.content).get("executions", [])
         ]
 
     async def get_workflow_execution(
@@ -552,7 +543,7 @@ class _AsyncWorkflowsClientMixin:
         if resp.status_code == 404:
             return None
         _raise_for_status(resp)
-        return WorkflowExecution.from_dict(resp.json())
+        return WorkflowExecution.from_dict(_json.loads(resp.content))
 
     async def signal_workflow(
         self,
@@ -613,7 +604,7 @@ class _AsyncWorkflowsClientMixin:
             },
         )
         _raise_for_status(resp)
-        return WorkflowCheckpoint.from_dict(resp.json())
+        return WorkflowCheckpoint.from_dict(_json.loads(resp.content))
 
     async def start_child_workflow(
         self,
@@ -645,7 +636,7 @@ class _AsyncWorkflowsClientMixin:
             json=body,
         )
         _raise_for_status(resp)
-        return resp.json()["child_execution_id"]
+        return _json.loads(resp.content)["child_execution_id"]
 
     async def get_execution_history(
         self, execution_id: str, namespace: str, tenant: str
@@ -657,7 +648,7 @@ class _AsyncWorkflowsClientMixin:
             params={"namespace": namespace, "tenant": tenant},
         )
         _raise_for_status(resp)
-        return ExecutionHistory.from_dict(resp.json())
+        return ExecutionHistory.from_dict(_json.loads(resp.content))
 
 
 # ============================================================================
@@ -7,6 +7,7 @@ server expects, and the mixin's per-method URL + header behaviour
 is observable from a fake ``_request`` capture.
 """
 
+import json
 import unittest
 from typing import Any, Optional
 
@@ -43,15 +44,16 @@ class _Captured:
 
 class _FakeResponse:
     """Minimal ``httpx.Response`` stand-in covering only the bits the
-    A2A mixin uses (``status_code``, ``json()``, ``text``)."""
+    A2A mixin uses (``status_code``, ``content``, ``text``)."""
 
     def __init__(self, status_code: int = 200, body: Any = None):
         self.status_code = status_code
         self._body = body if body is not None else {}
         self.text = ""
 
-    def json(self):
-        return self._body
+    @property
+    def content(self) -> bytes:
+        return json.dumps(self._body).encode()
 
 
 class _StubClient(_A2AClientMixin):
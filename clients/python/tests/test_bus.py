@@ -424,6 +424,37 @@ class TestStreamConsumeUrl(unittest.TestCase):
         )
 
 
+class TestBusStreamHeaders(unittest.TestCase):
+    def test_consume_sends_client_headers_without_content_type(self):
+        import httpx
+
+        from acteon_client import ActeonClient
+
+        seen = []
+
+        def respond(request):
+            seen.append(request)
+            return httpx.Response(
+                200,
+                headers={"content-type": "text/event-stream"},
+                content=b"event: bus.stream.error\ndata: boom\n\n",
+            )
+
+        c = ActeonClient("http://localhost:3000", api_key="k")
+        c._client.close()
+        c._client = httpx.Client(
+            base_url=c.base_url,
+            headers=c._client.headers,
+            transport=httpx.MockTransport(respond),
+        )
+        item = next(c.consume_bus_stream("agents", "demo", "t-1", "s-1"))
+        self.assertEqual(item.error, "boom")
+        headers = seen[0].headers
+        self.assertEqual(headers["authorization"], "Bearer k")
+        self.assertEqual(headers["accept"], "text/event-stream")
+        self.assertNotIn("content-type", headers)
+
+
 class TestAsyncSurface(unittest.TestCase):
     """Smoke test that the async client carries an async bus surface.
 
@@ -0,0 +1,188 @@
+"""Opt-in TTL cache for idempotent lookups."""
+
+import unittest
+
+import httpx
+
+from acteon_client import ActeonClient, AsyncActeonClient
+from acteon_client._cache import _TTLCache
+
+_GROUP = {
+    "group": {
+        "group_id": "g1",
+        "group_key": "k1",
+        "event_count": 1,
+        "state": "pending",
+        "created_at": "c",
+    },
+    "events": [],
+    "labels": {},
+}
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTTLCache(unittest.TestCase):
+    def test_entries_expire(self):
+        clock = _Clock()
+        cache = _TTLCache(8, 2.0, clock=clock)
+        cache.set(("quota", "q1"), "v")
+        clock.now = 1.9
+        self.assertEqual(cache.get(("quota", "q1")), "v")
+        clock.now = 2.0
+        self.assertIsNone(cache.get(("quota", "q1")))
+        self.assertEqual(len(cache), 0)
+
+    def test_least_recently_used_evicted(self):
+        cache = _TTLCache(2, 60.0)
+        cache.set(("a", "1"), 1)
+        cache.set(("a", "2"), 2)
+        cache.get(("a", "1"))
+        cache.set(("a", "3"), 3)
+        self.assertIsNone(cache.get(("a", "2")))
+        self.assertEqual(cache.get(("a", "1")), 1)
+
+    def test_discard_drops_all_variants(self):
+        cache = _TTLCache(8, 60.0)
+        cache.set(("chain", "c1", "ns", "t1"), 1)
+        cache.set(("chain", "c1", "ns", "t2"), 2)
+        cache.set(("chain", "c2", "ns", "t1"), 3)
+        cache.discard("chain", "c1")
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.get(("chain", "c2", "ns", "t1")), 3)
+
+    def test_set_after_invalidation_is_dropped(self):
+        cache = _TTLCache(8, 60.0)
+        generation = cache.generation
+        cache.discard("quota", "q1")
+        cache.set(("quota", "q1"), "stale", generation)
+        self.assertIsNone(cache.get(("quota", "q1")))
+        cache.set(("quota", "q1"), "fresh", cache.generation)
+        self.assertEqual(cache.get(("quota", "q1")), "fresh")
+
+
+
+def _group_handler(requests: list):
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.method == "DELETE":
+            return httpx.Response(
+                200, json={"group_id": "g1", "group_key": "k1", "event_count": 1, "notified": True}
+            )
+        return httpx.Response(200, json=_GROUP)
+
+    return handler
+
+
+class TestClientCache(unittest.TestCase):
+    def _client(self, requests: list, **kwargs) -> ActeonClient:
+        client = ActeonClient("http://acteon.test", **kwargs)
+        client._client.close()
+        client._client = httpx.Client(
+            base_url=client.base_url, transport=httpx.MockTransport(_group_handler(requests))
+        )
+        return client
+
+    def test_off_by_default(self):
+        requests: list = []
+        with self._client(requests) as client:
+            client.get_group("k1")
+            client.get_group("k1")
+        self.assertEqual(len(requests), 2)
+
+    def test_hits_skip_request_until_invalidated(self):
+        requests: list = []
+        with self._client(requests, cache_ttl=60) as client:
+            first = client.get_group("k1")
+            self.assertIs(client.get_group("k1"), first)
+            client.flush_group("k1")
+            client.get_group("k1")
+            client.cache_clear()
+            client.get_group("k1")
+        self.assertEqual([r.method for r in requests], ["GET", "DELETE", "GET", "GET"])
+
+    def test_lookup_during_mutation_is_not_left_cached(self):
+        requests: list = []
+        client = self._client(requests, cache_ttl=60)
+        handler = _group_handler(requests)
+
+        def racing(request: httpx.Request) -> httpx.Response:
+            if request.method == "DELETE":
+                # A concurrent reader sees the pre-flush state mid-request.
+                client.get_group("k1")
+            return handler(request)
+
+        client._client = httpx.Client(
+            base_url=client.base_url, transport=httpx.MockTransport(racing)
+        )
+        with client:
+            client.flush_group("k1")
+            client.get_group("k1")
+        self.assertEqual([r.method for r in requests], ["GET", "DELETE", "GET"])
+
+    def test_api_key_change_drops_cached_lookups(self):
+        requests: list = []
+        with self._client(requests, cache_ttl=60) as client:
+            client.get_group("k1")
+            client.api_key = "other"
+            client.get_group("k1")
+        self.assertEqual(len(requests), 2)
+        self.assertEqual(requests[1].headers["authorization"], "Bearer other")
+
+    def test_rule_list_dropped_by_rule_changes(self):
+        requests: list = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            if request.url.path == "/v1/rules":
+                return httpx.Response(
+                    200, json=[{"name": "r1", "priority": 1, "enabled": True}]
+                )
+            return httpx.Response(200, json={"loaded": 1})
+
+        client = ActeonClient("http://acteon.test", cache_ttl=60)
+        client._client.close()
+        client._client = httpx.Client(
+            base_url=client.base_url, transport=httpx.MockTransport(handler)
+        )
+        with client:
+            first = client.list_rules()
+            self.assertIs(client.list_rules(), first)
+            client.set_rule_enabled("r1", False)
+            client.list_rules()
+            client.reload_rules()
+            client.list_rules()
+        self.assertEqual(
+            [(r.method, r.url.path) for r in requests],
+            [
+                ("GET", "/v1/rules"),
+                ("PUT", "/v1/rules/r1/enabled"),
+                ("GET", "/v1/rules"),
+                ("POST", "/v1/rules/reload"),
+                ("GET", "/v1/rules"),
+            ],
+        )
+
+
+class TestAsyncClientCache(unittest.IsolatedAsyncioTestCase):
+    async def test_hits_skip_request(self):
+        requests: list = []
+        client = AsyncActeonClient("http://acteon.test", cache_ttl=60)
+        await client._client.aclose()
+        client._client = httpx.AsyncClient(
+            base_url=client.base_url, transport=httpx.MockTransport(_group_handler(requests))
+        )
+        async with client:
+            first = await client.get_group("k1")
+            self.assertIs(await client.get_group("k1"), first)
+        self.assertEqual(len(requests), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,862 @@
+"""ActeonClient / AsyncActeonClient — request shape and response handling.
+
+These tests swap the client's underlying ``httpx`` client for one
+backed by ``httpx.MockTransport`` so the real request-building and
+response-parsing paths run end-to-end without a live server. The
+handler records every request it sees so tests can assert on the
+wire surface (method, path, query, body).
+"""
+
+import asyncio
+import json
+import unittest
+from typing import Any, Callable
+
+import httpx
+
+from acteon_client import (
+    ActeonClient,
+    Action,
+    ApiError,
+    ApprovalLookup,
+    AsyncActeonClient,
+    AuditQuery,
+    HttpError,
+)
+
+_EXECUTED = {"Executed": {"status": "success", "body": {}, "headers": {}}}
+
+
+def _action(**overrides: Any) -> Action:
+    fields: dict[str, Any] = {
+        "namespace": "ns",
+        "tenant": "t1",
+        "provider": "email",
+        "action_type": "send",
+        "payload": {"to": "a@b.c"},
+    }
+    fields.update(overrides)
+    return Action(**fields)
+
+
+class _Recorder:
+    """Mock-transport handler that records requests and delegates the
+    response to a per-test ``respond`` callable."""
+
+    def __init__(self, respond: Callable[[httpx.Request], httpx.Response]):
+        self.respond = respond
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        return self.respond(request)
+
+
+def _sync_client(recorder: _Recorder) -> ActeonClient:
+    client = ActeonClient("http://acteon.test")
+    client._client.close()
+    client._client = httpx.Client(
+        base_url=client.base_url,
+        headers=client._client.headers,
+        transport=httpx.MockTransport(recorder),
+    )
+    return client
+
+
+def _async_client(recorder: _Recorder) -> AsyncActeonClient:
+    client = AsyncActeonClient("http://acteon.test")
+    client._client = httpx.AsyncClient(
+        base_url=client.base_url,
+        headers=client._client.headers,
+        transport=httpx.MockTransport(recorder),
+    )
+    return client
+
+
+def _fail_tenant(bad: str) -> Callable[[httpx.Request], httpx.Response]:
+    """Respond 200/Executed, except for actions whose tenant is ``bad``."""
+
+    def respond(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        if body["tenant"] == bad:
+            return httpx.Response(
+                400, json={"code": "BAD", "message": "nope", "retryable": False}
+            )
+        return httpx.Response(200, json=_EXECUTED)
+
+    return respond
+
+
+def _audit_record(n: int) -> dict:
+    return {
+        "id": f"r{n}",
+        "action_id": f"a{n}",
+        "namespace": "ns",
+        "tenant": "t1",
+        "provider": "email",
+        "action_type": "send",
+        "verdict": "allow",
+        "outcome": "executed",
+        "matched_rule": None,
+        "duration_ms": 1,
+        "dispatched_at": "2026-01-01T00:00:00Z",
+    }
+
+
+def _audit_pages(pages: list[list[int]]) -> Callable[[httpx.Request], httpx.Response]:
+    """Serve ``pages`` in order, chaining them with cursors ``c1``, ``c2``, ..."""
+
+    def respond(request: httpx.Request) -> httpx.Response:
+        cursor = request.url.params.get("cursor")
+        index = int(cursor[1:]) if cursor else 0
+        body = {
+            "records": [_audit_record(n) for n in pages[index]],
+            "total": None,
+            "limit": 2,
+            "offset": 0,
+            "next_cursor": f"c{index + 1}" if index + 1 < len(pages) else None,
+        }
+        return httpx.Response(200, json=body)
+
+    return respond
+
+
+class TestIterAudit(unittest.TestCase):
+    def test_follows_cursor_until_exhausted(self):
+        rec = _Recorder(_audit_pages([[1, 2], [3, 4], [5]]))
+        with _sync_client(rec) as client:
+            ids = [r.id for r in client.iter_audit(AuditQuery(tenant="t1", limit=2, offset=7))]
+        self.assertEqual(ids, ["r1", "r2", "r3", "r4", "r5"])
+        self.assertEqual(len(rec.requests), 3)
+        first, second = rec.requests[0].url.params, rec.requests[1].url.params
+        self.assertEqual(first.get("offset"), "7")
+        self.assertNotIn("cursor", first)
+        self.assertEqual(second.get("cursor"), "c1")
+        self.assertNotIn("offset", second)
+        self.assertEqual(second.get("tenant"), "t1")
+
+    def test_lazy(self):
+        rec = _Recorder(_audit_pages([[1, 2], [3]]))
+        with _sync_client(rec) as client:
+            records = client.iter_audit()
+            next(records)
+            self.assertEqual(len(rec.requests), 1)
+
+
+class TestAsyncIterAudit(unittest.IsolatedAsyncioTestCase):
+    async def test_follows_cursor(self):
+        rec = _Recorder(_audit_pages([[1, 2], [3]]))
+        async with _async_client(rec) as client:
+            ids = [r.id async for r in client.iter_audit(AuditQuery(limit=2))]
+        self.assertEqual(ids, ["r1", "r2", "r3"])
+        self.assertEqual(rec.requests[1].url.params.get("cursor"), "c1")
+
+
+class TestAsyncParity(unittest.TestCase):
+    def test_async_client_mirrors_sync_surface(self):
+        import inspect
+
+        sync = {
+            n for n, _ in inspect.getmembers(ActeonClient, inspect.isfunction)
+            if not n.startswith("_")
+        }
+        missing = sorted(n for n in sync if not hasattr(AsyncActeonClient, n))
+        self.assertEqual(missing, [])
+
+    def test_async_time_interval_and_swarm_methods_are_coroutines(self):
+        import inspect
+
+        for name in (
+            "create_time_interval",
+            "list_time_intervals",
+            "get_time_interval",
+            "update_time_interval",
+            "delete_time_interval",
+            "list_swarm_runs",
+            "get_swarm_run",
+            "cancel_swarm_run",
+            "aclose",
+        ):
+            with self.subTest(name=name):
+                self.assertTrue(inspect.iscoroutinefunction(getattr(AsyncActeonClient, name)))
+
+
+class TestAsyncSwarmRuns(unittest.IsolatedAsyncioTestCase):
+    async def test_get_swarm_run_quotes_id_and_maps_404(self):
+        rec = _Recorder(lambda _: httpx.Response(404, json={}))
+        async with _async_client(rec) as client:
+            self.assertIsNone(await client.get_swarm_run("a/b?c"))
+        self.assertEqual(rec.requests[0].url.raw_path, b"/v1/swarm/runs/a%2Fb%3Fc")
+
+
+class TestPipeline(unittest.TestCase):
+    def test_results_in_call_order(self):
+        def respond(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/v1/rules":
+                return httpx.Response(200, json=[])
+            return httpx.Response(200)
+
+        rec = _Recorder(respond)
+        with _sync_client(rec) as client:
+            rules, healthy = client.pipeline([client.list_rules, client.health])
+        self.assertEqual(rules, [])
+        self.assertTrue(healthy)
+        self.assertEqual(len(rec.requests), 2)
+
+    def test_error_propagates(self):
+        rec = _Recorder(lambda _: httpx.Response(500))
+        with _sync_client(rec) as client:
+            with self.assertRaises(HttpError):
+                client.pipeline([client.health, client.list_rules])
+
+
+class TestAsyncPipeline(unittest.IsolatedAsyncioTestCase):
+    async def test_gathers_in_order(self):
+        rec = _Recorder(lambda r: httpx.Response(200, json=[] if "rules" in r.url.path else {}))
+        async with _async_client(rec) as client:
+            healthy, rules = await client.pipeline([client.health(), client.list_rules()])
+        self.assertTrue(healthy)
+        self.assertEqual(rules, [])
+
+    async def test_concurrency_is_bounded(self):
+        in_flight = peak = 0
+
+        async def respond(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.001)
+            in_flight -= 1
+            return httpx.Response(200, json=[])
+
+        async with _async_client(_Recorder(respond)) as client:
+            results = await client.pipeline(
+                (client.list_rules() for _ in range(6)),
+                max_concurrency=2,
+            )
+        self.assertEqual(results, [[]] * 6)
+        self.assertEqual(peak, 2)
+
+
+_SNAPSHOT_BODIES = {
+    "/v1/approvals": {"approvals": [], "count": 0},
+    "/v1/recurring": {"recurring_actions": [], "count": 0},
+    "/v1/quotas": {"quotas": [], "count": 0},
+    "/v1/chains": {"chains": []},
+    "/v1/dlq/stats": {"enabled": True, "count": 3},
+}
+
+
+def _snapshot_body(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json=_SNAPSHOT_BODIES[request.url.path])
+
+
+class TestSnapshot(unittest.TestCase):
+    def test_fans_out_all_reads(self):
+        rec = _Recorder(_snapshot_body)
+        with _sync_client(rec) as client:
+            snap = client.snapshot("ns", "t1")
+        self.assertEqual(sorted(r.url.path for r in rec.requests), sorted(_SNAPSHOT_BODIES))
+        self.assertEqual(snap.dlq.count, 3)
+        for request in rec.requests:
+            if request.url.path != "/v1/dlq/stats":
+                self.assertEqual(request.url.params.get("tenant"), "t1")
+
+
+class TestAsyncSnapshot(unittest.IsolatedAsyncioTestCase):
+    async def test_gathers_all_reads(self):
+        rec = _Recorder(_snapshot_body)
+        async with _async_client(rec) as client:
+            snap = await client.snapshot("ns", "t1")
+        self.assertEqual(len(rec.requests), 5)
+        self.assertEqual(snap.quotas.count, 0)
+
+
+def _recurring(request: httpx.Request) -> httpx.Response:
+    recurring_id = request.url.path.split("/")[3]
+    if recurring_id == "paused":
+        return httpx.Response(409)
+    body = json.loads(request.content)
+    return httpx.Response(200, json={
+        "id": recurring_id,
+        "namespace": body["namespace"],
+        "tenant": body["tenant"],
+        "cron_expr": "* * * * *",
+        "timezone": "UTC",
+        "enabled": False,
+        "provider": "email",
+        "action_type": "send",
+        "execution_count": 0,
+        "created_at": "c",
+        "updated_at": "u",
+    })
+
+
+class TestFanOut(unittest.TestCase):
+    def test_pause_many_keeps_order_and_failures(self):
+        rec = _Recorder(_recurring)
+        with _sync_client(rec) as client:
+            results = client.pause_many_recurring(["r1", "paused", "r2"], "ns", "t1")
+        self.assertEqual(len(rec.requests), 3)
+        self.assertEqual(results[0].id, "r1")
+        self.assertIsInstance(results[1], HttpError)
+        self.assertEqual(results[1].status, 409)
+        self.assertEqual(results[2].id, "r2")
+
+
+class TestAsyncFanOut(unittest.IsolatedAsyncioTestCase):
+    async def test_resume_many(self):
+        rec = _Recorder(_recurring)
+        async with _async_client(rec) as client:
+            results = await client.resume_many_recurring(
+                ["r1", "paused"], "ns", "t1", max_concurrency=1
+            )
+        self.assertEqual([r.url.path for r in rec.requests],
+                         ["/v1/recurring/r1/resume", "/v1/recurring/paused/resume"])
+        self.assertEqual(results[0].tenant, "t1")
+        self.assertIsInstance(results[1], HttpError)
+
+
+class TestWarmup(unittest.TestCase):
+    def test_warmup_hits_health(self):
+        rec = _Recorder(lambda _: httpx.Response(200))
+        with _sync_client(rec) as client:
+            client.warmup(connections=3)
+        self.assertEqual([r.url.path for r in rec.requests], ["/health"] * 3)
+
+    def test_warmup_ignores_connection_errors(self):
+        def respond(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("refused", request=request)
+
+        with _sync_client(_Recorder(respond)) as client:
+            client.warmup()
+
+
+class TestHealth(unittest.TestCase):
+    def test_head_request(self):
+        rec = _Recorder(lambda _: httpx.Response(200))
+        with _sync_client(rec) as client:
+            self.assertTrue(client.health())
+        self.assertEqual([r.method for r in rec.requests], ["HEAD"])
+
+    def test_falls_back_to_get(self):
+        rec = _Recorder(lambda r: httpx.Response(405 if r.method == "HEAD" else 200))
+        with _sync_client(rec) as client:
+            self.assertTrue(client.health())
+        self.assertEqual([r.method for r in rec.requests], ["HEAD", "GET"])
+
+    def test_fallback_remembered(self):
+        rec = _Recorder(lambda r: httpx.Response(405 if r.method == "HEAD" else 200))
+        with _sync_client(rec) as client:
+            self.assertTrue(client.health())
+            self.assertTrue(client.health())
+            self.assertTrue(client.health())
+        self.assertEqual([r.method for r in rec.requests], ["HEAD", "GET", "GET", "GET"])
+        self.assertIsNot(rec.requests[2], rec.requests[3])
+
+    def test_concurrent_warmup_sends_distinct_requests(self):
+        rec = _Recorder(lambda _: httpx.Response(200))
+        with _sync_client(rec) as client:
+            client.warmup(connections=4)
+        self.assertEqual(len({id(r) for r in rec.requests}), 4)
+
+    def test_api_key_change_applies_to_probe(self):
+        rec = _Recorder(lambda _: httpx.Response(200))
+        with _sync_client(rec) as client:
+            client.health()
+            client.api_key = "k2"
+            client.health()
+        self.assertNotIn("authorization", rec.requests[0].headers)
+        self.assertEqual(rec.requests[1].headers["authorization"], "Bearer k2")
+
+
+class TestConnectionPool(unittest.TestCase):
+    def test_limits_forwarded(self):
+        with ActeonClient(
+            "http://acteon.test/prefix/",
+            max_connections=8,
+            max_keepalive_connections=4,
+            keepalive_expiry=12.0,
+        ) as client:
+            pool = client._client._transport._pool
+            self.assertEqual(pool._max_connections, 8)
+            self.assertEqual(pool._max_keepalive_connections, 4)
+            self.assertEqual(pool._keepalive_expiry, 12.0)
+
+    def test_paths_join_base_url_prefix(self):
+        rec = _Recorder(lambda _: httpx.Response(200))
+        client = ActeonClient("http://acteon.test/prefix/")
+        client._client = httpx.Client(
+            base_url=client.base_url, transport=httpx.MockTransport(rec)
+        )
+        with client:
+            client.health()
+        self.assertEqual(str(rec.requests[0].url), "http://acteon.test/prefix/health")
+
+
+class TestShared(unittest.TestCase):
+    def tearDown(self):
+        ActeonClient._close_all()
+
+    def test_same_arguments_share_one_client(self):
+        a = ActeonClient.shared("http://acteon.test/", api_key="k", timeout=5.0)
+        b = ActeonClient.shared("http://acteon.test", api_key="k", timeout=5.0)
+        self.assertIs(a, b)
+        self.assertIsNot(a, ActeonClient.shared("http://acteon.test", api_key="other"))
+        self.assertIsNot(a, ActeonClient.shared("http://acteon.test", api_key="k"))
+
+    def test_close_all_closes_and_forgets(self):
+        client = ActeonClient.shared("http://acteon.test")
+        ActeonClient._close_all()
+        self.assertTrue(client._client.is_closed)
+        self.assertIsNot(client, ActeonClient.shared("http://acteon.test"))
+
+
+class TestHeaders(unittest.TestCase):
+    def test_auth_header_follows_api_key(self):
+        rec = _Recorder(lambda _: httpx.Response(200, json=_EXECUTED))
+        with _sync_client(rec) as client:
+            client.dispatch(_action())
+            client.api_key = "k1"
+            client.dispatch(_action())
+        self.assertNotIn("authorization", rec.requests[0].headers)
+        self.assertEqual(rec.requests[1].headers["authorization"], "Bearer k1")
+
+    def test_constructor_key_and_clearing(self):
+        rec = _Recorder(lambda _: httpx.Response(200))
+        client = ActeonClient("http://acteon.test", api_key="k0")
+        client._client = httpx.Client(
+            base_url=client.base_url,
+            headers=client._client.headers,
+            transport=httpx.MockTransport(rec),
+        )
+        with client:
+            client.health()
+            client.api_key = None
+            client.health()
+        self.assertEqual(rec.requests[0].headers["authorization"], "Bearer k0")
+        self.assertEqual(rec.requests[0].headers["content-type"], "application/json")
+        self.assertNotIn("authorization", rec.requests[1].headers)
+
+    def test_preencoded_content_sent_verbatim(self):
+        rec = _Recorder(lambda _: httpx.Response(200))
+        with _sync_client(rec) as client:
+            client._request("POST", "/x", content=b'{"a":1}', json={"ignored": True})
+            client._request("POST", "/x", json=[1, "é"])
+        self.assertEqual(rec.requests[0].content, b'{"a":1}')
+        self.assertEqual(rec.requests[1].content, '[1,"é"]'.encode())
+        self.assertEqual(rec.requests[1].headers["content-type"], "application/json")
+
+    def test_extra_headers_do_not_leak(self):
+        rec = _Recorder(lambda _: httpx.Response(200, json={}))
+        with _sync_client(rec) as client:
+            client.api_key = "k1"
+            client._request("GET", "/x", extra_headers={"X-Extra": "1"})
+            client._request("GET", "/x", skip_auth=True)
+            client._request("GET", "/x")
+        self.assertEqual(rec.requests[0].headers["x-extra"], "1")
+        self.assertNotIn("authorization", rec.requests[1].headers)
+        self.assertNotIn("x-extra", rec.requests[2].headers)
+        self.assertEqual(rec.requests[2].headers["authorization"], "Bearer k1")
+
+
+class TestApiErrors(unittest.TestCase):
+    def test_dispatch_error_body_becomes_api_error(self):
+        body = {"code": "RATE_LIMITED", "message": "slow down", "retryable": True}
+        rec = _Recorder(lambda _: httpx.Response(429, json=body))
+        with _sync_client(rec) as client:
+            with self.assertRaises(ApiError) as ctx:
+                client.dispatch(_action())
+        self.assertEqual(ctx.exception.code, "RATE_LIMITED")
+        self.assertTrue(ctx.exception.retryable)
+        self.assertIn("slow down", str(ctx.exception))
+
+    def test_error_key_used_when_message_missing(self):
+        rec = _Recorder(lambda _: httpx.Response(400, json={"error": "bad input"}))
+        with _sync_client(rec) as client:
+            with self.assertRaises(ApiError) as ctx:
+                client.dispatch(_action())
+        self.assertEqual(ctx.exception.code, "UNKNOWN")
+        self.assertIn("bad input", str(ctx.exception))
+
+    def test_non_json_error_body_becomes_http_error(self):
+        responses = [
+            httpx.Response(
+                502, headers={"content-type": "text/html"}, content=b"<html>bad gateway</html>"
+            ),
+            httpx.Response(500, content=b"{truncated"),
+            httpx.Response(500, json=["not", "an", "object"]),
+            httpx.Response(400, json={"message": "x" * (70 * 1024)}),
+        ]
+        for response in responses:
+            rec = _Recorder(lambda _, r=response: r)
+            with self.subTest(status=response.status_code), _sync_client(rec) as client:
+                with self.assertRaises(HttpError) as ctx:
+                    client.dispatch(_action())
+                self.assertEqual(ctx.exception.status, response.status_code)
+
+
+class TestApprovalParams(unittest.TestCase):
+    def test_signed_query_string(self):
+        body = {"id": "a1", "status": "approved"}
+        rec = _Recorder(lambda _: httpx.Response(200, json=body))
+        with _sync_client(rec) as client:
+            client.approve("ns", "t1", "a1", sig="abc", expires_at=99)
+            client.reject("ns", "t1", "a1", sig="abc", expires_at=99, kid="k2")
+        self.assertEqual(
+            [r.url.query.decode() for r in rec.requests],
+            ["sig=abc&expires_at=99", "sig=abc&expires_at=99&kid=k2"],
+        )
+        self.assertEqual(rec.requests[1].url.path, "/v1/approvals/ns/t1/a1/reject")
+
+    def test_decision_errors(self):
+        for status, message in ((404, "not found"), (410, "already decided"), (500, "reject")):
+            rec = _Recorder(lambda _, status=status: httpx.Response(status))
+            with self.subTest(status=status), _sync_client(rec) as client:
+                with self.assertRaises(HttpError) as ctx:
+                    client.reject("ns", "t1", "a1", sig="abc", expires_at=99)
+                self.assertEqual(ctx.exception.status, status)
+                self.assertIn(message, str(ctx.exception))
+
+
+class TestPathSegments(unittest.TestCase):
+    def test_ids_are_percent_encoded(self):
+        rec = _Recorder(lambda r: httpx.Response(200 if r.method == "PUT" else 404))
+        with _sync_client(rec) as client:
+            client.set_rule_enabled("team/a#1", True)
+            client.get_audit_record("a b?")
+        self.assertEqual(
+            [r.url.raw_path for r in rec.requests],
+            [b"/v1/rules/team%2Fa%231/enabled", b"/v1/audit/a%20b%3F"],
+        )
+
+    def test_sub_clients_share_the_cached_encoder(self):
+        from acteon_client import _paths, a2a, bus, client, queues, workflows
+
+        for module in (a2a, bus, client, queues, workflows):
+            with self.subTest(module=module.__name__):
+                self.assertIs(module._seg, _paths.seg)
+
+
+class TestOptionalParams(unittest.TestCase):
+    def test_none_filters_are_omitted(self):
+        rec = _Recorder(
+            lambda _: httpx.Response(200, json={"chains": [], "quotas": [], "count": 0})
+        )
+        with _sync_client(rec) as client:
+            client.list_chains("ns", "t1")
+            client.list_chains("ns", "t1", status="running")
+            client.list_quotas(tenant="t1")
+        self.assertEqual(
+            [r.url.query.decode() for r in rec.requests],
+            ["namespace=ns&tenant=t1", "namespace=ns&tenant=t1&status=running", "tenant=t1"],
+        )
+
+    def test_analytics_params_renamed_and_stringified(self):
+        body = {"metric": "volume", "interval": "hourly", "from": "a", "to": "b", "total_count": 0}
+        rec = _Recorder(lambda _: httpx.Response(200, json=body))
+        with _sync_client(rec) as client:
+            client.query_analytics("volume", tenant="t1", from_time="a", to_time="b", top_n=5)
+        self.assertEqual(
+            rec.requests[0].url.query.decode(), "metric=volume&tenant=t1&from=a&to=b&top_n=5"
+        )
+
+
+def _approval_status(request: httpx.Request) -> httpx.Response:
+    approval_id = request.url.path.rsplit("/", 1)[-1]
+    if approval_id == "missing":
+        return httpx.Response(404)
+    return httpx.Response(
+        200,
+        json={
+            "token": approval_id,
+            "status": "pending",
+            "rule": "r",
+            "created_at": "c",
+            "expires_at": "e",
+        },
+    )
+
+
+_LOOKUPS = [
+    ApprovalLookup("ns", "t1", "a1", sig="s1", expires_at=1),
+    ApprovalLookup("ns", "t1", "missing", sig="s2", expires_at=2),
+    ApprovalLookup("ns", "t1", "a3", sig="s3", expires_at=3, kid="k"),
+]
+
+
+class TestGetApprovals(unittest.TestCase):
+    def test_results_in_input_order(self):
+        rec = _Recorder(_approval_status)
+        with _sync_client(rec) as client:
+            statuses = client.get_approvals(_LOOKUPS)
+        self.assertEqual([s and s.token for s in statuses], ["a1", None, "a3"])
+        self.assertEqual(len(rec.requests), 3)
+        self.assertEqual(client.get_approvals([]), [])
+
+
+class TestAsyncGetApprovals(unittest.IsolatedAsyncioTestCase):
+    async def test_results_in_input_order(self):
+        rec = _Recorder(_approval_status)
+        async with _async_client(rec) as client:
+            statuses = await client.get_approvals(_LOOKUPS)
+        self.assertEqual([s and s.token for s in statuses], ["a1", None, "a3"])
+
+    async def test_concurrent_duplicates_share_one_request(self):
+        rec = _Recorder(_approval_status)
+        async with _async_client(rec) as client:
+            lookups = [_LOOKUPS[0], _LOOKUPS[0], _LOOKUPS[1], _LOOKUPS[1]]
+            statuses = await client.get_approvals(lookups)
+            self.assertEqual(len(rec.requests), 2)
+            self.assertIs(statuses[0], statuses[1])
+            self.assertEqual(client._inflight, {})
+            await client.get_approvals(lookups[:1])
+        self.assertEqual(len(rec.requests), 3)
+
+    async def test_read_after_approve_does_not_join_older_read(self):
+        status = "pending"
+        first_seen = asyncio.Event()
+        release = asyncio.Event()
+        gets = 0
+
+        async def respond(request: httpx.Request) -> httpx.Response:
+            nonlocal status, gets
+            if request.method == "POST":
+                status = "approved"
+                return httpx.Response(200, json={"id": "a1", "status": status})
+            seen = status
+            gets += 1
+            if gets == 1:
+                first_seen.set()
+                await release.wait()
+            return httpx.Response(200, json={
+                "token": "a1", "status": seen, "rule": "r", "created_at": "c", "expires_at": "e",
+            })
+
+        async with _async_client(_Recorder(respond)) as client:
+            lk = _LOOKUPS[0]
+            args = (lk.namespace, lk.tenant, lk.id, lk.sig, lk.expires_at)
+            before = asyncio.ensure_future(client.get_approval(*args))
+            await first_seen.wait()
+            await client.approve(*args)
+            after = asyncio.ensure_future(client.get_approval(*args))
+            await asyncio.sleep(0)
+            release.set()
+            self.assertEqual((await before).status, "pending")
+            self.assertEqual((await after).status, "approved")
+        self.assertEqual(gets, 2)
+
+    async def test_shared_failure_reaches_every_caller(self):
+        rec = _Recorder(lambda _: httpx.Response(500))
+        async with _async_client(rec) as client:
+            results = await asyncio.gather(
+                client.get_audit_record("a1"),
+                client.get_audit_record("a1"),
+                return_exceptions=True,
+            )
+        self.assertEqual(len(rec.requests), 1)
+        self.assertTrue(all(isinstance(r, HttpError) for r in results))
+
+
+class TestSseRequests(unittest.TestCase):
+    def test_stream_has_no_read_timeout(self):
+        body = b'event: x\ndata: {"n": 1}\n\n'
+        rec = _Recorder(lambda _: httpx.Response(200, content=body))
+        with _sync_client(rec) as client:
+            events = list(client.stream(namespace="ns"))
+            client.health()
+        self.assertEqual(events[0].data, {"n": 1})
+        stream_timeout, health_timeout = (r.extensions["timeout"] for r in rec.requests)
+        self.assertIsNone(stream_timeout["read"])
+        self.assertIsNotNone(health_timeout["read"])
+        self.assertEqual(stream_timeout["connect"], health_timeout["connect"])
+
+    def test_stream_headers(self):
+        rec = _Recorder(lambda _: httpx.Response(200, content=b""))
+        with _sync_client(rec) as client:
+            client.api_key = "k1"
+            list(client.stream(last_event_id="42"))
+            list(client.subscribe("chain", "c1"))
+        for request in rec.requests:
+            self.assertEqual(request.headers["accept"], "text/event-stream")
+            self.assertEqual(request.headers["authorization"], "Bearer k1")
+            self.assertNotIn("content-type", request.headers)
+        self.assertEqual(rec.requests[0].headers["last-event-id"], "42")
+        self.assertNotIn("last-event-id", rec.requests[1].headers)
+
+
+class TestAsyncSseRequests(unittest.IsolatedAsyncioTestCase):
+    async def test_stream_headers(self):
+        rec = _Recorder(lambda _: httpx.Response(200, content=b""))
+        async with _async_client(rec) as client:
+            async for _ in client.stream(last_event_id="7"):
+                pass
+        request = rec.requests[0]
+        self.assertEqual(request.headers["last-event-id"], "7")
+        self.assertNotIn("content-type", request.headers)
+        self.assertIsNone(request.extensions["timeout"]["read"])
+
+    async def test_events_parsed_from_chunks(self):
+        body = b'event: chain_step\ndata: {"n": 1}\n\ndata: 2\n\n'
+        rec = _Recorder(lambda _: httpx.Response(200, content=body))
+        async with _async_client(rec) as client:
+            events = [e async for e in client.subscribe("chain", "c1", chunk_size=5)]
+        self.assertEqual([(e.event, e.data) for e in events], [("chain_step", {"n": 1}), (None, 2)])
+
+    async def test_stream_batches_group_events_per_read(self):
+        body = b"data: 1\n\ndata: 2\n\ndata: 3\n\n"
+        rec = _Recorder(lambda _: httpx.Response(200, content=body))
+        async with _async_client(rec) as client:
+            batches = [b async for b in client.stream_batches(chunk_size=18)]
+        self.assertEqual([[e.data for e in b] for b in batches], [[1, 2], [3]])
+
+
+class TestSseErrors(unittest.TestCase):
+    def test_small_error_body_in_message(self):
+        rec = _Recorder(lambda _: httpx.Response(403, content=b"tenant not allowed"))
+        with _sync_client(rec) as client:
+            with self.assertRaises(HttpError) as ctx:
+                list(client.stream())
+        self.assertEqual(ctx.exception.status, 403)
+        self.assertIn("tenant not allowed", str(ctx.exception))
+
+
+class TestDispatchBatch(unittest.TestCase):
+    def test_single_request_for_whole_batch(self):
+        rec = _Recorder(
+            lambda _: httpx.Response(
+                200,
+                json=[_EXECUTED, {"error": {"code": "BAD", "message": "nope"}}],
+            )
+        )
+        with _sync_client(rec) as client:
+            results = client.dispatch_batch([_action(tenant="t1"), _action(tenant="t2")])
+        self.assertEqual(len(rec.requests), 1)
+        self.assertEqual(rec.requests[0].url.path, "/v1/dispatch/batch")
+        body = json.loads(rec.requests[0].content)
+        self.assertEqual([a["tenant"] for a in body], ["t1", "t2"])
+        self.assertEqual([r.success for r in results], [True, False])
+
+    def test_empty_batch_skips_round_trip(self):
+        rec = _Recorder(lambda _: httpx.Response(500))
+        with _sync_client(rec) as client:
+            self.assertEqual(client.dispatch_batch([]), [])
+        self.assertEqual(rec.requests, [])
+
+
+def _batch_fail_tenant(bad: str) -> Callable[[httpx.Request], httpx.Response]:
+    """Batch handler rejecting any batch that carries tenant ``bad``."""
+
+    def respond(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        if any(a["tenant"] == bad for a in body):
+            return httpx.Response(400, json={"code": "BAD", "message": "nope"})
+        return httpx.Response(200, json=[_EXECUTED] * len(body))
+
+    return respond
+
+
+class TestDispatchBatchMany(unittest.TestCase):
+    def test_slices_keep_order_and_expand_failures(self):
+        rec = _Recorder(_batch_fail_tenant("t3"))
+        actions = [_action(tenant=f"t{i}") for i in range(5)]
+        with _sync_client(rec) as client:
+            results = client.dispatch_batch_many(actions, batch_size=2)
+        self.assertEqual(
+            sorted(len(json.loads(r.content)) for r in rec.requests), [1, 2, 2]
+        )
+        self.assertEqual([r.success for r in results], [True, True, False, False, True])
+        self.assertEqual(results[2].error.code, "BAD")
+
+    def test_batch_size_validated(self):
+        with _sync_client(_Recorder(lambda _: httpx.Response(500))) as client:
+            with self.assertRaises(ValueError):
+                client.dispatch_batch_many([_action()], batch_size=0)
+
+
+class TestAsyncDispatchBatchMany(unittest.IsolatedAsyncioTestCase):
+    async def test_slices_joined_in_order(self):
+        rec = _Recorder(_batch_fail_tenant("t0"))
+        actions = [_action(tenant=f"t{i}") for i in range(3)]
+        async with _async_client(rec) as client:
+            results = await client.dispatch_batch_many(actions, batch_size=2)
+        self.assertEqual(len(rec.requests), 2)
+        self.assertEqual([r.success for r in results], [False, False, True])
+
+
+class TestDispatchMany(unittest.TestCase):
+    def test_one_request_per_action_in_order(self):
+        rec = _Recorder(_fail_tenant("t2"))
+        with _sync_client(rec) as client:
+            results = client.dispatch_many(
+                [_action(tenant="t1"), _action(tenant="t2"), _action(tenant="t3")]
+            )
+        self.assertEqual(len(rec.requests), 3)
+        self.assertTrue(all(r.url.path == "/v1/dispatch" for r in rec.requests))
+        self.assertEqual([r.success for r in results], [True, False, True])
+        self.assertEqual(results[0].outcome.outcome_type, "executed")
+        self.assertEqual(results[1].error.code, "BAD")
+        self.assertFalse(results[1].error.retryable)
+
+    def test_dry_run_forwarded(self):
+        rec = _Recorder(lambda _: httpx.Response(200, json=_EXECUTED))
+        with _sync_client(rec) as client:
+            client.dispatch_many([_action()], dry_run=True)
+        self.assertEqual(rec.requests[0].url.params.get("dry_run"), "true")
+
+    def test_empty_input_sends_nothing(self):
+        rec = _Recorder(lambda _: httpx.Response(500))
+        with _sync_client(rec) as client:
+            self.assertEqual(client.dispatch_many([]), [])
+        self.assertEqual(rec.requests, [])
+
+    def test_max_concurrency_below_one_rejected(self):
+        rec = _Recorder(lambda _: httpx.Response(200, json=_EXECUTED))
+        with _sync_client(rec) as client:
+            for call in (
+                lambda: client.dispatch_many([_action()], max_concurrency=0),
+                lambda: client.pipeline([client.health], max_concurrency=0),
+            ):
+                with self.assertRaises(ValueError):
+                    call()
+        self.assertEqual(rec.requests, [])
+
+
+class TestAsyncDispatchMany(unittest.IsolatedAsyncioTestCase):
+    async def test_failures_become_failed_results(self):
+        rec = _Recorder(_fail_tenant("t1"))
+        async with _async_client(rec) as client:
+            results = await client.dispatch_many([_action(tenant="t1"), _action(tenant="t2")])
+        self.assertEqual(len(rec.requests), 2)
+        self.assertEqual([r.success for r in results], [False, True])
+        self.assertEqual(results[0].error.code, "BAD")
+
+    async def test_connection_error_is_retryable(self):
+        def respond(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("refused", request=request)
+
+        async with _async_client(_Recorder(respond)) as client:
+            results = await client.dispatch_many([_action()])
+        self.assertFalse(results[0].success)
+        self.assertEqual(results[0].error.code, "CONNECTION_ERROR")
+        self.assertTrue(results[0].error.retryable)
+
+    async def test_concurrency_is_bounded(self):
+        in_flight = peak = 0
+
+        async def respond(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.001)
+            in_flight -= 1
+            return httpx.Response(200, json=_EXECUTED)
+
+        async with _async_client(_Recorder(respond)) as client:
+            results = await client.dispatch_many([_action()] * 10, max_concurrency=3)
+        self.assertTrue(all(r.success for r in results))
+        self.assertEqual(peak, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
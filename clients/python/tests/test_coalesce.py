@@ -0,0 +1,184 @@
+"""Dispatch coalescers — many ``dispatch`` calls, few batch requests.
+
+The coalescers are driven against a real client whose transport is an
+``httpx.MockTransport`` that answers ``/v1/dispatch/batch`` with one
+result per action, so the batching, fan-out and error mapping all run
+end-to-end.
+"""
+
+import asyncio
+import json
+import threading
+import unittest
+
+import httpx
+
+from acteon_client import (
+    ActeonClient,
+    Action,
+    ApiError,
+    AsyncActeonClient,
+    AsyncDispatchCoalescer,
+    DispatchCoalescer,
+)
+
+_EXECUTED = {"Executed": {"status": "success", "body": {}, "headers": {}}}
+
+
+def _action(tenant: str) -> Action:
+    return Action(
+        namespace="ns", tenant=tenant, provider="email", action_type="send", payload={}
+    )
+
+
+class _BatchServer:
+    """Answers batch dispatches, failing actions whose tenant is ``bad``."""
+
+    def __init__(self, bad: str = "bad", status: int = 200):
+        self.bad = bad
+        self.status = status
+        self.batch_sizes: list[int] = []
+        self._lock = threading.Lock()
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/v1/dispatch/batch"
+        actions = json.loads(request.content)
+        with self._lock:
+            self.batch_sizes.append(len(actions))
+        if self.status != 200:
+            return httpx.Response(self.status, json={"code": "DOWN", "message": "down"})
+        results = [
+            {"error": {"code": "BAD", "message": "nope", "retryable": False}}
+            if a["tenant"] == self.bad
+            else _EXECUTED
+            for a in actions
+        ]
+        return httpx.Response(200, json=results)
+
+
+def _sync_client(server: _BatchServer) -> ActeonClient:
+    client = ActeonClient("http://acteon.test")
+    client._client = httpx.Client(
+        base_url=client.base_url,
+        headers=client._client.headers,
+        transport=httpx.MockTransport(server),
+    )
+    return client
+
+
+def _async_client(server: _BatchServer) -> AsyncActeonClient:
+    client = AsyncActeonClient("http://acteon.test")
+    client._client = httpx.AsyncClient(
+        base_url=client.base_url,
+        headers=client._client.headers,
+        transport=httpx.MockTransport(server),
+    )
+    return client
+
+
+class TestDispatchCoalescer(unittest.TestCase):
+    def test_full_batch_flushes_as_one_request(self):
+        server = _BatchServer()
+        with _sync_client(server) as client:
+            with DispatchCoalescer(client, max_batch=3, max_wait_ms=5_000) as co:
+                futures = [co.submit(_action(t)) for t in ("t1", "bad", "t3")]
+                self.assertEqual(futures[0].result(5).outcome_type, "executed")
+                with self.assertRaises(ApiError) as ctx:
+                    futures[1].result(5)
+                self.assertEqual(ctx.exception.code, "BAD")
+                self.assertEqual(futures[2].result(5).outcome_type, "executed")
+        self.assertEqual(server.batch_sizes, [3])
+
+    def test_close_flushes_partial_batch(self):
+        server = _BatchServer()
+        with _sync_client(server) as client:
+            co = DispatchCoalescer(client, max_batch=100, max_wait_ms=60_000)
+            future = co.submit(_action("t1"))
+            co.close()
+            self.assertEqual(future.result(0).outcome_type, "executed")
+            with self.assertRaises(RuntimeError):
+                co.submit(_action("t1"))
+        self.assertEqual(server.batch_sizes, [1])
+
+    def test_batch_level_error_reaches_every_caller(self):
+        server = _BatchServer(status=503)
+        with _sync_client(server) as client:
+            with DispatchCoalescer(client, max_batch=2, max_wait_ms=5_000) as co:
+                futures = [co.submit(_action("t1")), co.submit(_action("t2"))]
+                for future in futures:
+                    with self.assertRaises(ApiError):
+                        future.result(5)
+
+    def test_base_exception_reaches_callers_and_flusher_survives(self):
+        class Abort(BaseException):
+            pass
+
+        def abort(actions, **kwargs):
+            raise Abort()
+
+        server = _BatchServer()
+        with _sync_client(server) as client:
+            with DispatchCoalescer(client, max_batch=1, max_wait_ms=5_000) as co:
+                real = client.dispatch_batch
+                client.dispatch_batch = abort
+                with self.assertRaises(Abort):
+                    co.submit(_action("t1")).result(5)
+                client.dispatch_batch = real
+                self.assertEqual(co.submit(_action("t1")).result(5).outcome_type, "executed")
+        self.assertEqual(server.batch_sizes, [1])
+
+
+class TestAsyncDispatchCoalescer(unittest.IsolatedAsyncioTestCase):
+    async def test_concurrent_dispatches_share_a_batch(self):
+        server = _BatchServer()
+        async with _async_client(server) as client:
+            async with AsyncDispatchCoalescer(client, max_wait_ms=20) as co:
+                results = await asyncio.gather(
+                    *(co.dispatch(_action(t)) for t in ("t1", "bad", "t3")),
+                    return_exceptions=True,
+                )
+        self.assertEqual(server.batch_sizes, [3])
+        self.assertEqual(results[0].outcome_type, "executed")
+        self.assertIsInstance(results[1], ApiError)
+        self.assertEqual(results[2].outcome_type, "executed")
+
+    async def test_max_batch_splits(self):
+        server = _BatchServer()
+        async with _async_client(server) as client:
+            async with AsyncDispatchCoalescer(client, max_batch=2, max_wait_ms=20) as co:
+                await asyncio.gather(*(co.dispatch(_action(f"t{i}")) for i in range(5)))
+        self.assertEqual(sorted(server.batch_sizes), [1, 2, 2])
+
+    async def test_dispatch_after_aclose_raises(self):
+        server = _BatchServer()
+        async with _async_client(server) as client:
+            co = AsyncDispatchCoalescer(client, max_wait_ms=20)
+            await co.aclose()
+            with self.assertRaises(RuntimeError):
+                await co.dispatch(_action("t1"))
+        self.assertEqual(server.batch_sizes, [])
+
+    async def test_cancelled_send_cancels_waiters(self):
+        received = asyncio.Event()
+
+        async def stall(request: httpx.Request) -> httpx.Response:
+            received.set()
+            await asyncio.sleep(60)
+            return httpx.Response(200, json=[])
+
+        async with AsyncActeonClient("http://acteon.test") as client:
+            client._client = httpx.AsyncClient(
+                base_url=client.base_url, transport=httpx.MockTransport(stall)
+            )
+            co = AsyncDispatchCoalescer(client, max_batch=1)
+            waiter = asyncio.ensure_future(co.dispatch(_action("t1")))
+            await asyncio.wait_for(received.wait(), 5)
+            for task in list(co._inflight):
+                task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await asyncio.wait_for(waiter, 5)
+            await client._client.aclose()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+"""The ``_json`` codec must produce the same wire bytes on either backend."""
+
+import dataclasses
+import datetime
+import importlib
+import sys
+import unittest
+import uuid
+from unittest import mock
+
+from acteon_client import _json
+
+_DOC = {"to": "José <j@b.c>", "n": 3, "ok": True, "tags": ["a", "b"], "x": None}
+_WIRE = '{"to":"José <j@b.c>","n":3,"ok":true,"tags":["a","b"],"x":null}'.encode()
+
+
+def _stdlib_codec():
+    """Re-import ``_json`` with ``orjson`` hidden to get the fallback."""
+    with mock.patch.dict(sys.modules, {"orjson": None}):
+        sys.modules.pop("acteon_client._json")
+        try:
+            return importlib.import_module("acteon_client._json")
+        finally:
+            sys.modules["acteon_client._json"] = _json
+
+
+class TestJsonCodec(unittest.TestCase):
+    def test_active_backend_is_compact_utf8(self):
+        self.assertEqual(_json.dumps(_DOC), _WIRE)
+        self.assertEqual(_json.loads(_WIRE), _DOC)
+
+    def test_stdlib_fallback_matches(self):
+        codec = _stdlib_codec()
+        self.assertEqual(codec.BACKEND, "json")
+        self.assertEqual(codec.dumps(_DOC), _WIRE)
+        self.assertEqual(codec.loads(_WIRE), _DOC)
+        self.assertEqual(codec.loads(memoryview(_WIRE)), _DOC)
+
+    def test_nan_rejected(self):
+        for codec in (_json, _stdlib_codec()):
+            for value in (float("nan"), float("inf")):
+                with self.subTest(backend=codec.BACKEND, value=value):
+                    with self.assertRaises(ValueError):
+                        codec.dumps({"v": [1.0, value], "x": None})
+
+    def test_same_inputs_rejected(self):
+        @dataclasses.dataclass
+        class Point:
+            x: int
+
+        for codec in (_json, _stdlib_codec()):
+            for value in (datetime.datetime(2024, 1, 1), datetime.date(2024, 1, 1), Point(1)):
+                with self.subTest(backend=codec.BACKEND, value=value):
+                    with self.assertRaises(TypeError):
+                        codec.dumps({"v": value})
+
+    def test_wide_ints_encoded(self):
+        for codec in (_json, _stdlib_codec()):
+            with self.subTest(backend=codec.BACKEND):
+                self.assertEqual(codec.dumps({"n": 2**70}), b'{"n":1180591620717411303424}')
+
+    @unittest.skipUnless(_json.BACKEND == "orjson", "orjson not installed")
+    def test_orjson_still_encodes_uuid(self):
+        value = uuid.UUID(int=1)
+        self.assertEqual(_json.dumps(value), f'"{value}"'.encode())
+        with self.assertRaises(TypeError):
+            _stdlib_codec().dumps(value)
+
+
+if __name__ == "__main__":
+    unittest.main()
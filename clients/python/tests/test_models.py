@@ -0,0 +1,237 @@
+"""Core dispatch/audit models — allocation shape and parsing."""
+
+import unittest
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from acteon_client.errors import ActeonError
+from acteon_client.models import (
+    Action,
+    ActionOutcome,
+    ApprovalStatus,
+    AuditPage,
+    AuditRecord,
+    BatchResult,
+    ChainDetailResponse,
+    ChainStepStatus,
+    ChainSummary,
+    DlqStatsResponse,
+    ErrorResponse,
+    EvaluateRulesRequest,
+    EventState,
+    ListChainsResponse,
+    ListQuotasResponse,
+    ProviderResponse,
+    QuotaPolicy,
+    QuotaUsage,
+    RecurringDetail,
+    RecurringSummary,
+    RuleInfo,
+    SseEvent,
+    _parse_sse_bytes,
+    _parse_sse_stream,
+)
+
+
+class TestSlots(unittest.TestCase):
+    def test_hot_models_have_no_instance_dict(self):
+        # These are built in bulk (batch dispatch, audit pages, list
+        # responses), so they are declared with ``slots=True`` to avoid a
+        # per-instance dict.
+        for cls in (
+            Action,
+            ActionOutcome,
+            ApprovalStatus,
+            AuditPage,
+            AuditRecord,
+            BatchResult,
+            ChainDetailResponse,
+            ChainStepStatus,
+            ChainSummary,
+            DlqStatsResponse,
+            ErrorResponse,
+            EventState,
+            ListChainsResponse,
+            ListQuotasResponse,
+            ProviderResponse,
+            QuotaPolicy,
+            QuotaUsage,
+            RecurringDetail,
+            RecurringSummary,
+            RuleInfo,
+            SseEvent,
+        ):
+            with self.subTest(cls=cls.__name__):
+                self.assertIn("__slots__", cls.__dict__)
+                self.assertNotIn("__dict__", dir(cls))
+
+    def test_action_stays_mutable(self):
+        action = Action(namespace="ns", tenant="t", provider="p", action_type="x", payload={})
+        action.dedup_key = "k"
+        self.assertEqual(action.to_dict()["dedup_key"], "k")
+
+
+class TestActionBatch(unittest.TestCase):
+    def test_one_action_per_payload_with_shared_fields(self):
+        actions = Action.batch(
+            ({"i": i} for i in range(3)),
+            namespace="ns",
+            tenant="t",
+            provider="email",
+            action_type="send",
+            dedup_key="k",
+        )
+        self.assertEqual([a.payload for a in actions], [{"i": 0}, {"i": 1}, {"i": 2}])
+        self.assertTrue(all(a.tenant == "t" and a.dedup_key == "k" for a in actions))
+
+    def test_ids_are_unique_canonical_uuid4(self):
+        actions = Action.batch(
+            [{}] * 50, namespace="ns", tenant="t", provider="p", action_type="x"
+        )
+        ids = [a.id for a in actions]
+        self.assertEqual(len(set(ids)), 50)
+        for action_id in ids:
+            parsed = uuid.UUID(action_id)
+            self.assertEqual(str(parsed), action_id)
+            self.assertEqual(parsed.version, 4)
+            self.assertEqual(parsed.variant, uuid.RFC_4122)
+
+    def test_shared_created_at(self):
+        actions = Action.batch(
+            [{}, {}], namespace="ns", tenant="t", provider="p", action_type="x"
+        )
+        self.assertIs(actions[0].created_at, actions[1].created_at)
+        stamp = datetime(2026, 1, 1)
+        actions = Action.batch(
+            [{}], namespace="ns", tenant="t", provider="p", action_type="x", created_at=stamp
+        )
+        self.assertEqual(actions[0].created_at, stamp)
+
+    def test_empty(self):
+        self.assertEqual(
+            Action.batch([], namespace="ns", tenant="t", provider="p", action_type="x"), []
+        )
+
+    def test_to_dict_created_at(self):
+        stamp = datetime(2026, 1, 1, 12, 30)
+        actions = Action.batch(
+            [{}, {}], namespace="ns", tenant="t", provider="p", action_type="x", created_at=stamp
+        )
+        self.assertEqual(
+            [a.to_dict()["created_at"] for a in actions], ["2026-01-01T12:30:00Z"] * 2
+        )
+        # Equal instants in different zones must not share a cached string.
+        utc = datetime(2026, 1, 1, 12, tzinfo=timezone.utc)
+        plus_one = datetime(2026, 1, 1, 13, tzinfo=timezone(timedelta(hours=1)))
+        self.assertEqual(
+            Action("ns", "t", "p", "x", {}, created_at=utc).to_dict()["created_at"],
+            "2026-01-01T12:00:00+00:00Z",
+        )
+        self.assertEqual(
+            Action("ns", "t", "p", "x", {}, created_at=plus_one).to_dict()["created_at"],
+            "2026-01-01T13:00:00+01:00Z",
+        )
+
+
+class TestAuditRecordParsing(unittest.TestCase):
+    def test_categorical_fields_are_interned(self):
+        def body(n: int) -> dict:
+            # Build the strings at runtime so they start out as distinct objects.
+            return {
+                "id": f"r{n}",
+                "action_id": f"a{n}",
+                "namespace": "".join(["n", "s"]),
+                "tenant": "".join(["t", "1"]),
+                "provider": "".join(["em", "ail"]),
+                "action_type": "".join(["se", "nd"]),
+                "verdict": "".join(["al", "low"]),
+                "outcome": "".join(["exec", "uted"]),
+                "matched_rule": None,
+                "duration_ms": 1,
+                "dispatched_at": "2026-01-01T00:00:00Z",
+            }
+
+        first, second = AuditRecord.from_dict(body(1)), AuditRecord.from_dict(body(2))
+        for name in ("namespace", "tenant", "provider", "action_type", "verdict", "outcome"):
+            with self.subTest(field=name):
+                self.assertIs(getattr(first, name), getattr(second, name))
+
+
+class TestEvaluateRulesRequest(unittest.TestCase):
+    def test_unset_options_omitted(self):
+        request = EvaluateRulesRequest("ns", "t", "email", "send", {"a": 1})
+        self.assertEqual(
+            request.to_dict(),
+            {
+                "namespace": "ns",
+                "tenant": "t",
+                "provider": "email",
+                "action_type": "send",
+                "payload": {"a": 1},
+            },
+        )
+
+    def test_set_options_included(self):
+        request = EvaluateRulesRequest(
+            "ns", "t", "email", "send", {}, evaluate_all=True, evaluate_at="2026-01-01T00:00:00Z"
+        )
+        body = request.to_dict()
+        self.assertIs(body["evaluate_all"], True)
+        self.assertEqual(body["evaluate_at"], "2026-01-01T00:00:00Z")
+        self.assertNotIn("include_disabled", body)
+
+
+_SSE_STREAM = (
+    b": keep-alive\n"
+    b"event: action_dispatched\n"
+    b"id: 1\n"
+    b'data: {"n": 1, "s": "\xc3\xa9"}\n'
+    b"\n"
+    b"event: chain_step\r\n"
+    b"data: first line\r\n"
+    b"data: second line\r\n"
+    b"retry: 1000\r\n"
+    b"\r\n"
+    b"\n"
+    b"event: cr_only\r"
+    b'data: {"cr": true}\r'
+    b"\r"
+    b"data: [1, 2]\n"
+    b"\n"
+    b"data: unterminated\n"
+)
+
+
+class TestSseBytes(unittest.TestCase):
+    expected = [
+        SseEvent(event="action_dispatched", id="1", data={"n": 1, "s": "é"}),
+        SseEvent(event="chain_step", data="first line\nsecond line"),
+        SseEvent(event="cr_only", data={"cr": True}),
+        SseEvent(data=[1, 2]),
+    ]
+
+    def test_whole_stream(self):
+        self.assertEqual(list(_parse_sse_bytes([_SSE_STREAM])), self.expected)
+
+    def test_any_chunking(self):
+        for size in (1, 2, 3, 7, 64):
+            with self.subTest(size=size):
+                chunks = [_SSE_STREAM[i:i + size] for i in range(0, len(_SSE_STREAM), size)]
+                self.assertEqual(list(_parse_sse_bytes(chunks)), self.expected)
+
+    def test_matches_line_parser(self):
+        lines = _SSE_STREAM.decode().splitlines()
+        self.assertEqual(list(_parse_sse_stream(iter(lines))), self.expected)
+
+    def test_max_event_size(self):
+        big = b"data: " + b"x" * 100 + b"\n\n"
+        self.assertEqual(len(list(_parse_sse_bytes([big] * 3, max_event_size=200))), 3)
+        with self.assertRaises(ActeonError):
+            list(_parse_sse_bytes([big], max_event_size=50))
+        # An unterminated line counts too, so a runaway stream is cut off.
+        with self.assertRaises(ActeonError):
+            list(_parse_sse_bytes([b"data: "] + [b"x" * 32] * 10, max_event_size=100))
+
+
+if __name__ == "__main__":
+    unittest.main()
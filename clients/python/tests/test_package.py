@@ -0,0 +1,34 @@
+"""Package-level import surface."""
+
+import subprocess
+import sys
+import unittest
+
+import acteon_client
+
+
+class TestLazyImports(unittest.TestCase):
+    def test_models_do_not_load_http_stack(self):
+        code = (
+            "import sys\n"
+            "from acteon_client import Action, AuditQuery\n"
+            "assert 'httpx' not in sys.modules, 'httpx imported eagerly'\n"
+            "assert 'acteon_client.client' not in sys.modules\n"
+            "assert 'asyncio' not in sys.modules, 'asyncio imported eagerly'\n"
+            "from acteon_client import ActeonClient\n"
+            "assert 'httpx' in sys.modules\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_every_exported_name_resolves(self):
+        for name in acteon_client.__all__:
+            with self.subTest(name=name):
+                self.assertIsNotNone(getattr(acteon_client, name))
+
+    def test_unknown_attribute(self):
+        with self.assertRaises(AttributeError):
+            acteon_client.DoesNotExist  # noqa: B018
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -9,6 +9,7 @@ records every ``_request`` call and returns a canned body so the
 mixin's parsing code runs end-to-end.
 """
 
+import json
 import unittest
 from typing import Any, Optional
 
@@ -54,15 +55,16 @@ class _Captured:
 
 class _FakeResponse:
     """Minimal ``httpx.Response`` stand-in covering only the bits the
-    queues mixin uses (``status_code``, ``json()``, ``text``)."""
+    queues mixin uses (``status_code``, ``content``, ``text``)."""
 
     def __init__(self, status_code: int = 200, body: Any = None):
         self.status_code = status_code
         self._body = body if body is not None else {}
         self.text = ""
 
-    def json(self):
-        return self._body
+    @property
+    def content(self) -> bytes:
+        return json.dumps(self._body).encode()
 
 
 class _StubClient(_QueuesClientMixin):
@@ -0,0 +1,182 @@
+"""Retry-After-aware retry transports."""
+
+import os
+import socketserver
+import tempfile
+import threading
+import unittest
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from http.server import BaseHTTPRequestHandler
+from unittest import mock
+
+import httpx
+
+from acteon_client import ActeonClient, AsyncRetryTransport, RetryTransport
+from acteon_client.transport import RETRY_METHODS, _read_sse_error, _retry_after
+
+
+def _responses(*statuses: int, retry_after: str = "0"):
+    """Mock handler returning ``statuses`` in order, recording each request."""
+    calls = []
+    remaining = list(statuses)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        status = remaining.pop(0)
+        headers = {"Retry-After": retry_after} if status in (429, 503) else {}
+        return httpx.Response(status, headers=headers, content=request.content)
+
+    return handler, calls
+
+
+class TestRetryAfter(unittest.TestCase):
+    def test_seconds(self):
+        self.assertEqual(_retry_after("2.5"), 2.5)
+        self.assertEqual(_retry_after("-1"), 0.0)
+
+    def test_http_date(self):
+        when = datetime.now(timezone.utc) + timedelta(seconds=30)
+        self.assertAlmostEqual(_retry_after(format_datetime(when, usegmt=True)), 30, delta=2)
+
+    def test_unusable(self):
+        self.assertIsNone(_retry_after(None))
+        self.assertIsNone(_retry_after("soon"))
+
+
+class TestSseErrorBody(unittest.TestCase):
+    def _open(self, **kwargs) -> httpx.Response:
+        transport = httpx.MockTransport(lambda _: httpx.Response(500, **kwargs))
+        with httpx.Client(transport=transport) as client:
+            return client.send(client.build_request("GET", "http://x/v1/stream"), stream=True)
+
+    def test_small_body_is_read(self):
+        self.assertEqual(_read_sse_error(self._open(content=b"boom")), "boom")
+
+    def test_large_or_unsized_body_is_skipped(self):
+        for response in (
+            self._open(headers={"content-length": "32768"}, content=iter([b"x" * 32768])),
+            self._open(content=iter([b"boom"])),
+        ):
+            with self.subTest(headers=dict(response.headers)):
+                self.assertEqual(_read_sse_error(response), "")
+                self.assertFalse(response.is_stream_consumed)
+
+
+class TestRetryTransport(unittest.TestCase):
+    def test_retries_until_success_with_same_body(self):
+        handler, calls = _responses(429, 503, 200)
+        transport = RetryTransport(
+            httpx.MockTransport(handler),
+            max_retries=3,
+            retry_methods=RETRY_METHODS | {"POST"},
+        )
+        with mock.patch("acteon_client.transport.time.sleep") as sleep:
+            with httpx.Client(transport=transport) as client:
+                response = client.post("http://acteon.test/v1/dispatch", content=b"{}")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, b"{}")
+        self.assertEqual(len(calls), 3)
+        self.assertEqual(sleep.call_count, 2)
+
+    def test_post_not_resent_on_503(self):
+        handler, calls = _responses(503)
+        transport = RetryTransport(httpx.MockTransport(handler), max_retries=3)
+        with mock.patch("acteon_client.transport.time.sleep") as sleep:
+            with httpx.Client(transport=transport) as client:
+                response = client.post("http://acteon.test/v1/dispatch", content=b"{}")
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(len(calls), 1)
+        sleep.assert_not_called()
+
+    def test_post_resent_on_429(self):
+        handler, calls = _responses(429, 200)
+        transport = RetryTransport(httpx.MockTransport(handler), max_retries=3)
+        with mock.patch("acteon_client.transport.time.sleep"):
+            with httpx.Client(transport=transport) as client:
+                response = client.post("http://acteon.test/v1/dispatch", content=b"{}")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(calls), 2)
+
+    def test_gives_up_after_max_retries(self):
+        handler, calls = _responses(503, 503, 503)
+        transport = RetryTransport(httpx.MockTransport(handler), max_retries=2)
+        with mock.patch("acteon_client.transport.time.sleep"):
+            with httpx.Client(transport=transport) as client:
+                response = client.get("http://acteon.test/health")
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(len(calls), 3)
+
+    def test_backoff_without_retry_after_is_capped(self):
+        handler, _ = _responses(429, 429, 429, 200, retry_after="")
+        transport = RetryTransport(
+            httpx.MockTransport(handler), max_retries=3, backoff_factor=1.0, max_backoff=3.0
+        )
+        with mock.patch("acteon_client.transport.time.sleep") as sleep:
+            with httpx.Client(transport=transport) as client:
+                client.get("http://acteon.test/health")
+        self.assertEqual([c.args[0] for c in sleep.call_args_list], [1.0, 2.0, 3.0])
+
+    def test_other_errors_are_not_retried(self):
+        handler, calls = _responses(500)
+        transport = RetryTransport(httpx.MockTransport(handler), max_retries=3)
+        with httpx.Client(transport=transport) as client:
+            self.assertEqual(client.get("http://acteon.test/health").status_code, 500)
+        self.assertEqual(len(calls), 1)
+
+
+class TestAsyncRetryTransport(unittest.IsolatedAsyncioTestCase):
+    async def test_retries_until_success(self):
+        handler, calls = _responses(429, 200)
+        transport = AsyncRetryTransport(httpx.MockTransport(handler), max_retries=1)
+        async with httpx.AsyncClient(transport=transport) as client:
+            response = await client.get("http://acteon.test/health")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(calls), 2)
+
+    async def test_post_not_resent_on_503(self):
+        handler, calls = _responses(503)
+        transport = AsyncRetryTransport(httpx.MockTransport(handler), max_retries=1)
+        async with httpx.AsyncClient(transport=transport) as client:
+            response = await client.post("http://acteon.test/v1/dispatch", content=b"{}")
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(len(calls), 1)
+
+
+class TestClientMaxRetries(unittest.TestCase):
+    def test_opt_in_keeps_pool_settings(self):
+        with ActeonClient("http://acteon.test") as client:
+            self.assertNotIsInstance(client._client._transport, RetryTransport)
+        with ActeonClient("http://acteon.test", max_retries=2, max_connections=8) as client:
+            transport = client._client._transport
+            self.assertIsInstance(transport, RetryTransport)
+            self.assertEqual(transport._max_retries, 2)
+            self.assertEqual(transport._transport._pool._max_connections, 8)
+
+
+class _HealthHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.send_response(200 if self.path == "/health" else 404)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+@unittest.skipUnless(hasattr(socketserver, "UnixStreamServer"), "needs AF_UNIX")
+class TestUnixSocket(unittest.TestCase):
+    def test_requests_go_through_socket(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "acteon.sock")
+            with socketserver.UnixStreamServer(path, _HealthHandler) as server:
+                threading.Thread(target=server.serve_forever, daemon=True).start()
+                try:
+                    with ActeonClient("http://localhost", uds=path) as client:
+                        self.assertTrue(client.health())
+                finally:
+                    server.shutdown()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -12,6 +12,7 @@ enabled; instead these tests pin two contracts:
    give stable checkpoint names across re-runs.
 """
 
+import json
 import unittest
 from typing import Any, Optional
 
@@ -60,15 +61,16 @@ class _Captured:
 
 class _FakeResponse:
     """Minimal ``httpx.Response`` stand-in covering only the bits the
-    workflows mixin uses (``status_code``, ``json()``, ``text``)."""
+    workflows mixin uses (``status_code``, ``content``, ``text``)."""
 
     def __init__(self, status_code: int = 200, body: Any = None):
         self.status_code = status_code
         self._body = body if body is not None else {}
         self.text = ""
 
-    def json(self):
-        return self._body
+    @property
+    def content(self) -> bytes:
+        return json.dumps(self._body).encode()
 
 
 class _StubClient(_WorkflowsClientMixin):
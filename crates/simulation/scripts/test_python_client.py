@@ -2,135 +2,138 @@
 """Test script for the Python Acteon client.
 
 Usage:
+    pip install -e clients/python  # or: export PYTHONPATH=clients/python
     ACTEON_URL=http://localhost:8080 python test_python_client.py
 """
 
+import asyncio
 import os
 import sys
 import uuid
 
-# Add the client to the path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../clients/python"))
-
-from acteon_client import ActeonClient, Action, AuditQuery
-
-
-def main():
+from acteon_client import Action, AsyncActeonClient, AuditPage, AuditQuery
+
+# Each test takes the shared client. The tests are independent of each
+# other and run concurrently; anything that must happen in sequence (like
+# the two dedup dispatches) stays inside one test.
+
+
+async def test_health(client):
+    assert await client.health(), "Health check failed"
+
+
+async def test_dispatch(client):
+    action = Action(
+        namespace="test",
+        tenant="python-client",
+        provider="email",
+        action_type="send_notification",
+        payload={"to": "test@example.com", "subject": "Python test"},
+    )
+    outcome = await client.dispatch(action)
+    assert outcome.outcome_type in [
+        "executed",
+        "deduplicated",
+        "suppressed",
+        "rerouted",
+        "throttled",
+        "failed",
+    ], f"Unexpected outcome: {outcome.outcome_type}"
+
+
+async def test_batch_dispatch(client):
+    actions = Action.batch(
+        ({"seq": i} for i in range(3)),
+        namespace="test",
+        tenant="python-client",
+        provider="email",
+        action_type="batch_test",
+    )
+    results_list = await client.dispatch_batch(actions)
+    assert len(results_list) == 3, f"Expected 3 results, got {len(results_list)}"
+
+
+async def test_list_rules(client):
+    rules = await client.list_rules()
+    assert isinstance(rules, list), "Expected list of rules"
+
+
+async def test_deduplication(client):
+    dedup_key = f"python-dedup-{uuid.uuid4().hex}"
+    action1 = Action(
+        namespace="test",
+        tenant="python-client",
+        provider="email",
+        action_type="dedup_test",
+        payload={"msg": "first"},
+        dedup_key=dedup_key,
+    )
+    action2 = Action(
+        namespace="test",
+        tenant="python-client",
+        provider="email",
+        action_type="dedup_test",
+        payload={"msg": "second"},
+        dedup_key=dedup_key,
+    )
+    outcome1 = await client.dispatch(action1)
+    outcome2 = await client.dispatch(action2)
+    # Second should be deduplicated (if dedup rule is active)
+    # or executed (if no dedup rule)
+    assert outcome1.outcome_type in ["executed", "failed"]
+    # outcome2 could be deduplicated or executed depending on rules
+
+
+async def test_query_audit(client):
+    # May be empty if audit is disabled.
+    query = AuditQuery(tenant="python-client", limit=10)
+    page = await client.query_audit(query)
+    assert isinstance(page, AuditPage), f"Expected AuditPage, got {type(page).__name__}"
+    assert isinstance(page.records, list), "Expected AuditPage with records"
+
+
+TESTS = (
+    ("health()", test_health),
+    ("dispatch()", test_dispatch),
+    ("dispatch_batch()", test_batch_dispatch),
+    ("list_rules()", test_list_rules),
+    ("deduplication", test_deduplication),
+    ("query_audit()", test_query_audit),
+)
+
+
+async def main():
     base_url = os.environ.get("ACTEON_URL", "http://localhost:8080")
     print(f"Python Client Test - connecting to {base_url}")
     print("=" * 60)
 
-    client = ActeonClient(base_url)
-    results = {"passed": 0, "failed": 0}
-
-    def test(name: str, fn):
-        try:
-            fn()
-            print(f"  [PASS] {name}")
-            results["passed"] += 1
-        except Exception as e:
-            print(f"  [FAIL] {name}: {e}")
-            results["failed"] += 1
-
-    # Test: Health check
-    def test_health():
-        assert client.health(), "Health check failed"
-
-    test("health()", test_health)
-
-    # Test: Single dispatch
-    dispatched_id = None
-
-    def test_dispatch():
-        nonlocal dispatched_id
-        action = Action(
-            namespace="test",
-            tenant="python-client",
-            provider="email",
-            action_type="send_notification",
-            payload={"to": "test@example.com", "subject": "Python test"},
-        )
-        dispatched_id = action.id
-        outcome = client.dispatch(action)
-        assert outcome.outcome_type in [
-            "executed",
-            "deduplicated",
-            "suppressed",
-            "rerouted",
-            "throttled",
-            "failed",
-        ], f"Unexpected outcome: {outcome.outcome_type}"
-
-    test("dispatch()", test_dispatch)
-
-    # Test: Batch dispatch
-    def test_batch_dispatch():
-        actions = [
-            Action(
-                namespace="test",
-                tenant="python-client",
-                provider="email",
-                action_type="batch_test",
-                payload={"seq": i},
-            )
-            for i in range(3)
-        ]
-        results_list = client.dispatch_batch(actions)
-        assert len(results_list) == 3, f"Expected 3 results, got {len(results_list)}"
-
-    test("dispatch_batch()", test_batch_dispatch)
-
-    # Test: List rules
-    def test_list_rules():
-        rules = client.list_rules()
-        assert isinstance(rules, list), "Expected list of rules"
-
-    test("list_rules()", test_list_rules)
-
-    # Test: Deduplication
-    def test_deduplication():
-        dedup_key = f"python-dedup-{uuid.uuid4()}"
-        action1 = Action(
-            namespace="test",
-            tenant="python-client",
-            provider="email",
-            action_type="dedup_test",
-            payload={"msg": "first"},
-            dedup_key=dedup_key,
+    # One client for the whole run so every test shares the same
+    # keep-alive pool instead of paying a fresh handshake.
+    async with AsyncActeonClient(base_url) as client:
+        # Pay DNS + connect up front so health() measures the hot path.
+        await client.warmup()
+        outcomes = await asyncio.gather(
+            *(fn(client) for _, fn in TESTS), return_exceptions=True
         )
-        action2 = Action(
-            namespace="test",
-            tenant="python-client",
-            provider="email",
-            action_type="dedup_test",
-            payload={"msg": "second"},
-            dedup_key=dedup_key,
-        )
-        outcome1 = client.dispatch(action1)
-        outcome2 = client.dispatch(action2)
-        # Second should be deduplicated (if dedup rule is active)
-        # or executed (if no dedup rule)
-        assert outcome1.outcome_type in ["executed", "failed"]
-        # outcome2 could be deduplicated or executed depending on rules
-
-    test("deduplication", test_deduplication)
 
-    # Test: Query audit (may be empty if audit disabled)
-    def test_query_audit():
-        query = AuditQuery(tenant="python-client", limit=10)
-        page = client.query_audit(query)
-        assert hasattr(page, "total"), "Expected AuditPage with total"
-        assert hasattr(page, "records"), "Expected AuditPage with records"
-
-    test("query_audit()", test_query_audit)
+    # Report in table order regardless of completion order, as one write.
+    passed = failed = 0
+    lines = []
+    for (name, _), outcome in zip(TESTS, outcomes):
+        if isinstance(outcome, BaseException):
+            lines.append(f"  [FAIL] {name}: {outcome}")
+            failed += 1
+        else:
+            lines.append(f"  [PASS] {name}")
+            passed += 1
 
     # Summary
-    print("=" * 60)
-    total = results["passed"] + results["failed"]
-    print(f"Results: {results['passed']}/{total} passed")
+    lines.append("=" * 60)
+    lines.append(f"Results: {passed}/{passed + failed} passed")
+    sys.stdout.write("\n".join(lines) + "\n")
 
-    return 0 if results["failed"] == 0 else 1
+    return 0 if failed == 0 else 1
 
 
 if __name__ == "__main__":
-    sys.exit(main())
+    sys.exit(asyncio.run(main()))